@@ -0,0 +1,131 @@
+"""
+대량 메타데이터 확인 모듈 (링크 점검/용량 산정용)
+"""
+import json
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from utils import classify_download_error, iter_url_intake
+
+# classify_download_error 결과 -> availability 값 (나머지는 'error')
+AVAILABILITY_BY_ERROR_CLASS = {
+    "private": "private",
+    "auth_required": "needs_auth",
+    "unavailable": "unavailable",
+    "copyright": "unavailable",
+    "geo_restricted": "geo_restricted",
+}
+
+
+class HostDispatcher:
+    """사이트별 동시 요청 수를 지키며 작업을 스레드 풀에 넣는 분배기
+    한도에 걸린 사이트의 URL은 풀에 넣지 않고 사이트별 대기열에 두므로, 풀 스레드가
+    다른 사이트를 처리할 수 있는 동안 한 사이트를 기다리며 놀지 않습니다."""
+
+    def __init__(self, executor, func, workers, per_host_limit):
+        self.executor = executor
+        self.func = func
+        self.workers = workers
+        self.per_host_limit = max(1, per_host_limit)
+        self.running = {}
+        self.buffered = 0
+        self._host_counts = {}
+        self._waiting = {}
+
+    def add(self, host, item):
+        """바로 실행할 수 있으면 풀에 넣고, 아니면 사이트별 대기열에 보관"""
+        if self._can_start(host):
+            self._start(host, item)
+        else:
+            self._waiting.setdefault(host, deque()).append(item)
+            self.buffered += 1
+
+    def finish_some(self):
+        """끝난 작업이 생길 때까지 기다려 결과를 반환하고 빈 자리에 대기 중인 작업을 넣음"""
+        done, _pending = wait(self.running, return_when=FIRST_COMPLETED)
+        results = []
+        for future in done:
+            host = self.running.pop(future)
+            self._host_counts[host] -= 1
+            results.append(future.result())
+        for host in list(self._waiting):
+            waiting = self._waiting[host]
+            while waiting and self._can_start(host):
+                self._start(host, waiting.popleft())
+                self.buffered -= 1
+            if not waiting:
+                del self._waiting[host]
+        return results
+
+    def _can_start(self, host):
+        return len(self.running) < self.workers and self._host_counts.get(host, 0) < self.per_host_limit
+
+    def _start(self, host, item):
+        self._host_counts[host] = self._host_counts.get(host, 0) + 1
+        self.running[self.executor.submit(self.func, item)] = host
+
+
+def classify_unavailable(error_message):
+    """추출 오류 메시지로 availability 값 추정"""
+    return AVAILABILITY_BY_ERROR_CLASS.get(classify_download_error(error_message), "error")
+
+
+def inspect_many(lines, inspect_func, workers=8, per_host_limit=4):
+    """여러 URL의 메타데이터를 스레드 풀로 확인하고 완료 순서대로 레코드 반환
+    inspect_func(url)은 YouTubeDownloader.inspect_formats와 같은 딕셔너리를 반환해야 합니다.
+    잘못된/중복 줄도 사유와 함께 레코드로 반환합니다."""
+    workers = max(1, workers)
+
+    def run(result):
+        record = {
+            'url': result.url,
+            'video_key': result.video_key,
+            'title': None,
+            'duration': None,
+            'availability': None,
+            'available_heights': [],
+            'selected_format_id': None,
+            'estimated_bytes': None,
+            'error': None,
+            'error_class': None,
+        }
+        try:
+            info = inspect_func(result.url)
+        except Exception as e:
+            record['availability'] = classify_unavailable(e)
+            record['error'] = str(e)
+            record['error_class'] = classify_download_error(e)
+            return record
+        for key in record:
+            if key in info:
+                record[key] = info[key]
+        return record
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        dispatcher = HostDispatcher(executor, run, workers, per_host_limit)
+        for result in iter_url_intake(lines):
+            if result.error:
+                yield {
+                    'url': result.url or result.raw,
+                    'video_key': result.video_key,
+                    'availability': 'invalid',
+                    'error': result.error,
+                }
+                continue
+            dispatcher.add(result.site, result)
+            # 수만 개의 URL도 메모리 사용이 늘지 않도록 실행 중 + 대기 중인 수를 제한
+            while len(dispatcher.running) + dispatcher.buffered >= workers * 2:
+                yield from dispatcher.finish_some()
+        while dispatcher.running:
+            yield from dispatcher.finish_some()
+
+
+def write_jsonl(records, stream):
+    """레코드를 한 줄에 하나씩 JSON으로 기록하고 개수 반환"""
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        stream.write('\n')
+        stream.flush()
+        count += 1
+    return count
@@ -0,0 +1,151 @@
+"""
+사이트/프록시별 차단 감지(circuit breaker) 모듈
+요청 제한/봇 확인 같은 오류가 연속으로 나면 해당 사이트 작업의 실행을 일정 시간 멈추고,
+대기 시간이 지나면 작업 하나만 시험 삼아 보낸 뒤 결과에 따라 다시 열거나 더 오래 멈춥니다.
+"""
+import threading
+import time
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# utils.classify_download_error 결과 중 사이트가 요청을 막고 있다는 신호
+# (403 forbidden은 YouTube에서 대개 포맷/서명/클라이언트 문제라 영상 하나의 실패로 보고 세지 않음)
+THROTTLE_ERROR_CLASSES = frozenset(("bot_check", "throttled"))
+
+
+def breaker_key(site, proxy=None):
+    """차단 상태를 따로 관리할 단위 (같은 사이트라도 프록시가 다르면 별도)"""
+    return (site, proxy or "")
+
+
+class CircuitBreaker:
+    """차단 상태 하나 (잠금은 CircuitBreakerRegistry가 관리)"""
+    __slots__ = ("state", "failures", "cooldown", "open_until", "probe_owner")
+
+    def __init__(self, cooldown):
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.open_until = 0.0
+        self.probe_owner = None
+
+
+class CircuitBreakerRegistry:
+    """사이트/프록시별 차단 상태 모음
+    threshold번 연속 차단 오류가 나면 cooldown초 동안 멈추고, 시험 작업이 다시 차단되면
+    대기 시간을 두 배로 늘립니다 (최대 max_cooldown)."""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, threshold=3, cooldown=300, max_cooldown=3600, clock=time.monotonic):
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    @classmethod
+    def shared(cls):
+        """프로세스 전체에서 공유하는 차단 상태"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    def add_listener(self, callback):
+        """상태가 바뀌면 callback(key, state) 호출 (작업 큐가 대기 중인 작업을 다시 확인)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, key, state):
+        for callback in list(self._listeners):
+            callback(key, state)
+
+    def _get(self, key):
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(self.base_cooldown)
+        return breaker
+
+    def state(self, key):
+        with self._lock:
+            breaker = self._breakers.get(key)
+            return breaker.state if breaker is not None else STATE_CLOSED
+
+    def acquire(self, key, owner):
+        """owner(작업)를 지금 실행해도 되는지 확인
+        대기 시간이 끝난 첫 작업은 시험 작업으로 통과시키고, 결과가 나올 때까지 나머지는 막습니다."""
+        if key is None:
+            return True
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None or breaker.state == STATE_CLOSED:
+                return True
+            if breaker.state == STATE_OPEN and self.clock() >= breaker.open_until:
+                breaker.state = STATE_HALF_OPEN
+                breaker.probe_owner = owner
+                return True
+            return False
+
+    def retry_delay(self, key):
+        """멈춘 사이트가 시험 작업을 받을 수 있을 때까지 남은 초, 멈추지 않았으면 None"""
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None or breaker.state != STATE_OPEN:
+                return None
+            return max(0.0, breaker.open_until - self.clock())
+
+    def record_success(self, key):
+        """사이트가 정상 응답함 (멈춘 상태였다면 다시 엶)"""
+        if key is None:
+            return
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None or (breaker.state == STATE_CLOSED and not breaker.failures):
+                return
+            reopened = breaker.state != STATE_CLOSED
+            breaker.state = STATE_CLOSED
+            breaker.failures = 0
+            breaker.cooldown = self.base_cooldown
+            breaker.probe_owner = None
+        if reopened:
+            self._notify(key, STATE_CLOSED)
+
+    def record_failure(self, key):
+        """차단 오류 기록, 이번 기록으로 멈추게 되면 True"""
+        if key is None:
+            return False
+        with self._lock:
+            breaker = self._get(key)
+            if breaker.state == STATE_OPEN:
+                return False
+            if breaker.state == STATE_HALF_OPEN:
+                breaker.cooldown = min(breaker.cooldown * 2, self.max_cooldown)
+            else:
+                breaker.failures += 1
+                if breaker.failures < self.threshold:
+                    return False
+            breaker.state = STATE_OPEN
+            breaker.open_until = self.clock() + breaker.cooldown
+            breaker.probe_owner = None
+        self._notify(key, STATE_OPEN)
+        return True
+
+    def release(self, key, owner):
+        """시험 작업이 결과를 남기지 못하고 끝난 경우 다음 작업이 다시 시험하도록 되돌림"""
+        if key is None:
+            return
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None or breaker.state != STATE_HALF_OPEN or breaker.probe_owner is not owner:
+                return
+            breaker.state = STATE_OPEN
+            breaker.probe_owner = None
+        self._notify(key, STATE_OPEN)
@@ -1,16 +1,49 @@
 """
 YouTube 다운로더 설정 파일
 """
+import atexit
+from collections import OrderedDict
+import copy
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
 import platform
 import re
+import tempfile
+import threading
+import time
+from types import MappingProxyType
 from urllib.parse import urlsplit, urlunsplit
 
+import yt_dlp
+
+from multi_output import parse_output_profiles
+from schedule import DownloadSchedule, parse_schedule
+from utils import parse_sections
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # macOS, Linux
+    msvcrt = None
+
 class Config:
     """설정 관리 클래스"""
     CURRENT_CONFIG_VERSION = 3
+    SAVE_DEBOUNCE_SECONDS = 0.5
+    SNAPSHOT_CACHE_SIZE = 128
+    SYSTEM_PROXY_TTL = 60
+    # shared()가 설정 파일 변경을 확인하는 최소 간격 (초), 매 호출마다 stat하지 않도록
+    RELOAD_CHECK_SECONDS = 2.0
+    _system_proxy_cache = (None, float('-inf'))
+
+    _shared_instance = None
+    _shared_lock = threading.Lock()
 
     def __init__(self):
         # Windows에서는 숨김 파일 대신 일반 파일로 저장
@@ -28,6 +61,27 @@ class Config:
             "auto_paste": True,
             "max_retries": 3,
             "retry_delay": 3,
+            "max_concurrent_downloads": 3,
+            "download_schedule": "",
+            "worker_processes": False,
+            "worker_job_timeout_minutes": 0,
+            "worker_recycle_jobs": 20,
+            "quality_deadline_seconds": 0,
+            "quality_byte_budget": 0,
+            "download_sections": "",
+            "precise_cuts": False,
+            "output_profiles": "",
+            "embed_subtitles": False,
+            "embed_metadata": False,
+            "embed_thumbnail": False,
+            "staging_path": "",
+            "staging_capacity_gb": 20,
+            "disk_preflight": True,
+            "min_free_space_mb": 500,
+            "verify_downloads": True,
+            "keep_partial_on_cancel": False,
+            "record_history": True,
+            "prefetch_metadata": True,
             "show_progress": True,
             "auto_open_folder": False,
             "download_audio_only": False,
@@ -45,15 +99,41 @@ class Config:
             "playlist_download": False,
             "max_playlist_items": 10,
             "proxy_mode": "auto",
-            "proxy_url": ""
+            "proxy_url": "",
+            "proxy_pool": ""
         }
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._dirty = False
+        # 마지막 저장 뒤 이 프로세스가 바꾼 키 (저장할 때 파일의 최신 값 위에 덮어씀)
+        self._dirty_keys = set()
+        self._listeners = []
+        self._file_mtime = None
+        self._next_reload_check = 0.0
+        self._snapshot_cache = OrderedDict()
+        self.revision = 0
         self._config_needs_save = False
         self.config = self.load_config()
         if self._config_needs_save:
+            self._dirty_keys.update(self.config)
             self.save_config()
 
+    @classmethod
+    def shared(cls):
+        """프로세스 전체가 함께 쓰는 설정 인스턴스 반환
+        다른 프로세스가 설정 파일을 바꿨으면 다시 읽은 뒤 반환합니다.
+        파일 확인은 RELOAD_CHECK_SECONDS마다 한 번만 합니다."""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+                atexit.register(cls._shared_instance.flush)
+            instance = cls._shared_instance
+        instance.reload_if_changed(min_interval=cls.RELOAD_CHECK_SECONDS)
+        return instance
+
     def load_config(self):
         """설정 파일 로드"""
+        self._file_mtime = self._read_mtime()
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -96,22 +176,193 @@ class Config:
             return self.default_config.copy()
 
     def save_config(self):
-        """설정 파일 저장"""
+        """설정 파일 저장 (프로세스 간 잠금 후 임시 파일을 원자적으로 교체)
+        잠금을 잡은 채 파일을 다시 읽어 이 프로세스가 바꾼 키만 덮어쓰므로, 두 프로세스가
+        동시에 다른 키를 바꿔도 한쪽 변경이 사라지지 않습니다. 다른 프로세스가 바꾼 값은
+        이 인스턴스에도 반영하고 변경 알림(None)을 보냅니다."""
+        with self._lock:
+            self._cancel_pending_save()
+            try:
+                with self._file_lock():
+                    merged = self._merge_with_file()
+                    self._atomic_write(json.dumps(merged, indent=2, ensure_ascii=False))
+            except (IOError, OSError):
+                return False
+            external = merged != self.config
+            if external:
+                self.config = merged
+                self.revision += 1
+            self._file_mtime = self._read_mtime()
+            self._dirty = False
+            self._dirty_keys.clear()
+        if external:
+            self._notify(None)
+        return True
+
+    def _merge_with_file(self):
+        """파일의 현재 값에 이 프로세스가 바꾼 키를 덮어쓴 설정 (파일을 읽을 수 없으면 현재 값 전체)"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-            return True
-        except (IOError, OSError):
-            return False
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                on_disk = json.load(f)
+        except (OSError, ValueError):
+            on_disk = None
+        if not isinstance(on_disk, dict):
+            return dict(self.config)
+        merged = dict(self.default_config)
+        merged.update(on_disk)
+        for key in self._dirty_keys:
+            if key in self.config:
+                merged[key] = self.config[key]
+        return merged
+
+    def flush(self):
+        """대기 중인 변경 사항을 즉시 저장"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            return self.save_config()
+
+    def reload_if_changed(self, min_interval=0):
+        """다른 프로세스가 설정 파일을 바꿨으면 다시 읽기
+        아직 저장하지 않은 변경 사항이 있으면 현재 값을 유지합니다.
+        min_interval초 안에 이미 확인했으면 파일을 보지 않고 False를 반환합니다."""
+        if min_interval:
+            now = time.monotonic()
+            if now < self._next_reload_check:
+                return False
+            self._next_reload_check = now + min_interval
+        mtime = self._read_mtime()
+        with self._lock:
+            if mtime == self._file_mtime or self._dirty:
+                return False
+            self.config = self.load_config()
+            self.revision += 1
+        self._notify(None)
+        return True
 
     def get(self, key, default=None):
         """설정값 가져오기"""
         return self.config.get(key, default)
 
     def set(self, key, value):
-        """설정값 설정"""
-        self.config[key] = value
-        self.save_config()
+        """설정값 설정 (짧은 시간 동안 모았다가 한 번에 저장)"""
+        self.update({key: value}, save_now=False)
+
+    def update(self, values, save_now=True):
+        """여러 설정값을 한 번에 변경하고 변경 알림 전달"""
+        with self._lock:
+            changed = tuple(
+                key for key, value in values.items()
+                if key not in self.config or self.config[key] != value
+            )
+            if not changed:
+                return
+            for key in changed:
+                self.config[key] = values[key]
+            self._dirty_keys.update(changed)
+            self.revision += 1
+            self._dirty = True
+            if save_now:
+                self.save_config()
+            else:
+                self._schedule_save()
+        self._notify(changed)
+
+    def snapshot(self, overrides=None):
+        """작업 시작 시점의 읽기 전용 설정 사본 반환
+        작업 도중 설정이 바뀌어도 사본의 값은 바뀌지 않습니다.
+        같은 설정 버전과 같은 덮어쓰기 조합이면 같은 사본을 재사용합니다."""
+        frozen_overrides = _freeze(overrides or {})
+        with self._lock:
+            key = (self.revision, frozen_overrides)
+            cached = self._snapshot_cache.get(key)
+            if cached is not None:
+                self._snapshot_cache.move_to_end(key)
+                return cached
+            values = copy.deepcopy(self.config)
+            if overrides:
+                values.update(overrides)
+            snapshot = ConfigSnapshot(values, self.default_config, self.revision)
+            self._snapshot_cache[key] = snapshot
+            while len(self._snapshot_cache) > self.SNAPSHOT_CACHE_SIZE:
+                self._snapshot_cache.popitem(last=False)
+            return snapshot
+
+    def add_listener(self, callback):
+        """설정 변경 알림 등록
+        callback(keys): 바뀐 키 튜플, 파일을 다시 읽은 경우 None
+        알림은 값을 바꾼 스레드(지연 저장 타이머, 작업 스레드 포함)에서 호출되므로
+        Qt 객체는 시그널의 emit을 등록해 GUI 스레드에서 처리해야 합니다."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """설정 변경 알림 해제"""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _notify(self, keys):
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            callback(keys)
+
+    def _schedule_save(self):
+        self._cancel_pending_save()
+        self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _cancel_pending_save(self):
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _read_mtime(self):
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @contextmanager
+    def _file_lock(self):
+        """설정 파일 옆의 .lock 파일로 프로세스 간 쓰기를 직렬화"""
+        lock_path = self.config_file.with_name(self.config_file.name + ".lock")
+        with open(lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _atomic_write(self, data):
+        """같은 폴더의 임시 파일에 쓴 뒤 rename으로 교체"""
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.config_file.parent,
+            prefix=self.config_file.name + ".",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
 
     def get_download_path(self):
         """다운로드 경로 가져오기"""
@@ -120,6 +371,39 @@ class Config:
             self.default_config["download_path"],
         )))
 
+    def get_staging_path(self):
+        """다운로드/후처리를 먼저 수행할 로컬 임시 작업 폴더, 사용하지 않으면 None"""
+        staging_path = str(self.get("staging_path", "") or "").strip()
+        return Path(staging_path).expanduser() if staging_path else None
+
+    def get_staging_capacity(self):
+        """라이브러리로 옮기지 못한 파일이 스테이징 폴더에 쌓일 수 있는 최대 바이트 (0이면 제한 없음)"""
+        return int(float(self.get("staging_capacity_gb", 20) or 0) * 1024 ** 3)
+
+    def is_disk_preflight_enabled(self):
+        """다운로드 전 예상 크기로 디스크 공간을 확인/예약할지 여부"""
+        return bool(self.get("disk_preflight", True))
+
+    def get_min_free_space(self):
+        """예약 후에도 항상 남겨 둘 디스크 공간(바이트)"""
+        return int(float(self.get("min_free_space_mb", 500) or 0) * 1024 ** 2)
+
+    def should_verify_downloads(self):
+        """전송 중 해시 계산과 ffprobe 파일 점검 여부"""
+        return bool(self.get("verify_downloads", True))
+
+    def should_keep_partial_on_cancel(self):
+        """취소한 다운로드의 임시 파일(.part 등)을 남길지 여부"""
+        return bool(self.get("keep_partial_on_cancel", False))
+
+    def should_record_history(self):
+        """다운로드 기록 저장 여부"""
+        return bool(self.get("record_history", True))
+
+    def should_prefetch_metadata(self):
+        """링크를 입력하면 영상 정보를 미리 가져올지 여부"""
+        return bool(self.get("prefetch_metadata", True))
+
     def set_download_path(self, path):
         """다운로드 경로 설정"""
         self.set("download_path", str(path))
@@ -140,6 +424,32 @@ class Config:
         """재시도 지연 시간 가져오기"""
         return self.get("retry_delay", 3)
 
+    def get_max_concurrent_downloads(self):
+        """동시 다운로드 작업 수 가져오기"""
+        return self.get("max_concurrent_downloads", 3)
+
+    def get_download_schedule(self):
+        """시간대별 동시 실행 수/속도 정책, 설정하지 않았으면 None
+        설정 파일을 직접 잘못 고친 경우에도 다운로드는 계속되도록 정책 없이 동작합니다."""
+        try:
+            windows = parse_schedule(self.get("download_schedule", ""))
+        except ValueError:
+            return None
+        return DownloadSchedule(windows) if windows else None
+
+    def use_worker_processes(self):
+        """작업마다 별도 프로세스에서 실행할지 여부"""
+        return bool(self.get("worker_processes", False))
+
+    def get_worker_job_timeout(self):
+        """작업 프로세스 하나의 제한 시간(초), 0이면 None (제한 없음)"""
+        minutes = self.get("worker_job_timeout_minutes", 0) or 0
+        return minutes * 60 if minutes > 0 else None
+
+    def get_worker_recycle_jobs(self):
+        """작업 프로세스를 새로 띄우기 전까지 처리할 작업 수"""
+        return max(1, int(self.get("worker_recycle_jobs", 20) or 1))
+
     def is_audio_only(self):
         """오디오만 다운로드 여부"""
         return self.get("download_audio_only", False)
@@ -148,6 +458,27 @@ class Config:
         """선호 품질 가져오기"""
         return self.get("preferred_quality", "1080p")
 
+    def get_quality_target(self):
+        """화질 자동 조절 한도 (목표 시간(초), 용량(바이트)) 반환, 0이면 None"""
+        deadline = self.get("quality_deadline_seconds", 0) or None
+        byte_budget = self.get("quality_byte_budget", 0) or None
+        return deadline, byte_budget
+
+    def get_output_profiles(self):
+        """한 번 받은 파일에서 추가로 만들 출력 이름 목록 (예: ['m4a', '480p'])"""
+        return parse_output_profiles(self.get("output_profiles", ""))
+
+    def get_postprocess_steps(self):
+        """한 번의 ffmpeg 실행으로 합쳐 처리할 후처리 단계 목록"""
+        steps = []
+        if self.get("subtitle_download", False) and self.get("embed_subtitles", False):
+            steps.append("subtitles")
+        if self.get("embed_metadata", False):
+            steps.append("metadata")
+        if self.get("embed_thumbnail", False):
+            steps.append("thumbnail")
+        return tuple(steps)
+
     def should_show_progress(self):
         """진행률 표시 여부"""
         return self.get("show_progress", True)
@@ -195,12 +526,27 @@ class Config:
         if not self.is_audio_only() and quality_val != "worst":
             opts['format_sort'] = ['res', 'fps', 'hdr:12', 'br']
 
+        # 구간 다운로드 (요청한 구간에 해당하는 부분만 받음)
+        sections = self.get("download_sections", "")
+        if sections:
+            ranges, chapters = parse_sections(sections)
+            opts['download_ranges'] = yt_dlp.utils.download_range_func(chapters, ranges)
+            # True면 구간 경계에서 다시 인코딩해 정확히 자르고, False면 키프레임 단위로 빠르게 자름
+            opts['force_keyframes_at_cuts'] = self.get("precise_cuts", False)
+            opts['outtmpl'] = str(
+                self.get_download_path() / "%(title)s [%(section_start)d-%(section_end)d].%(ext)s"
+            )
+
         # 자막 다운로드 설정
         if self.get("subtitle_download", False):
             opts['writesubtitles'] = True
             opts['writeautomaticsub'] = True
             opts['subtitleslangs'] = [self.get("subtitle_language", "ko")]
 
+        # 표지 이미지 넣기용 썸네일 저장 (후처리 뒤 삭제)
+        if self.get("embed_thumbnail", False):
+            opts['writethumbnail'] = True
+
         # 쿠키 설정 (파일 또는 브라우저)
         if self.get("use_cookies", False):
             if self.get("cookies_source", "file") == "file" and self.get("cookies_file"):
@@ -259,7 +605,31 @@ class Config:
             return None
         if mode == "manual":
             return self._normalize_proxy_url(self.get("proxy_url", ""))
-        return self._detect_system_proxy()
+        if mode == "pool":
+            # 풀의 프록시는 작업을 시작할 때 하나씩 배정
+            return None
+        return self._cached_system_proxy()
+
+    def get_proxy_pool(self):
+        """프록시 풀 모드의 프록시 목록 (쉼표/공백/줄바꿈 구분), 다른 모드면 빈 목록"""
+        if self.get("proxy_mode", "auto") != "pool":
+            return []
+        entries = re.split(r"[\s,]+", str(self.get("proxy_pool", "") or ""))
+        return list(dict.fromkeys(filter(None, map(self._normalize_proxy_url, entries))))
+
+    def get_proxy_key(self):
+        """차단 상태를 나눠 관리할 프록시 이름 (풀이면 풀 전체를 하나로 봄)"""
+        return "pool" if self.get_proxy_pool() else self.get_proxy()
+
+    @classmethod
+    def _cached_system_proxy(cls):
+        """시스템 프록시 감지 결과를 잠시 재사용 (옵션을 만들 때마다 레지스트리/환경 변수를 읽지 않음)"""
+        proxy_url, checked_at = cls._system_proxy_cache
+        now = time.monotonic()
+        if now - checked_at >= cls.SYSTEM_PROXY_TTL:
+            proxy_url = cls._detect_system_proxy()
+            Config._system_proxy_cache = (proxy_url, now)
+        return proxy_url
 
     @staticmethod
     def _detect_system_proxy():
@@ -323,3 +693,55 @@ class Config:
         user = userinfo.split(':', 1)[0] or "***"
         netloc = f"{user}:***@{host}"
         return urlunsplit((parsed.scheme, netloc, parsed.path, parsed.query, parsed.fragment))
+
+
+def _freeze(value):
+    """딕셔너리/리스트를 캐시 키로 쓸 수 있는 튜플로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ConfigSnapshot(Config):
+    """작업 하나가 사용하는 읽기 전용 설정 사본
+    값이 바뀌지 않으므로 yt-dlp 옵션을 한 번만 계산해 재사용합니다."""
+
+    def __init__(self, values, default_config, revision=0):
+        self.config_file = None
+        self.default_config = default_config
+        self.config = MappingProxyType(values)
+        self.revision = revision
+        self._ydl_opts_cache = {}
+        self._ydl_opts_lock = threading.Lock()
+
+    def get_ydl_opts(self, is_youtube=False):
+        with self._ydl_opts_lock:
+            opts = self._ydl_opts_cache.get(is_youtube)
+            if opts is None:
+                opts = super().get_ydl_opts(is_youtube=is_youtube)
+                self._ydl_opts_cache[is_youtube] = opts
+        # 호출한 쪽이 옵션을 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return copy.deepcopy(opts)
+
+    def save_config(self):
+        return False
+
+    def flush(self):
+        return True
+
+    def reload_if_changed(self):
+        return False
+
+    def update(self, values, save_now=True):
+        raise TypeError("설정 스냅샷은 변경할 수 없습니다.")
+
+    def snapshot(self, overrides=None):
+        values = copy.deepcopy(dict(self.config))
+        if overrides:
+            values.update(overrides)
+        return ConfigSnapshot(values, self.default_config, self.revision)
+
+    def add_listener(self, callback):
+        raise TypeError("설정 스냅샷은 변경 알림을 지원하지 않습니다.")
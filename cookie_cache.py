@@ -0,0 +1,202 @@
+"""
+브라우저 쿠키 캐시 모듈
+yt-dlp의 cookiesfrombrowser는 YoutubeDL을 만들 때마다(재시도/작업마다) 브라우저 쿠키 DB를
+복사하고 복호화합니다. 한 번 추출한 쿠키를 지원 사이트 도메인으로 추려 메모리와 보호된
+Netscape 파일에 보관하고, 모든 작업이 공유합니다.
+유효 시간이 지나거나 브라우저 쿠키 DB가 바뀌면 다시 추출합니다.
+"""
+import glob
+import io
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from yt_dlp import cookies as yt_cookies
+from yt_dlp.cookies import YoutubeDLCookieJar
+
+from utils import supported_domains
+
+COOKIE_TTL = 30 * 60
+
+
+def _site_domain_pattern():
+    """지원 사이트 도메인과 그 하위 도메인에 맞는 정규식"""
+    domains = "|".join(site["domain"] for site in supported_domains())
+    return re.compile(r"^(?:.*\.)?(?:" + domains + r")$", re.IGNORECASE)
+
+
+def _latest_mtime(paths):
+    mtimes = []
+    for path in paths:
+        for candidate in (path, path + "-wal", path + "-journal"):
+            try:
+                mtimes.append(os.path.getmtime(candidate))
+            except OSError:
+                pass
+    return max(mtimes, default=None)
+
+
+def cookie_db_mtime(browser):
+    """브라우저 쿠키 DB의 마지막 수정 시각, 찾을 수 없으면 None (유효 시간으로만 갱신)
+    DB 위치는 yt-dlp 내부 함수로 찾으므로 바뀌어 있으면 None을 반환합니다."""
+    try:
+        if browser in yt_cookies.CHROMIUM_BASED_BROWSERS:
+            browser_dir = yt_cookies._get_chromium_based_browser_settings(browser)["browser_dir"]
+            paths = glob.glob(os.path.join(glob.escape(browser_dir), "**", "Cookies"), recursive=True)
+        elif browser == "firefox":
+            paths = list(yt_cookies._firefox_cookie_dbs(yt_cookies._firefox_browser_dirs()))
+        elif browser == "safari":
+            paths = [
+                os.path.expanduser("~/Library/Cookies/Cookies.binarycookies"),
+                os.path.expanduser(
+                    "~/Library/Containers/com.apple.Safari/Data/Library/Cookies/Cookies.binarycookies"
+                ),
+            ]
+        else:
+            return None
+    except (AttributeError, KeyError):
+        return None
+    return _latest_mtime(paths)
+
+
+class CookieEntry:
+    """브라우저 하나의 추출 결과"""
+    __slots__ = ("jar", "text", "loaded_at", "db_mtime")
+
+    def __init__(self, jar, text, loaded_at, db_mtime):
+        self.jar = jar
+        self.text = text
+        self.loaded_at = loaded_at
+        self.db_mtime = db_mtime
+
+
+class BrowserCookieCache:
+    """브라우저별 쿠키 추출 결과 캐시
+    같은 브라우저를 동시에 요청하면 한 작업만 추출하고 나머지는 결과를 기다립니다."""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir, ttl=COOKIE_TTL, extract=None, db_mtime=cookie_db_mtime, clock=time.time):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.extract = extract or yt_cookies.extract_cookies_from_browser
+        self.db_mtime = db_mtime
+        self.clock = clock
+        self._domain_pattern = _site_domain_pattern()
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """설정 파일 옆의 캐시 폴더를 프로세스 전체에서 공유"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(Path.home() / ".youtube_downloader_cookies")
+            return cls._shared_instance
+
+    def cookie_file(self, browser):
+        return self.cache_dir / f"{browser}.txt"
+
+    def _browser_lock(self, browser):
+        with self._lock:
+            return self._locks.setdefault(browser, threading.Lock())
+
+    def _is_fresh(self, loaded_at, cached_db_mtime, db_mtime):
+        if self.clock() - loaded_at >= self.ttl:
+            return False
+        return db_mtime is None or (cached_db_mtime is not None and db_mtime <= cached_db_mtime)
+
+    def get(self, browser):
+        """지원 사이트 쿠키의 Netscape 형식 텍스트, 추출할 수 없으면 None
+        추출에 실패해도 이전 결과가 있으면 그대로 사용합니다."""
+        with self._browser_lock(browser):
+            db_mtime = self.db_mtime(browser)
+            entry = self._entries.get(browser) or self._load_file(browser)
+            if entry is not None and self._is_fresh(entry.loaded_at, entry.db_mtime, db_mtime):
+                self._entries[browser] = entry
+                return entry.text
+            try:
+                jar = self.extract(browser)
+            except Exception:
+                # 브라우저가 DB를 잠그고 있거나 복호화에 실패한 경우
+                return entry.text if entry is not None else None
+            entry = self._store(browser, jar, db_mtime)
+            return entry.text
+
+    def jar(self, browser):
+        """메모리에 보관 중인 쿠키 (필요하면 먼저 추출)"""
+        if self.get(browser) is None:
+            return None
+        return self._entries[browser].jar
+
+    def invalidate(self, browser):
+        """다음 요청에서 다시 추출 (사이트가 쿠키를 거부한 경우)"""
+        with self._browser_lock(browser):
+            self._entries.pop(browser, None)
+            try:
+                self.cookie_file(browser).unlink()
+            except OSError:
+                pass
+
+    def _filtered(self, source):
+        jar = YoutubeDLCookieJar()
+        for cookie in source:
+            if self._domain_pattern.match(cookie.domain.lstrip(".")):
+                jar.set_cookie(cookie)
+        return jar
+
+    def _store(self, browser, source, db_mtime):
+        jar = self._filtered(source)
+        stream = io.StringIO()
+        jar.save(stream)
+        entry = CookieEntry(jar, stream.getvalue(), self.clock(), db_mtime)
+        self._entries[browser] = entry
+        self._write_file(browser, entry.text)
+        return entry
+
+    def _write_file(self, browser, text):
+        """본인만 읽을 수 있는 파일로 저장 (다음 실행에서 추출 없이 재사용)"""
+        path = self.cookie_file(browser)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+    def _load_file(self, browser):
+        """이전 실행에서 저장한 파일 (파일 수정 시각을 추출 시각으로 봄)"""
+        path = self.cookie_file(browser)
+        try:
+            saved_at = path.stat().st_mtime
+            text = path.read_text(encoding="utf-8")
+            jar = YoutubeDLCookieJar()
+            jar.load(io.StringIO(text))
+        except (OSError, ValueError):
+            return None
+        return CookieEntry(jar, text, saved_at, saved_at)
+
+
+def apply_cookie_cache(ydl_opts, cache=None):
+    """cookiesfrombrowser 옵션을 캐시한 쿠키로 바꾼 옵션 반환
+    YoutubeDL이 종료할 때 쿠키를 되쓰므로 공유 파일 대신 YoutubeDL마다 새 스트림을 넘깁니다.
+    캐시를 쓸 수 없으면 원래 옵션을 그대로 반환해 yt-dlp가 직접 추출/오류 보고를 합니다."""
+    spec = ydl_opts.get('cookiesfrombrowser')
+    if not spec or len(spec) != 1:
+        return ydl_opts
+    text = (cache or BrowserCookieCache.shared()).get(spec[0])
+    if text is None:
+        return ydl_opts
+    ydl_opts = dict(ydl_opts)
+    del ydl_opts['cookiesfrombrowser']
+    ydl_opts['cookiefile'] = io.StringIO(text)
+    return ydl_opts
@@ -0,0 +1,428 @@
+"""
+로컬 작업 제출 데몬 모듈 (HTTP/JSON API)
+
+  POST   /jobs             작업 제출 (JobSpec 필드 + priority)
+  GET    /jobs             작업 목록
+  GET    /jobs/<id>        작업 상태
+  DELETE /jobs/<id>        작업 취소 (실행 중이면 다음 진행 콜백에서 멈춤)
+  POST   /jobs/<id>/pause     작업 일시 정지
+  POST   /jobs/<id>/resume    일시 정지한 작업 다시 시작
+  POST   /jobs/<id>/priority  대기 중인 작업의 우선순위 변경 ({"priority": n})
+  GET    /events[?job=id]  진행 이벤트 스트림 (한 줄에 JSON 하나)
+
+인증이 없으므로 루프백 주소에서만 실행하며, 브라우저의 교차 출처 요청을 막기 위해 Host 헤더가
+루프백 주소가 아니거나 POST 본문이 JSON이 아닌 요청은 거절합니다.
+"""
+import ipaddress
+import json
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from download_queue import FINAL_PHASES, PHASE_PAUSED, JobState
+from jobs import JobSpec
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+FINISHED_JOB_RETENTION = 500
+
+
+def is_loopback_host(host):
+    """localhost 또는 루프백 IP 주소인지 확인"""
+    host = (host or "").strip("[]").lower()
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class EventBus:
+    """구독자마다 별도 대기열을 두는 단순 이벤트 전달기"""
+
+    def __init__(self, max_pending=1000):
+        self.max_pending = max_pending
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        subscriber = queue.Queue(self.max_pending)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # 읽지 않는 구독자 때문에 작업이 멈추지 않도록 이벤트를 버림
+                pass
+
+
+class StateWatcher(threading.Thread):
+    """작업 상태 스냅샷을 주기적으로 비교해 바뀐 작업만 이벤트로 발행"""
+
+    def __init__(self, download_queue, event_bus, interval=0.25):
+        super().__init__(daemon=True)
+        self.download_queue = download_queue
+        self.event_bus = event_bus
+        self.interval = interval
+        self._seen = {}
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.poll()
+
+    def poll(self):
+        # 큐에서 빠진 작업은 기억하지 않도록 매번 새로 만듦
+        seen = {}
+        for job in list(self.download_queue.jobs):
+            state = job.state
+            seen[job.job_id] = state
+            if self._seen.get(job.job_id) is not state:
+                self.event_bus.publish({'type': 'state', 'time': time.time(), 'job': job.to_dict()})
+        self._seen = seen
+
+    def stop(self):
+        self._stopped.set()
+
+
+class DownloadDaemon:
+    """작업 큐와 설정/FFmpeg 탐색 결과를 유지하며 로컬 요청을 받는 데몬"""
+
+    def __init__(self, download_queue, event_bus, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        if not is_loopback_host(host):
+            raise ValueError(f"인증이 없는 데몬은 루프백 주소에서만 실행할 수 있습니다: {host}")
+        self.download_queue = download_queue
+        self.event_bus = event_bus
+        self.watcher = StateWatcher(download_queue, event_bus)
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def address(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        self.watcher.start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.watcher.stop()
+            self.server.server_close()
+
+    def shutdown(self):
+        self.server.shutdown()
+
+    def _make_handler(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, status, data):
+                body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def check_request(self, needs_json=False):
+                """다른 출처의 요청 거절 (DNS 리바인딩, 사전 확인 없는 브라우저 POST), 통과하면 True"""
+                host = urlsplit(f"//{self.headers.get('Host', '')}").hostname
+                if not is_loopback_host(host):
+                    self.send_json(403, {'error': '루프백 주소로만 요청할 수 있습니다.'})
+                    return False
+                content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+                if needs_json and content_type != 'application/json':
+                    self.send_json(415, {'error': 'Content-Type은 application/json이어야 합니다.'})
+                    return False
+                return True
+
+            def find_job(self, path):
+                try:
+                    job_id = int(path.rsplit('/', 1)[1])
+                except ValueError:
+                    return None
+                return daemon.download_queue.get_job(job_id)
+
+            def read_json(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                return json.loads(self.rfile.read(length) or b'{}')
+
+            def control_job(self, path):
+                """POST /jobs/<id>/<동작> 처리"""
+                job_path, action = path.rsplit('/', 1)
+                job = self.find_job(job_path)
+                if job is None or action not in ('pause', 'resume', 'priority'):
+                    self.send_json(404, {'error': '작업을 찾을 수 없습니다.'})
+                    return
+                download_queue = daemon.download_queue
+                if action == 'priority':
+                    try:
+                        data = self.read_json()
+                        priority = int(data['priority'])
+                    except (ValueError, TypeError, KeyError) as e:
+                        self.send_json(400, {'error': f"priority 값이 필요합니다: {e}"})
+                        return
+                    changed = download_queue.set_priority(job, priority)
+                else:
+                    changed = getattr(download_queue, action)(job)
+                if changed:
+                    self.send_json(200, job.to_dict())
+                else:
+                    self.send_json(409, {'error': '지금 상태에서는 할 수 없는 요청입니다.', 'job': job.to_dict()})
+
+            def do_GET(self):
+                if not self.check_request():
+                    return
+                parts = urlsplit(self.path)
+                if parts.path == '/jobs':
+                    self.send_json(200, [job.to_dict() for job in list(daemon.download_queue.jobs)])
+                elif parts.path.startswith('/jobs/'):
+                    job = self.find_job(parts.path)
+                    if job is None:
+                        self.send_json(404, {'error': '작업을 찾을 수 없습니다.'})
+                    else:
+                        self.send_json(200, job.to_dict())
+                elif parts.path == '/events':
+                    job_filter = parse_qs(parts.query).get('job', [None])[0]
+                    try:
+                        job_id = int(job_filter) if job_filter else None
+                    except ValueError:
+                        self.send_json(400, {'error': f"job 값은 작업 번호여야 합니다: {job_filter}"})
+                        return
+                    self.stream_events(job_id)
+                else:
+                    self.send_json(404, {'error': '알 수 없는 경로입니다.'})
+
+            def do_POST(self):
+                if not self.check_request(needs_json=True):
+                    return
+                path = urlsplit(self.path).path
+                if path.startswith('/jobs/') and path.count('/') == 3:
+                    self.control_job(path)
+                    return
+                if path != '/jobs':
+                    self.send_json(404, {'error': '알 수 없는 경로입니다.'})
+                    return
+                try:
+                    data = self.read_json()
+                    priority = int(data.pop('priority', 0)) if isinstance(data, dict) else 0
+                    spec = JobSpec.from_dict(data)
+                except (ValueError, TypeError) as e:
+                    self.send_json(400, {'error': str(e)})
+                    return
+                try:
+                    job = daemon.download_queue.submit(spec, priority)
+                except RuntimeError as e:
+                    # 종료 중인 큐에는 더 받지 않음
+                    self.send_json(503, {'error': str(e)})
+                    return
+                self.send_json(201, job.to_dict())
+
+            def do_DELETE(self):
+                if not self.check_request():
+                    return
+                job = self.find_job(urlsplit(self.path).path)
+                if job is None:
+                    self.send_json(404, {'error': '작업을 찾을 수 없습니다.'})
+                elif daemon.download_queue.cancel(job):
+                    self.send_json(200, job.to_dict())
+                else:
+                    self.send_json(409, {'error': '이미 끝난 작업입니다.', 'job': job.to_dict()})
+
+            def stream_events(self, job_id):
+                subscriber = daemon.event_bus.subscribe()
+                # 연결 직후 현재 상태를 먼저 보내 구독 전에 끝난 변화도 알 수 있게 함
+                for job in list(daemon.download_queue.jobs)[-daemon.event_bus.max_pending // 2:]:
+                    subscriber.put_nowait({'type': 'state', 'time': time.time(), 'job': job.to_dict()})
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.end_headers()
+                try:
+                    while True:
+                        try:
+                            event = subscriber.get(timeout=15)
+                        except queue.Empty:
+                            # 연결 유지용 빈 줄
+                            self.wfile.write(b'\n')
+                            self.wfile.flush()
+                            continue
+                        event_job = event.get('job') or {}
+                        if job_id is not None and event_job.get('id', event.get('job_id')) != job_id:
+                            continue
+                        line = json.dumps(event, ensure_ascii=False, separators=(',', ':'))
+                        self.wfile.write(line.encode('utf-8') + b'\n')
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    daemon.event_bus.unsubscribe(subscriber)
+
+        return Handler
+
+
+class DaemonClient:
+    """데몬 HTTP API 클라이언트"""
+
+    def __init__(self, base_url=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", timeout=10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, method, path, data=None):
+        body = json.dumps(data).encode('utf-8') if data is not None else None
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=body,
+            method=method,
+            headers={'Content-Type': 'application/json'},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read() or b'null')
+        except urllib.error.HTTPError as e:
+            try:
+                payload = json.loads(e.read() or b'{}')
+            except ValueError:
+                payload = None
+            # 데몬이 아닌 프록시 등이 보낸 JSON이 아닌 오류 본문이면 상태 문구를 사용
+            detail = payload.get('error', e.reason) if isinstance(payload, dict) else e.reason
+            raise RuntimeError(f"데몬 요청 실패 ({e.code}): {detail}") from e
+
+    def submit(self, url, priority=0, **overrides):
+        return self._request('POST', '/jobs', {'url': url, 'priority': priority, **overrides})
+
+    def list_jobs(self):
+        return self._request('GET', '/jobs')
+
+    def status(self, job_id):
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def cancel(self, job_id):
+        return self._request('DELETE', f'/jobs/{job_id}')
+
+    def pause(self, job_id):
+        return self._request('POST', f'/jobs/{job_id}/pause', {})
+
+    def resume(self, job_id):
+        return self._request('POST', f'/jobs/{job_id}/resume', {})
+
+    def set_priority(self, job_id, priority):
+        return self._request('POST', f'/jobs/{job_id}/priority', {'priority': priority})
+
+    def events(self, job_id=None):
+        """이벤트를 하나씩 반환하는 제너레이터 (연결이 끊길 때까지)"""
+        path = '/events' + (f'?job={job_id}' if job_id is not None else '')
+        with urllib.request.urlopen(self.base_url + path) as response:
+            for line in response:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class RemoteJob:
+    """데몬에 있는 작업의 로컬 사본 (JobTableModel이 DownloadJob처럼 읽음)"""
+    __slots__ = ("job_id", "url", "priority", "state", "result", "error", "control")
+
+    def __init__(self, data):
+        self.job_id = data['id']
+        self.url = data['url']
+        self.apply(data)
+
+    def apply(self, data):
+        self.priority = data.get('priority', 0)
+        self.state = JobState(*(data.get(field) for field in JobState._fields))
+        self.result = data.get('result')
+        self.error = data.get('error')
+        self.control = data.get('control')
+
+    def is_done(self):
+        return self.state.phase in FINAL_PHASES
+
+    def is_paused(self):
+        return self.state.phase == PHASE_PAUSED
+
+
+class RemoteDownloadQueue:
+    """GUI가 데몬에 클라이언트로 붙을 때 쓰는 DownloadQueue 대체 객체"""
+
+    def __init__(self, client):
+        self.client = client
+        self.jobs = []
+        self._jobs_by_id = {}
+        self._lock = threading.Lock()
+        for data in client.list_jobs():
+            self._apply(data)
+        threading.Thread(target=self._follow_events, daemon=True).start()
+
+    def submit(self, spec, priority=0):
+        data = {key: value for key, value in asdict(spec).items() if value is not None}
+        return self._apply(self.client.submit(priority=priority, **data))
+
+    def get_job(self, job_id):
+        return self._jobs_by_id.get(job_id)
+
+    def cancel(self, job):
+        return self._send(self.client.cancel, job.job_id)
+
+    def pause(self, job):
+        return self._send(self.client.pause, job.job_id)
+
+    def resume(self, job):
+        return self._send(self.client.resume, job.job_id)
+
+    def set_priority(self, job, priority):
+        return self._send(self.client.set_priority, job.job_id, priority)
+
+    def _send(self, request, *args):
+        """데몬에 요청하고 응답한 작업 상태 반영, 거절되거나 연결이 끊겼으면 False"""
+        try:
+            self._apply(request(*args))
+        except (RuntimeError, OSError, ValueError):
+            return False
+        return True
+
+    def set_max_workers(self, max_workers):
+        # 동시 실행 수는 데몬 쪽 설정을 따름
+        pass
+
+    def set_schedule(self, schedule):
+        # 시간대 정책도 데몬 쪽 설정을 따름
+        pass
+
+    def _apply(self, data):
+        with self._lock:
+            job = self._jobs_by_id.get(data['id'])
+            if job is None:
+                job = RemoteJob(data)
+                self._jobs_by_id[job.job_id] = job
+                self.jobs.append(job)
+            else:
+                job.apply(data)
+            return job
+
+    def _follow_events(self):
+        while True:
+            try:
+                for event in self.client.events():
+                    if event.get('type') == 'state':
+                        self._apply(event['job'])
+            except (OSError, ValueError):
+                time.sleep(2)
@@ -0,0 +1,121 @@
+"""
+디스크 공간 사전 확인 및 예약 모듈
+선택한 포맷의 예상 크기와 후처리 여유분으로 전송 전에 남은 공간을 확인하고,
+동시에 실행 중인 작업들이 같은 공간을 중복으로 계산하지 않도록 예약 장부를 유지합니다.
+"""
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+class InsufficientSpaceError(OSError):
+    """예약할 수 있는 디스크 공간이 부족함"""
+
+
+def required_bytes(selection, postprocess_steps=(), output_profiles=()):
+    """선택 결과(select_for_opts)로 작업 하나에 필요한 최대 바이트 추정, 알 수 없으면 None
+    병합/변환/후처리는 원본과 결과 파일이 동시에 존재하므로 원본 크기만큼 여유를 더합니다."""
+    if not selection or selection.get('estimated_bytes') is None:
+        return None
+    estimated = selection['estimated_bytes']
+    copies = 1
+    if selection.get('needs_merge') or selection.get('needs_remux') or postprocess_steps:
+        copies += 1
+    # 추가 출력은 원본보다 크지 않다고 보고 하나당 원본 크기만큼 계산
+    copies += len(output_profiles)
+    return estimated * copies
+
+
+def _existing_parent(path):
+    path = Path(path)
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return candidate
+    return path
+
+
+class Reservation:
+    """예약 하나 (consumed는 이미 디스크에 쓴 바이트로, 남은 예약에서 제외)"""
+    __slots__ = ("path", "device", "nbytes", "consumed")
+
+    def __init__(self, path, device, nbytes):
+        self.path = path
+        self.device = device
+        self.nbytes = nbytes
+        self.consumed = 0
+
+    @property
+    def remaining(self):
+        return max(0, self.nbytes - self.consumed)
+
+
+class DiskSpaceLedger:
+    """파일 시스템별 예약 장부
+    사용 가능 공간 = 실제 남은 공간 - 다른 작업이 아직 쓰지 않은 예약분 - 최소 여유 공간"""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, min_free_bytes=0, disk_usage=shutil.disk_usage):
+        self.min_free_bytes = min_free_bytes
+        self._disk_usage = disk_usage
+        self._reservations = set()
+        self._cond = threading.Condition()
+
+    @classmethod
+    def shared(cls, min_free_bytes=0):
+        """프로세스 전체에서 공유하는 예약 장부"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(min_free_bytes)
+            else:
+                cls._shared_instance.min_free_bytes = min_free_bytes
+            return cls._shared_instance
+
+    def _device(self, path):
+        return os.stat(_existing_parent(path)).st_dev
+
+    def _available(self, path, device):
+        free = self._disk_usage(_existing_parent(path)).free
+        reserved = sum(r.remaining for r in self._reservations if r.device == device)
+        return free - reserved - self.min_free_bytes
+
+    def available(self, path):
+        """다른 작업의 예약을 뺀 사용 가능 바이트"""
+        with self._cond:
+            return self._available(path, self._device(path))
+
+    def try_reserve(self, path, nbytes):
+        """공간이 있으면 예약해 반환, 없으면 None"""
+        device = self._device(path)
+        with self._cond:
+            if self._available(path, device) < nbytes:
+                return None
+            reservation = Reservation(Path(path), device, nbytes)
+            self._reservations.add(reservation)
+            return reservation
+
+    def reserve(self, path, nbytes, timeout=None):
+        """공간이 날 때까지 기다려 예약 (같은 파일 시스템에 다른 예약이 없으면 기다리지 않음)
+        예약하지 못하면 None"""
+        device = self._device(path)
+        with self._cond:
+            def ready():
+                return (
+                    self._available(path, device) >= nbytes
+                    or not any(r.device == device for r in self._reservations)
+                )
+            self._cond.wait_for(ready, timeout)
+            if self._available(path, device) < nbytes:
+                return None
+            reservation = Reservation(Path(path), device, nbytes)
+            self._reservations.add(reservation)
+            return reservation
+
+    def release(self, reservation):
+        """예약 해제 후 기다리는 작업을 깨움"""
+        if reservation is None:
+            return
+        with self._cond:
+            self._reservations.discard(reservation)
+            self._cond.notify_all()
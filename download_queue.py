@@ -0,0 +1,437 @@
+"""
+다운로드 작업 큐 모듈
+"""
+import heapq
+import itertools
+import os
+import shutil
+import threading
+import time
+from collections import deque, namedtuple
+
+PHASE_QUEUED = "queued"
+PHASE_EXTRACTING = "extracting"
+PHASE_DOWNLOADING = "downloading"
+PHASE_POSTPROCESSING = "postprocessing"
+PHASE_FINISHED = "finished"
+PHASE_FAILED = "failed"
+PHASE_CANCELLED = "cancelled"
+PHASE_PAUSED = "paused"
+
+# 실행 중인 작업에 보내는 요청 (다운로드 진행 콜백이 다음 호출에서 확인)
+CONTROL_PAUSE = "pause"
+CONTROL_CANCEL = "cancel"
+
+FINAL_PHASES = frozenset((PHASE_FINISHED, PHASE_FAILED, PHASE_CANCELLED))
+
+# 작업 진행 상태 스냅샷 (불변 튜플을 통째로 교체하므로 읽는 쪽은 잠금 없이 일관된 값을 봄)
+JobState = namedtuple(
+    "JobState",
+    [
+        "phase", "title", "downloaded_bytes", "total_bytes",
+        "speed", "eta", "selected_quality", "output_path",
+    ],
+)
+
+INITIAL_STATE = JobState(PHASE_QUEUED, None, 0, None, None, None, None, None)
+
+
+class DownloadJob:
+    """큐에 들어간 작업 하나 (수백 개가 쌓여도 가볍도록 __slots__ 사용)"""
+    __slots__ = (
+        "job_id", "spec", "priority", "created_at", "key", "breaker_key",
+        "state", "result", "error", "control", "resume_data", "queue_seq", "_done",
+    )
+
+    def __init__(self, job_id, spec, priority=0, key=None, breaker_key=None):
+        self.job_id = job_id
+        self.spec = spec
+        self.priority = priority
+        self.key = key
+        self.breaker_key = breaker_key
+        self.created_at = time.time()
+        self.state = INITIAL_STATE
+        self.result = None
+        self.error = None
+        self.control = None
+        self.resume_data = None
+        self.queue_seq = None
+        self._done = threading.Event()
+
+    @property
+    def url(self):
+        return self.spec.url
+
+    @property
+    def group(self):
+        """같은 영상을 가리키는 작업끼리 공유하는 값 (동시에 실행하지 않음)"""
+        return self.key[0] if self.key is not None else None
+
+    def update(self, **changes):
+        """진행 상태 갱신 (작업을 실행하는 스레드에서 호출)"""
+        self.state = self.state._replace(**changes)
+
+    def set_resume_data(self, data):
+        """일시 정지한 작업을 이어 받는 데 필요한 값 (임시 폴더, 취소 시 지울 파일)"""
+        self.resume_data = data
+
+    def finish(self, result, error=None):
+        """작업 종료 처리"""
+        self.result = result
+        self.error = error
+        self.update(phase=PHASE_FINISHED if result else PHASE_FAILED)
+        self._done.set()
+
+    def cancel(self):
+        """작업을 취소 상태로 종료"""
+        self.result = False
+        self.error = "취소됨"
+        self.control = None
+        self.update(phase=PHASE_CANCELLED)
+        self._done.set()
+
+    def to_dict(self):
+        """JSON 응답용 딕셔너리"""
+        return {
+            'id': self.job_id,
+            'url': self.url,
+            'priority': self.priority,
+            'created_at': self.created_at,
+            **self.state._asdict(),
+            'result': self.result,
+            'error': self.error,
+            'control': self.control,
+        }
+
+    def is_done(self):
+        return self._done.is_set()
+
+    def is_paused(self):
+        return self.state.phase == PHASE_PAUSED
+
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 대기하고 결과 반환"""
+        self._done.wait(timeout)
+        return self.result
+
+
+def remove_partial_files(paths):
+    """취소한 작업이 남긴 임시 파일/폴더 삭제"""
+    for path in paths or ():
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+class DownloadQueue:
+    """우선순위 작업 큐 + 동시 실행 수 제한 작업 스레드
+    run_job(job)은 성공 여부(bool)를 반환해야 합니다.
+    key_func(spec)가 (영상 키, 옵션 키)를 반환하면 끝나지 않은 같은 키의 작업이 있을 때
+    새 작업을 만들지 않고 그 작업을 돌려주며, 옵션만 다른 같은 영상 작업은 차례로 실행합니다.
+    breakers(CircuitBreakerRegistry)와 breaker_func(spec)를 주면 차단으로 멈춘 사이트의 작업은
+    대기열에 남겨 두고 다른 사이트의 작업을 먼저 실행합니다.
+    실행 중인 작업의 일시 정지/취소는 job.control로 요청하고, run_job이 멈추면서 단계를
+    PHASE_PAUSED로 바꾸면 작업을 끝내지 않고 보관했다가 resume()에서 다시 대기열에 넣습니다.
+    schedule(DownloadSchedule)을 주면 시간대마다 그 시간대의 동시 실행 수를 max_workers 대신 쓰고,
+    새 작업을 시작할 수 없는 시간대에는 다음 시간대가 시작될 때까지 작업을 대기열에 둡니다.
+    max_finished_jobs를 주면 끝난 작업은 그 수만큼만 jobs에 남기고 오래된 것부터 잊습니다."""
+
+    def __init__(self, run_job, max_workers=3, key_func=None, breakers=None, breaker_func=None, schedule=None,
+                 max_finished_jobs=None):
+        self.run_job = run_job
+        self.max_finished_jobs = max_finished_jobs
+        self.max_workers = max(1, max_workers)
+        self.schedule = schedule
+        self.key_func = key_func
+        self.breakers = breakers
+        self.breaker_func = breaker_func if breakers is not None else None
+        self._wake_after = None
+        self._inflight = {}
+        self._running_groups = set()
+        self._running = set()
+        self._resume_requested = set()
+        self.jobs = []
+        self._jobs_by_id = {}
+        self._finished = deque()
+        self._heap = []
+        self._seq = itertools.count()
+        self._job_ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self._threads = []
+        self._active = 0
+        self._closed = False
+        if breakers is not None:
+            breakers.add_listener(self._on_breaker_changed)
+
+    def submit(self, spec, priority=0):
+        """작업 추가 (priority가 클수록 먼저 실행)
+        같은 키의 작업이 이미 대기/실행 중이면 그 작업을 반환합니다 (job.spec is not spec)."""
+        key = self._call_key(self.key_func, spec)
+        breaker_key = self._call_key(self.breaker_func, spec)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("종료된 작업 큐입니다.")
+            existing = self._inflight.get(key) if key is not None else None
+            if existing is not None and not existing.is_done():
+                return existing
+            job = DownloadJob(next(self._job_ids), spec, priority, key, breaker_key)
+            if key is not None:
+                self._inflight[key] = job
+            self.jobs.append(job)
+            self._jobs_by_id[job.job_id] = job
+            self._push(job)
+            self._start_threads()
+            self._cond.notify()
+        return job
+
+    def _push(self, job):
+        """힙에 추가 (이전에 넣은 항목은 꺼낼 때 건너뜀)"""
+        job.queue_seq = next(self._seq)
+        heapq.heappush(self._heap, (-job.priority, job.queue_seq, job))
+
+    def get_job(self, job_id):
+        """작업 번호로 작업 조회, 없으면 None"""
+        return self._jobs_by_id.get(job_id)
+
+    def cancel(self, job):
+        """작업 취소, 이미 끝난 작업이면 False
+        실행 중인 작업은 다음 진행 콜백에서 멈추도록 요청만 하고, 일시 정지한 작업은
+        남겨 둔 임시 파일을 지웁니다."""
+        with self._cond:
+            if job.is_done():
+                return False
+            if job in self._running:
+                job.control = CONTROL_CANCEL
+                return True
+            # 힙에서는 꺼낼 때 건너뛰도록 표시만 함
+            discard = (job.resume_data or {}).get('discard') if job.is_paused() else None
+            job.cancel()
+            self._release_key(job)
+            self._retire(job)
+            self._cond.notify_all()
+        remove_partial_files(discard)
+        return True
+
+    def pause(self, job):
+        """작업 일시 정지 (실행 중이면 다음 진행 콜백에서 멈추고 작업 슬롯을 비움)"""
+        with self._cond:
+            if job.is_done() or job.is_paused():
+                return False
+            self._resume_requested.discard(job)
+            if job in self._running:
+                job.control = CONTROL_PAUSE
+            else:
+                job.update(phase=PHASE_PAUSED)
+                self._cond.notify_all()
+            return True
+
+    def resume(self, job):
+        """일시 정지한 작업을 다시 대기열에 넣음 (받은 부분부터 이어 받음)"""
+        with self._cond:
+            if job.is_done():
+                return False
+            if job in self._running:
+                if job.is_paused():
+                    # 멈추는 중인 작업은 작업 스레드가 정리한 뒤 다시 넣음
+                    self._resume_requested.add(job)
+                elif job.control == CONTROL_PAUSE:
+                    job.control = None
+                else:
+                    return False
+                return True
+            if not job.is_paused():
+                return False
+            job.control = None
+            job.update(phase=PHASE_QUEUED)
+            self._push(job)
+            self._start_threads()
+            self._cond.notify_all()
+            return True
+
+    def set_priority(self, job, priority):
+        """대기 중이거나 일시 정지한 작업의 우선순위 변경 (priority가 클수록 먼저 실행)"""
+        with self._cond:
+            if job.is_done() or job in self._running:
+                return False
+            job.priority = priority
+            if not job.is_paused():
+                self._push(job)
+                self._cond.notify_all()
+            return True
+
+    def set_max_workers(self, max_workers):
+        """동시 실행 수 변경 (실행 중인 작업은 끝날 때까지 유지)"""
+        with self._cond:
+            self.max_workers = max(1, max_workers)
+            self._start_threads()
+            self._cond.notify_all()
+
+    def set_schedule(self, schedule):
+        """시간대별 정책 변경, None이면 항상 max_workers 사용"""
+        with self._cond:
+            self.schedule = schedule
+            self._start_threads()
+            self._cond.notify_all()
+
+    def job_limit(self):
+        """지금 동시에 실행할 수 있는 작업 수"""
+        if self.schedule is None:
+            return self.max_workers
+        return self.schedule.max_jobs(self.max_workers)
+
+    def active_count(self):
+        with self._cond:
+            return self._active
+
+    def pending_count(self):
+        with self._cond:
+            return sum(1 for entry in self._heap if self._is_live(entry))
+
+    def join(self, timeout=None):
+        """대기 중/실행 중인 작업이 모두 끝날 때까지 대기"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._active or self._has_pending():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, wait=True):
+        """새 작업을 받지 않고 남은 작업을 처리한 뒤 스레드 종료"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self.breakers is not None:
+            self.breakers.remove_listener(self._on_breaker_changed)
+        if wait:
+            for thread in list(self._threads):
+                thread.join()
+
+    def _start_threads(self):
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        wanted = self.max_workers if self.schedule is None else self.schedule.peak_jobs(self.max_workers)
+        while len(self._threads) < wanted:
+            thread = threading.Thread(target=self._worker, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    @staticmethod
+    def _is_live(entry):
+        """실행을 기다리는 힙 항목인지 (끝났거나, 일시 정지했거나, 우선순위 변경으로 다시 넣은 작업의 옛 항목이면 False)"""
+        job = entry[2]
+        return entry[1] == job.queue_seq and not job.is_done() and not job.is_paused()
+
+    def _has_pending(self):
+        return any(self._is_live(entry) for entry in self._heap)
+
+    def _call_key(self, func, spec):
+        if func is None:
+            return None
+        try:
+            return func(spec)
+        except (ValueError, TypeError, OSError):
+            # 키를 계산할 수 없는 작업은 합치거나 멈추지 않고 실행해서 작업 쪽에서 오류를 알림
+            return None
+
+    def _on_breaker_changed(self, _key, _state):
+        with self._cond:
+            self._cond.notify_all()
+
+    def _release_key(self, job):
+        if job.key is not None and self._inflight.get(job.key) is job:
+            del self._inflight[job.key]
+
+    def _retire(self, job):
+        """끝난 작업 기록, 보관 한도를 넘으면 가장 오래된 끝난 작업을 목록에서 제거 (잠금을 잡은 상태에서 호출)"""
+        if self.max_finished_jobs is None:
+            return
+        self._finished.append(job)
+        while len(self._finished) > self.max_finished_jobs:
+            old = self._finished.popleft()
+            self.jobs.remove(old)
+            self._jobs_by_id.pop(old.job_id, None)
+
+    def _take_next_job(self):
+        """실행할 작업 선택 (잠금을 잡은 상태에서 호출), 없으면 None
+        같은 영상의 다른 작업이 실행 중이거나 사이트가 차단으로 멈춰 있으면 건너뛰고 다음 작업을 고릅니다.
+        멈춘 사이트나 시간대 정책 때문에 고르지 못하면 다시 확인할 때까지의 초를 _wake_after에 남깁니다."""
+        self._wake_after = None
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        if self._active >= self.job_limit():
+            if self.schedule is not None:
+                self._wake_after = self.schedule.seconds_until_change()
+            return None
+        deferred = []
+        job = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            candidate = entry[2]
+            if not self._is_live(entry):
+                continue
+            if candidate.group is not None and candidate.group in self._running_groups:
+                deferred.append(entry)
+                continue
+            if self.breakers is not None and not self.breakers.acquire(candidate.breaker_key, candidate):
+                deferred.append(entry)
+                delay = self.breakers.retry_delay(candidate.breaker_key)
+                if delay is not None and (self._wake_after is None or delay < self._wake_after):
+                    self._wake_after = delay
+                continue
+            job = candidate
+            break
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+        if job is not None:
+            self._running.add(job)
+            if job.group is not None:
+                self._running_groups.add(job.group)
+        return job
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = self._take_next_job()
+                while job is None:
+                    if self._closed and not self._heap:
+                        return
+                    self._cond.wait(self._wake_after)
+                    job = self._take_next_job()
+                self._active += 1
+            result, error = False, None
+            try:
+                job.update(phase=PHASE_EXTRACTING)
+                result = bool(self.run_job(job))
+            except Exception as e:
+                error = str(e)
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    self._running.discard(job)
+                    self._running_groups.discard(job.group)
+                    if job.is_paused() and not result:
+                        # 일시 정지: 끝내지 않고 보관 (같은 키의 새 작업은 계속 이 작업에 합침)
+                        job.control = None
+                        if job in self._resume_requested:
+                            self._resume_requested.discard(job)
+                            job.update(phase=PHASE_QUEUED)
+                            self._push(job)
+                    else:
+                        if job.control == CONTROL_CANCEL and not result:
+                            job.cancel()
+                        else:
+                            job.control = None
+                            job.finish(result, error)
+                        self._release_key(job)
+                        self._retire(job)
+                    if self.breakers is not None:
+                        self.breakers.release(job.breaker_key, job)
+                    self._cond.notify_all()
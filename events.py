@@ -0,0 +1,46 @@
+"""
+헤드리스 실행용 기계 판독 이벤트 출력 모듈 (한 줄에 JSON 하나)
+
+  phase     단계 변경 (extracting, downloading, postprocessing, finished, failed)
+  progress  진행률 (downloaded_bytes, total_bytes, speed, eta) - 일정 간격으로 제한
+  retry     재시도 (attempt, max_attempts, error_class, message)
+  error     재시도 없이 끝난 오류
+  result    최종 결과 (success, output_path, size)
+"""
+import json
+import os
+import threading
+import time
+
+
+class JsonEventWriter:
+    """여러 작업 스레드에서 호출해도 줄이 섞이지 않는 JSON 이벤트 출력기"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_fd(cls, fd):
+        """열려 있는 파일 디스크립터 번호로 출력기 생성"""
+        return cls(os.fdopen(fd, 'w', encoding='utf-8', buffering=1, closefd=False))
+
+    def emit(self, event_type, job_id=None, **fields):
+        event = {'type': event_type, 'time': round(time.time(), 3)}
+        if job_id is not None:
+            event['job_id'] = job_id
+        event.update(fields)
+        line = json.dumps(event, ensure_ascii=False, separators=(',', ':'), default=str)
+        with self._lock:
+            try:
+                self.stream.write(line + '\n')
+                self.stream.flush()
+            except (BrokenPipeError, ValueError):
+                # 읽는 쪽이 먼저 닫혀도 다운로드는 계속 진행
+                pass
+
+    def bind(self, job_id):
+        """특정 작업 번호를 붙여 내보내는 콜백 반환 (YouTubeDownloader.event_callback 용)"""
+        def emit(event_type, **fields):
+            self.emit(event_type, job_id=job_id, **fields)
+        return emit
@@ -0,0 +1,108 @@
+"""
+추출된 포맷 목록에서 화질 선택을 다시 계산하는 모듈 (네트워크 요청 없음)
+"""
+import threading
+from functools import lru_cache
+
+import yt_dlp
+
+from utils import estimate_format_bytes
+
+# 설정 다이얼로그의 선호 해상도 선택지와 동일
+RESOLUTION_CHOICES = ("best", "2160p", "1440p", "1080p", "720p", "480p", "360p")
+
+
+class FormatSelectionEngine:
+    """Config.get_ydl_opts의 format/format_sort를 이미 추출한 포맷 목록에 적용
+    yt-dlp의 선택기를 그대로 사용하므로 실제 다운로드 시 선택과 같은 결과를 냅니다."""
+    SORTED_CACHE_SIZE = 32
+
+    def __init__(self, format_sort=(), merge_output_format=None):
+        self._ydl = yt_dlp.YoutubeDL({
+            'quiet': True,
+            'no_warnings': True,
+            'format_sort': list(format_sort),
+            'merge_output_format': merge_output_format,
+        })
+        self._selectors = {}
+        self._sorted_cache = {}
+        self._lock = threading.Lock()
+
+    def select(self, formats, format_str):
+        """선택된 포맷(병합 시 requested_formats 포함) 반환, 없으면 None"""
+        with self._lock:
+            selector = self._selectors.get(format_str)
+            if selector is None:
+                selector = self._ydl.build_format_selector(format_str)
+                self._selectors[format_str] = selector
+            formats = self._sorted(formats)
+            selected = list(selector({
+                'formats': formats,
+                'has_merged_format': any(
+                    'none' not in (f.get('acodec'), f.get('vcodec'))
+                    for f in formats
+                ),
+                'incomplete_formats': (
+                    all(f.get('vcodec') == 'none' for f in formats)
+                    or all(f.get('acodec') == 'none' for f in formats)
+                ),
+            }))
+        return selected[0] if selected else None
+
+    def _sorted(self, formats):
+        """현재 정렬 기준으로 정렬한 복사본 반환 (같은 목록은 한 번만 정렬)"""
+        cached = self._sorted_cache.get(id(formats))
+        if cached is not None and cached[0] is formats:
+            return cached[1]
+        sorted_formats = list(formats)
+        self._ydl.sort_formats({'formats': sorted_formats})
+        # 원본 목록을 함께 보관해 id가 다른 목록에 재사용되지 않도록 함
+        self._sorted_cache[id(formats)] = (formats, sorted_formats)
+        while len(self._sorted_cache) > self.SORTED_CACHE_SIZE:
+            self._sorted_cache.pop(next(iter(self._sorted_cache)))
+        return sorted_formats
+
+
+@lru_cache(maxsize=16)
+def get_engine(format_sort=(), merge_output_format=None):
+    """정렬 기준별 선택 엔진 반환 (YoutubeDL 생성 비용을 한 번만 지불)"""
+    return FormatSelectionEngine(format_sort, merge_output_format)
+
+
+def select_for_opts(info, ydl_opts):
+    """yt-dlp 옵션 기준으로 선택 결과 요약 반환"""
+    engine = get_engine(
+        tuple(ydl_opts.get('format_sort') or ()),
+        ydl_opts.get('merge_output_format'),
+    )
+    selected = engine.select(info.get('formats') or [], ydl_opts['format'])
+    if selected is None:
+        return None
+    duration = info.get('duration')
+    parts = selected.get('requested_formats') or (selected,)
+    sizes = [estimate_format_bytes(fmt, duration) for fmt in parts]
+    return {
+        'format_id': selected.get('format_id'),
+        'height': selected.get('height'),
+        'fps': selected.get('fps'),
+        'ext': selected.get('ext'),
+        'estimated_bytes': sum(sizes) if None not in sizes else None,
+        'needs_merge': len(parts) > 1,
+        'needs_remux': (
+            len(parts) == 1
+            and selected.get('vcodec') not in (None, 'none')
+            and bool(ydl_opts.get('merge_output_format'))
+            and selected.get('ext') != ydl_opts.get('merge_output_format')
+        ),
+    }
+
+
+def preview_choices(info, config, is_youtube=False, choices=RESOLUTION_CHOICES):
+    """선호 해상도 선택지마다 선택될 포맷을 한 번의 추출 결과로 계산"""
+    return {
+        choice: select_for_opts(
+            info,
+            config.snapshot({'preferred_quality': choice}).get_ydl_opts(is_youtube),
+        )
+        for choice in choices
+    }
@@ -0,0 +1,248 @@
+"""
+다운로드 기록 저장 모듈 (SQLite)
+작업 스레드는 record()로 대기열에 넣기만 하고, 기록 스레드가 모아서 한 트랜잭션으로 씁니다.
+영상 키/사이트/시간 색인과 제목 전문 검색(FTS5, 없으면 LIKE)으로 페이지 단위 조회를 지원합니다.
+"""
+import atexit
+import platform
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+FIELDS = (
+    "finished_at", "url", "video_key", "site", "title", "success", "output_path",
+    "size", "quality", "elapsed", "avg_speed", "sha256", "error",
+)
+
+HistoryEntry = namedtuple("HistoryEntry", ("id",) + FIELDS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    url TEXT NOT NULL,
+    video_key TEXT,
+    site TEXT,
+    title TEXT,
+    success INTEGER NOT NULL,
+    output_path TEXT,
+    size INTEGER,
+    quality TEXT,
+    elapsed REAL,
+    avg_speed REAL,
+    sha256 TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS downloads_video_key ON downloads (video_key, finished_at);
+CREATE INDEX IF NOT EXISTS downloads_site ON downloads (site, finished_at);
+CREATE INDEX IF NOT EXISTS downloads_finished_at ON downloads (finished_at, id);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS downloads_fts USING fts5(
+    title, content='downloads', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS downloads_fts_insert AFTER INSERT ON downloads BEGIN
+    INSERT INTO downloads_fts (rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS downloads_fts_delete AFTER DELETE ON downloads BEGIN
+    INSERT INTO downloads_fts (downloads_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+"""
+
+_STOP = object()
+
+
+def default_history_path():
+    """기록 DB 파일 경로 (설정 파일과 같은 규칙)"""
+    if platform.system() == "Windows":
+        return Path.home() / "youtube_downloader_history.sqlite3"
+    return Path.home() / ".youtube_downloader_history.sqlite3"
+
+
+def open_shared_store():
+    """공유 기록 저장소, 열 수 없으면 None (기록 없이 다운로드는 계속)"""
+    try:
+        return HistoryStore.shared()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def fts_query(text):
+    """검색어를 단어별 앞부분 일치 FTS 질의로 변환 (따옴표 등 특수 문자는 그대로 검색)"""
+    terms = ['"' + term.replace('"', '""') + '"*' for term in text.split()]
+    return " ".join(terms)
+
+
+class HistoryStore:
+    """다운로드 기록 저장소"""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path, batch_size=100, flush_interval=1.0):
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.revision = 0
+        self._pending = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self._local = threading.local()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connection()
+        with conn:
+            conn.executescript(SCHEMA)
+        try:
+            with conn:
+                conn.executescript(FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # FTS5 없이 빌드된 SQLite는 제목 LIKE 검색으로 대체
+            self.has_fts = False
+
+    @classmethod
+    def shared(cls):
+        """프로세스 전체에서 공유하는 기록 저장소 (종료 시 남은 기록을 씀)"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(default_history_path())
+                atexit.register(cls._shared_instance.close)
+            return cls._shared_instance
+
+    def _connection(self):
+        """스레드마다 별도 연결 사용"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def record(self, **fields):
+        """기록 하나를 대기열에 추가 (어느 스레드에서나 호출 가능, DB는 기록 스레드가 씀)"""
+        row = {field: fields.get(field) for field in FIELDS}
+        if row["finished_at"] is None:
+            row["finished_at"] = time.time()
+        row["success"] = int(bool(row["success"]))
+        self._ensure_writer()
+        self._pending.put(row)
+
+    def flush(self, timeout=None):
+        """대기 중인 기록을 모두 쓸 때까지 대기"""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._pending.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        with self._writer_lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None:
+            self._pending.put(_STOP)
+            writer.join()
+
+    def _ensure_writer(self):
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        conn = self._connection()
+        stopped = False
+        while not stopped:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and isinstance(batch[-1], dict):
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            rows = [item for item in batch if isinstance(item, dict)]
+            if rows:
+                try:
+                    with conn:
+                        conn.executemany(
+                            f"INSERT INTO downloads ({', '.join(FIELDS)}) "
+                            f"VALUES ({', '.join('?' * len(FIELDS))})",
+                            [tuple(row[field] for field in FIELDS) for row in rows],
+                        )
+                    self.revision += 1
+                except sqlite3.Error:
+                    # 기록 실패로 다운로드 작업이 멈추지 않도록 버림
+                    pass
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    stopped = True
+        conn.close()
+        self._local.conn = None
+
+    def _where(self, text=None, site=None, video_key=None, since=None, until=None, success=None):
+        clauses = []
+        params = []
+        if text and text.strip():
+            if self.has_fts:
+                clauses.append("id IN (SELECT rowid FROM downloads_fts WHERE downloads_fts MATCH ?)")
+                params.append(fts_query(text))
+            else:
+                clauses.append("title LIKE ?")
+                params.append(f"%{text.strip()}%")
+        if site:
+            clauses.append("site = ?")
+            params.append(site)
+        if video_key:
+            clauses.append("video_key = ?")
+            params.append(video_key)
+        if since is not None:
+            clauses.append("finished_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("finished_at < ?")
+            params.append(until)
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(int(bool(success)))
+        return clauses, params
+
+    def search(self, text=None, site=None, video_key=None, since=None, until=None, success=None,
+               after=None, limit=100):
+        """최근 순 기록 조회
+        after에 이전 페이지 마지막 항목을 넘기면 그 다음 페이지를 반환합니다 (키셋 페이지)."""
+        clauses, params = self._where(text, site, video_key, since, until, success)
+        if after is not None:
+            clauses.append("(finished_at < ? OR (finished_at = ? AND id < ?))")
+            params += [after.finished_at, after.finished_at, after.id]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection().execute(
+            f"SELECT id, {', '.join(FIELDS)} FROM downloads {where} "
+            "ORDER BY finished_at DESC, id DESC LIMIT ?",
+            params + [limit],
+        ).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def last_success(self, video_key):
+        """같은 영상을 마지막으로 성공한 기록, 없으면 None"""
+        entries = self.search(video_key=video_key, success=True, limit=1)
+        return entries[0] if entries else None
+
+    def site_summary(self, since=None):
+        """사이트별 (작업 수, 성공 수, 받은 바이트, 평균 전송 속도) 목록"""
+        clauses, params = self._where(since=since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._connection().execute(
+            "SELECT site, COUNT(*), SUM(success), COALESCE(SUM(size), 0), "
+            "SUM(CASE WHEN elapsed > 0 THEN size END) / SUM(CASE WHEN elapsed > 0 AND size THEN elapsed END) "
+            f"FROM downloads {where} GROUP BY site ORDER BY COUNT(*) DESC",
+            params,
+        ).fetchall()
@@ -0,0 +1,149 @@
+"""
+다운로드 기록 모델/뷰 모듈 (스크롤할 때 페이지 단위로 불러옴)
+"""
+import time
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+from PySide6.QtWidgets import QHBoxLayout, QHeaderView, QLabel, QLineEdit, QTableView, QVBoxLayout, QWidget
+
+from utils import format_file_size
+
+COLUMNS = ("완료 시각", "제목/URL", "사이트", "결과", "화질", "크기", "평균 속도")
+
+
+class HistoryModel(QAbstractTableModel):
+    """기록 저장소를 키셋 페이지로 읽는 테이블 모델
+    처음에는 한 페이지만 읽고, 뷰가 끝까지 스크롤하면 fetchMore로 다음 페이지를 읽습니다."""
+
+    def __init__(self, store, page_size=100, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.page_size = page_size
+        self.search_text = ""
+        self._entries = []
+        self._has_more = True
+        self.loaded_revision = None
+
+    def set_search_text(self, text):
+        self.search_text = text
+        self.reload()
+
+    def reload(self):
+        """처음 페이지부터 다시 읽기"""
+        self.beginResetModel()
+        self._entries = []
+        self._has_more = True
+        self.loaded_revision = self.store.revision
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        page = self.store.search(
+            self.search_text,
+            after=self._entries[-1] if self._entries else None,
+            limit=self.page_size,
+        )
+        self._has_more = len(page) == self.page_size
+        if not page:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._entries.extend(page)
+        self.endInsertRows()
+
+    def entry_at(self, row):
+        return self._entries[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return entry.error or entry.output_path or entry.url
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        column = index.column()
+        if column == 0:
+            return time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.finished_at))
+        if column == 1:
+            return entry.title or entry.url
+        if column == 2:
+            return entry.site or ""
+        if column == 3:
+            return "완료" if entry.success else "실패"
+        if column == 4:
+            return entry.quality or ""
+        if column == 5:
+            return format_file_size(entry.size) if entry.size else ""
+        if column == 6:
+            return f"{format_file_size(entry.avg_speed)}/s" if entry.avg_speed else ""
+        return None
+
+
+class HistoryPanel(QWidget):
+    """제목 검색창과 기록 테이블 (보이는 동안만 새 기록을 확인)"""
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.model = HistoryModel(store, parent=self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel("제목 검색:"))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("검색어 (비워 두면 전체)")
+        search_layout.addWidget(self.search_edit)
+        layout.addLayout(search_layout)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        # 입력이 멈춘 뒤에만 검색
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(lambda: self.model.set_search_text(self.search_edit.text()))
+        self.search_edit.textChanged.connect(self.search_timer.start)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(2000)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        """새 기록이 쓰였으면 첫 페이지부터 다시 읽기"""
+        if self.model.loaded_revision != self.model.store.revision:
+            self.model.reload()
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
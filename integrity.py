@@ -0,0 +1,224 @@
+"""
+다운로드 파일 무결성 모듈
+전송 중에 새로 쓰인 부분만 이어서 해시하고, 후처리 단계에서 ffprobe로 컨테이너를 점검합니다.
+결과는 (경로, 크기, 수정 시각) 기준으로 저장해 같은 파일을 다시 점검할 때 읽지 않습니다.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+from yt_dlp.utils import PostProcessingError
+
+HASH_ALGORITHM = "sha256"
+READ_CHUNK_SIZE = 4 * 1024 * 1024
+# 진행 콜백마다 파일을 열지 않도록 이만큼 쌓였을 때만 읽음
+HASH_STEP_BYTES = 16 * 1024 * 1024
+# 추출 정보의 재생 시간과 이 이상 차이 나면 잘린 파일로 판단
+DURATION_TOLERANCE = 0.05
+
+
+class IncrementalHasher:
+    """다운로드 중인 파일에서 아직 해시하지 않은 뒤쪽만 읽어 해시를 이어서 계산
+    방금 쓴 부분이라 대부분 페이지 캐시에서 읽습니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self._hash = hashlib.new(HASH_ALGORITHM)
+
+    def update_to(self, size, force=False):
+        """파일의 size 바이트까지 해시 (force가 아니면 HASH_STEP_BYTES 단위로만 읽음)"""
+        if size is None or (not force and size - self.offset < HASH_STEP_BYTES):
+            return
+        if size < self.offset:
+            # 처음부터 다시 받는 경우
+            self.offset = 0
+            self._hash = hashlib.new(HASH_ALGORITHM)
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                while self.offset < size:
+                    chunk = f.read(min(READ_CHUNK_SIZE, size - self.offset))
+                    if not chunk:
+                        break
+                    self._hash.update(chunk)
+                    self.offset += len(chunk)
+        except OSError:
+            pass
+
+    def rename(self, path):
+        """.part 파일이 최종 이름으로 바뀐 경우"""
+        self.path = path
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def hash_file(path):
+    """파일 전체 해시 (전송 중 해시를 쓸 수 없을 때만 사용)"""
+    hasher = IncrementalHasher(path)
+    hasher.update_to(os.path.getsize(path), force=True)
+    return hasher.hexdigest()
+
+
+def file_key(path):
+    """캐시 키로 쓰는 (크기, 수정 시각 ns)"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def check_probe(metadata, expected_duration=None):
+    """ffprobe 결과가 정상 컨테이너인지 점검해 요약 반환"""
+    streams = metadata.get("streams") or []
+    fmt = metadata.get("format") or {}
+    try:
+        duration = float(fmt.get("duration"))
+    except (TypeError, ValueError):
+        duration = None
+    result = {
+        "ok": True,
+        "format": fmt.get("format_name"),
+        "duration": duration,
+        "streams": [s.get("codec_type") for s in streams],
+        "error": None,
+    }
+    if not streams:
+        result.update(ok=False, error="스트림이 없습니다.")
+    elif expected_duration and duration is not None:
+        if abs(duration - expected_duration) > max(2.0, expected_duration * DURATION_TOLERANCE):
+            result.update(ok=False, error=f"재생 시간이 다릅니다 (예상 {expected_duration:.0f}초, 실제 {duration:.0f}초)")
+    elif expected_duration and duration is None:
+        result.update(ok=False, error="재생 시간을 읽을 수 없습니다.")
+    return result
+
+
+def expected_duration(info):
+    """추출 정보 기준 예상 재생 시간 (구간 다운로드면 구간 길이)"""
+    start, end = info.get("section_start"), info.get("section_end")
+    if start is not None and end is not None and end != float("inf"):
+        return end - start
+    return info.get("duration")
+
+
+class IntegrityCache:
+    """경로별 해시/점검 결과 (크기와 수정 시각이 같을 때만 유효)"""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_file):
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    @classmethod
+    def shared(cls):
+        """설정 파일 옆의 캐시 파일을 프로세스 전체에서 공유"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(Path.home() / ".youtube_downloader_integrity.json")
+            return cls._shared_instance
+
+    def _load(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def lookup(self, path):
+        """파일이 바뀌지 않았으면 저장된 결과, 아니면 None"""
+        try:
+            size, mtime_ns = file_key(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(path))
+        if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+            return entry
+        return None
+
+    def store(self, path, key=None, **fields):
+        """결과 저장 (key가 없으면 지금 파일 상태 사용, 같은 상태의 기존 결과와 합침)"""
+        size, mtime_ns = key or file_key(path)
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if not entry or entry.get("size") != size or entry.get("mtime_ns") != mtime_ns:
+                entry = {"size": size, "mtime_ns": mtime_ns}
+            entry.update(fields)
+            self._entries[path] = entry
+            self._save()
+        return entry
+
+    def forget(self, path):
+        """옮기거나 지운 파일의 결과 삭제"""
+        with self._lock:
+            if self._entries.pop(os.path.abspath(path), None) is not None:
+                self._save()
+
+    def _save(self):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".integrity-", dir=self.cache_file.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+class IntegrityCheckPP(FFmpegPostProcessor):
+    """최종 파일을 ffprobe로 점검하고 결과를 캐시에 저장하는 후처리기"""
+
+    def __init__(self, downloader=None, cache=None):
+        super().__init__(downloader)
+        self.cache = cache
+
+    @classmethod
+    def pp_key(cls):
+        return "IntegrityCheck"
+
+    def probe(self, path, duration=None):
+        """캐시를 먼저 보고, 없으면 ffprobe 실행"""
+        cache = self.cache or IntegrityCache.shared()
+        entry = cache.lookup(path)
+        if entry and "probe" in entry:
+            return entry["probe"]
+        try:
+            result = check_probe(self.get_metadata_object(path), duration)
+        except (PostProcessingError, OSError, ValueError) as e:
+            result = {"ok": False, "format": None, "duration": None, "streams": [], "error": str(e)}
+        cache.store(path, probe=result)
+        return result
+
+    def run(self, info):
+        path = info["filepath"]
+        if not self.probe_available:
+            self.report_warning("ffprobe가 없어 파일 점검을 건너뜁니다.")
+            return [], info
+        result = self.probe(path, expected_duration(info))
+        if not result["ok"]:
+            self.report_warning(f"파일 점검 실패: {path} - {result['error']}")
+        info["integrity_probe"] = result
+        return [], info
+
+
+def verify_file(path, pp=None, cache=None):
+    """파일의 해시와 점검 결과 반환 (파일이 바뀌지 않았으면 다시 읽지 않음)"""
+    cache = cache or IntegrityCache.shared()
+    entry = cache.lookup(path)
+    if not entry or HASH_ALGORITHM not in entry:
+        key = file_key(path)
+        entry = cache.store(path, key=key, **{HASH_ALGORITHM: hash_file(path)})
+    if "probe" not in entry and pp is not None and pp.probe_available:
+        pp.probe(path)
+        entry = cache.lookup(path) or entry
+    return entry
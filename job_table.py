@@ -0,0 +1,155 @@
+"""
+작업 목록 테이블 모델 모듈
+"""
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, Signal
+
+from download_queue import (
+    FINAL_PHASES, PHASE_CANCELLED, PHASE_DOWNLOADING, PHASE_EXTRACTING, PHASE_FAILED, PHASE_FINISHED,
+    PHASE_PAUSED, PHASE_POSTPROCESSING, PHASE_QUEUED,
+)
+from utils import format_file_size
+
+PHASE_LABELS = {
+    PHASE_QUEUED: "대기",
+    PHASE_EXTRACTING: "정보 확인",
+    PHASE_DOWNLOADING: "다운로드",
+    PHASE_POSTPROCESSING: "후처리",
+    PHASE_FINISHED: "완료",
+    PHASE_FAILED: "실패",
+    PHASE_CANCELLED: "취소",
+    PHASE_PAUSED: "일시 정지",
+}
+
+COLUMNS = ("제목/URL", "상태", "진행", "속도", "남은 시간", "화질")
+
+
+def format_eta(seconds):
+    """남은 시간(초)을 mm:ss 또는 h:mm:ss로 변환"""
+    if seconds is None:
+        return ""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class JobTableModel(QAbstractTableModel):
+    """작업 큐를 일정 주기로 읽어 바뀐 행만 갱신하는 테이블 모델
+    작업 스레드는 DownloadJob.state만 교체하며, 모델은 타이머에서 이전에 본
+    스냅샷과 비교해 최소 범위의 dataChanged만 발생시킵니다.
+    끝난 작업은 더 바뀌지 않으므로 비교 대상에서 빼고 전체 진행률에는 합계로만 남깁니다."""
+    summary_changed = Signal(float)
+
+    def __init__(self, download_queue, refresh_hz=10, parent=None):
+        super().__init__(parent)
+        self.download_queue = download_queue
+        self._jobs = []
+        self._seen_states = []
+        self._active_rows = []
+        self._settled_done = 0
+        self._settled_total = 0
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, int(1000 / refresh_hz)))
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start()
+
+    def refresh(self):
+        """새 작업 행 추가 및 바뀐 행 범위 알림, 변경된 행 수 반환"""
+        jobs = self.download_queue.jobs
+        known = len(self._jobs)
+        total = len(jobs)
+        active = []
+        changed = 0
+        first = last = None
+        last_column = len(COLUMNS) - 1
+        for row in self._active_rows:
+            state = self._jobs[row].state
+            if state is not self._seen_states[row]:
+                self._seen_states[row] = state
+                changed += 1
+                if last is not None and row != last + 1:
+                    self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+                    first = None
+                if first is None:
+                    first = row
+                last = row
+            self._keep_if_active(row, state, active)
+        if first is not None:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+        if total > known:
+            self.beginInsertRows(QModelIndex(), known, total - 1)
+            self._jobs.extend(jobs[known:total])
+            self._seen_states.extend(job.state for job in self._jobs[known:])
+            self.endInsertRows()
+            for row in range(known, total):
+                self._keep_if_active(row, self._seen_states[row], active)
+        self._active_rows = active
+
+        if changed or total > known:
+            self.summary_changed.emit(self.overall_percent())
+        return changed
+
+    def _keep_if_active(self, row, state, active):
+        """끝나지 않은 행은 active에 넣고, 끝난 행은 진행률 합계에 더함"""
+        if state.phase not in FINAL_PHASES:
+            active.append(row)
+        elif state.total_bytes:
+            self._settled_total += state.total_bytes
+            self._settled_done += min(state.downloaded_bytes, state.total_bytes)
+
+    def overall_percent(self):
+        """진행 중이거나 끝난 작업 전체의 바이트 기준 진행률"""
+        done = self._settled_done
+        total = self._settled_total
+        for row in self._active_rows:
+            state = self._seen_states[row]
+            if state.phase == PHASE_QUEUED:
+                continue
+            if state.total_bytes:
+                total += state.total_bytes
+                done += min(state.downloaded_bytes, state.total_bytes)
+        return done * 100.0 / total if total else 0.0
+
+    def job_at(self, row):
+        return self._jobs[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._jobs[index.row()]
+        state = self._seen_states[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return job.error or job.url
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if column == 0:
+            return state.title or job.url
+        if column == 1:
+            return PHASE_LABELS.get(state.phase, state.phase)
+        if column == 2:
+            if state.total_bytes:
+                percent = min(state.downloaded_bytes, state.total_bytes) * 100.0 / state.total_bytes
+                return f"{percent:.1f}% / {format_file_size(state.total_bytes)}"
+            return format_file_size(state.downloaded_bytes) if state.downloaded_bytes else ""
+        if column == 3:
+            return f"{format_file_size(state.speed)}/s" if state.speed else ""
+        if column == 4:
+            return format_eta(state.eta)
+        if column == 5:
+            return state.selected_quality or ""
+        return None
@@ -0,0 +1,249 @@
+"""
+다운로드 작업 명세 모듈
+"""
+import json
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import get_args
+
+from circuit_breaker import breaker_key
+from config import Config
+from multi_output import parse_output_profiles
+from utils import parse_sections, parse_video_url
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """작업 하나의 URL과 설정 덮어쓰기 값
+    지정하지 않은(None) 항목은 공유 설정 값을 그대로 사용하며,
+    설정 파일(~/.youtube_downloader_config.json)은 변경하지 않습니다."""
+    url: str
+    download_path: str | None = None
+    video_format: str | None = None
+    quality: str | None = None
+    preferred_quality: str | None = None
+    audio_only: bool | None = None
+    cookies_file: str | None = None
+    cookies_browser: str | None = None
+    proxy: str | None = None
+    player_client: str | None = None
+    deadline: float | None = None
+    byte_budget: int | None = None
+    sections: str | None = None
+    precise_cuts: bool | None = None
+    outputs: str | None = None
+
+    def __post_init__(self):
+        # 잘못된 구간/출력 형식은 작업을 큐에 넣기 전에 알림
+        if self.sections:
+            parse_sections(self.sections)
+        if self.outputs:
+            parse_output_profiles(self.outputs)
+
+    @classmethod
+    def from_dict(cls, data, defaults=None):
+        """작업 파일의 JSON 객체(또는 URL 문자열)에서 명세 생성"""
+        if isinstance(data, str):
+            data = {"url": data}
+        if not isinstance(data, dict):
+            raise ValueError(f"작업 항목은 객체 또는 URL 문자열이어야 합니다: {data!r}")
+        merged = dict(defaults or {})
+        merged.update(data)
+        known = {field.name for field in fields(cls)}
+        unknown = sorted(set(merged) - known)
+        if unknown:
+            raise ValueError(f"알 수 없는 작업 항목: {', '.join(unknown)}")
+        if not merged.get("url"):
+            raise ValueError("작업 항목에 url이 없습니다.")
+        for field in fields(cls):
+            if field.name in merged:
+                _check_field_type(field, merged[field.name])
+        return cls(**merged)
+
+    def overrides(self):
+        """공유 설정 위에 덮어쓸 설정 키/값 반환"""
+        values = {}
+        if self.download_path:
+            values["download_path"] = str(Path(self.download_path).expanduser())
+        if self.video_format:
+            values["video_format"] = self.video_format
+        if self.quality:
+            values["quality"] = self.quality
+        if self.preferred_quality:
+            values["preferred_quality"] = self.preferred_quality
+        if self.audio_only is not None:
+            values["download_audio_only"] = bool(self.audio_only)
+        if self.cookies_file:
+            values.update({
+                "use_cookies": True,
+                "cookies_source": "file",
+                "cookies_file": str(Path(self.cookies_file).expanduser()),
+            })
+        elif self.cookies_browser:
+            values.update({
+                "use_cookies": True,
+                "cookies_source": "browser",
+                "cookies_browser": self.cookies_browser,
+            })
+        if self.proxy:
+            if self.proxy == "none":
+                values["proxy_mode"] = "none"
+            else:
+                values.update({"proxy_mode": "manual", "proxy_url": self.proxy})
+        if self.player_client:
+            values["player_client"] = self.player_client
+        if self.deadline is not None:
+            values["quality_deadline_seconds"] = float(self.deadline)
+        if self.byte_budget is not None:
+            values["quality_byte_budget"] = int(self.byte_budget)
+        if self.sections is not None:
+            values["download_sections"] = self.sections
+        if self.precise_cuts is not None:
+            values["precise_cuts"] = bool(self.precise_cuts)
+        if self.outputs is not None:
+            values["output_profiles"] = self.outputs
+        return values
+
+    def resolve_config(self, base_config=None):
+        """덮어쓰기를 적용한 읽기 전용 설정 사본 반환
+        같은 덮어쓰기 조합의 작업들은 같은 사본과 yt-dlp 옵션 캐시를 공유합니다."""
+        base_config = base_config or Config.shared()
+        return base_config.snapshot(self.overrides())
+
+    def coalesce_key(self, base_config=None):
+        """중복 작업 판별용 (영상 키, 옵션 키) 반환 (DownloadQueue key_func 용)
+        URL 형태가 달라도 같은 영상이면 영상 키가 같고, 실제 포맷 문자열/저장 위치/
+        후처리가 같아야 옵션 키가 같습니다. 지원하지 않는 URL이면 ValueError."""
+        _site, _url, video_key = parse_video_url(self.url)
+        config = self.resolve_config(base_config)
+        opts = config.get_ydl_opts()
+        option_key = (
+            opts.get('format'),
+            config.get_quality_target(),
+            config.get("download_sections", ""),
+            opts.get('force_keyframes_at_cuts'),
+            tuple(config.get_output_profiles()),
+            config.get_postprocess_steps(),
+            opts.get('merge_output_format'),
+            opts.get('outtmpl'),
+            repr(opts.get('postprocessors')),
+        )
+        return video_key, option_key
+
+    def breaker_key(self, base_config=None):
+        """차단 상태를 공유하는 (사이트, 프록시) 반환 (DownloadQueue breaker_func 용)"""
+        site, _url, _video_key = parse_video_url(self.url)
+        return breaker_key(site, self.resolve_config(base_config).get_proxy_key())
+
+
+def _check_field_type(field, value):
+    """JSON 값이 필드 타입 표기(str | None 등)와 맞는지 확인, 아니면 키 이름과 함께 ValueError
+    JSON에는 정수와 실수 구분이 없으므로 float 필드는 정수도 받고, bool은 숫자로 보지 않습니다."""
+    allowed = get_args(field.type) or (field.type,)
+    if value is None and type(None) in allowed:
+        return
+    if isinstance(value, bool):
+        matches = bool in allowed
+    elif isinstance(value, int) and float in allowed:
+        matches = True
+    else:
+        matches = isinstance(value, tuple(t for t in allowed if t is not type(None)))
+    if not matches:
+        expected = " 또는 ".join("null" if t is type(None) else t.__name__ for t in allowed)
+        raise ValueError(f"작업 항목 {field.name}의 값은 {expected} 형식이어야 합니다: {value!r}")
+
+
+def load_job_file(path):
+    """JSON 작업 파일 로드
+    형식: [작업, ...] 또는 {"defaults": {...}, "jobs": [작업, ...]}
+    작업: URL 문자열 또는 JobSpec 필드 이름을 키로 갖는 객체"""
+    with open(Path(path).expanduser(), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    defaults = {}
+    if isinstance(data, dict):
+        defaults = data.get("defaults") or {}
+        data = data.get("jobs")
+    if not isinstance(data, list):
+        raise ValueError("작업 파일에는 jobs 목록이 있어야 합니다.")
+    return [JobSpec.from_dict(item, defaults) for item in data]
+
+
+def add_job_arguments(parser):
+    """작업별 덮어쓰기 CLI 옵션 등록"""
+    parser.add_argument("--format", dest="video_format")
+    parser.add_argument("--quality")
+    parser.add_argument("--resolution", dest="preferred_quality")
+    parser.add_argument("--audio-only", action="store_true", default=None)
+    parser.add_argument("--cookies-file")
+    parser.add_argument("--cookies-browser")
+    parser.add_argument("--proxy")
+    parser.add_argument("--deadline", type=float)
+    parser.add_argument("--byte-budget", type=parse_size)
+    parser.add_argument("--sections")
+    parser.add_argument("--precise-cuts", action="store_true", default=None)
+    parser.add_argument("--outputs")
+
+
+def add_batch_arguments(parser):
+    """작업 묶음(작업 파일/URL 파일) 실행용 CLI 옵션 등록 (apply_batch_targets가 읽음)"""
+    parser.add_argument("--job-file")
+    parser.add_argument("--url-file")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-deadline", type=float)
+    parser.add_argument("--batch-byte-budget", type=parse_size)
+
+
+def spec_from_args(url, args):
+    """CLI 인자로 JobSpec 생성"""
+    return JobSpec(
+        url=url,
+        download_path=args.download_path,
+        video_format=args.video_format,
+        quality=args.quality,
+        preferred_quality=args.preferred_quality,
+        audio_only=args.audio_only,
+        cookies_file=args.cookies_file,
+        cookies_browser=args.cookies_browser,
+        proxy=args.proxy,
+        player_client=args.player_client,
+        deadline=args.deadline,
+        byte_budget=args.byte_budget,
+        sections=args.sections,
+        precise_cuts=args.precise_cuts,
+        outputs=args.outputs,
+    )
+
+
+def apply_batch_targets(specs, args):
+    """작업 묶음 전체의 목표 시간/용량을 작업별 한도로 나눠 적용
+    동시 실행 수만큼 작업이 나란히 진행되므로 작업 하나의 목표 시간은
+    batch_deadline * min(workers, 작업 수) / 작업 수로 계산합니다.
+    작업에 이미 지정된 한도는 그대로 둡니다."""
+    count = len(specs)
+    if not count or not (args.batch_deadline or args.batch_byte_budget):
+        return specs
+    deadline = None
+    if args.batch_deadline:
+        deadline = args.batch_deadline * min(max(1, args.workers), count) / count
+    byte_budget = args.batch_byte_budget // count if args.batch_byte_budget else None
+    return [
+        replace(
+            spec,
+            deadline=spec.deadline if spec.deadline is not None else deadline,
+            byte_budget=spec.byte_budget if spec.byte_budget is not None else byte_budget,
+        )
+        for spec in specs
+    ]
+
+
+def parse_size(text):
+    """'500M', '2G', '1048576' 같은 용량 문자열을 바이트로 변환"""
+    text = str(text).strip().upper().removesuffix("B")
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    multiplier = units.get(text[-1:], 1)
+    if text[-1:] in units:
+        text = text[:-1]
+    try:
+        return int(float(text) * multiplier)
+    except ValueError:
+        raise ValueError(f"용량 형식이 올바르지 않습니다: {text!r}") from None
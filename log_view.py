@@ -0,0 +1,219 @@
+"""
+상태 로그 모델/뷰 모듈 (고정 크기 링 버퍼 + 일정 주기 일괄 갱신)
+"""
+import logging
+import platform
+import queue
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QListView, QVBoxLayout, QWidget
+
+JOB_ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def default_log_dir():
+    """회전 로그 파일을 저장할 폴더 (설정 파일과 같은 규칙)"""
+    if platform.system() == "Windows":
+        return Path.home() / "youtube_downloader_logs"
+    return Path.home() / ".youtube_downloader_logs"
+
+
+def create_file_logger(log_dir=None, max_bytes=5 * 1024 * 1024, backup_count=3):
+    """백그라운드 스레드에서 회전 파일에 기록하는 로거와 리스너 반환
+    폴더를 만들 수 없으면 (None, None)을 반환합니다."""
+    log_dir = Path(log_dir) if log_dir else default_log_dir()
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_dir / "status.log",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+    except OSError:
+        return None, None
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, file_handler)
+    listener.start()
+    logger = logging.getLogger(f"youtube_downloader.status.{id(listener)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(QueueHandler(records))
+    return logger, listener
+
+
+class LogModel(QAbstractListModel):
+    """최근 메시지만 보관하는 링 버퍼 로그 모델
+    append()는 어느 스레드에서나 호출할 수 있으며, 실제 행 추가는 GUI 스레드의
+    flush()에서 한 번에 처리합니다.
+    job_ids는 버퍼에 메시지가 남아 있는 작업 번호만 처음 나온 순서대로 돌려줍니다."""
+
+    def __init__(self, max_entries=5000, file_logger=None, parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        self.file_logger = file_logger
+        self._entries = deque()
+        # deque.append/popleft는 스레드 안전하므로 별도 잠금 없이 사용
+        self._pending = deque()
+        # 작업 번호 -> 버퍼에 남은 줄 수 (dict 순서 = 처음 나온 순서)
+        self._line_counts = {}
+
+    @property
+    def job_ids(self):
+        return list(self._line_counts)
+
+    def append(self, message, job_id=None):
+        """메시지를 대기열에 추가 (다음 flush에서 표시)"""
+        self._pending.append((time.time(), job_id, str(message)))
+
+    def flush(self):
+        """대기 중인 메시지를 한 번에 모델에 반영하고 추가된 개수 반환"""
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        if not batch:
+            return 0
+
+        if self.file_logger is not None:
+            for _timestamp, job_id, message in batch:
+                prefix = f"[#{job_id}] " if job_id is not None else ""
+                self.file_logger.info(prefix + message.strip("\n"))
+
+        batch = batch[-self.max_entries:]
+        # 새 줄을 먼저 세어 두면 계속 기록 중인 작업은 밀려나는 줄이 있어도 순서가 유지됨
+        for _timestamp, job_id, _message in batch:
+            if job_id is not None:
+                self._line_counts[job_id] = self._line_counts.get(job_id, 0) + 1
+        overflow = len(self._entries) + len(batch) - self.max_entries
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                _timestamp, job_id, _message = self._entries.popleft()
+                if job_id is not None:
+                    self._forget_line(job_id)
+            self.endRemoveRows()
+
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._entries.extend(batch)
+        self.endInsertRows()
+        return len(batch)
+
+    def _forget_line(self, job_id):
+        remaining = self._line_counts[job_id] - 1
+        if remaining:
+            self._line_counts[job_id] = remaining
+        else:
+            del self._line_counts[job_id]
+
+    def messages(self):
+        """현재 보관 중인 메시지 목록"""
+        return [message for _timestamp, _job_id, message in self._entries]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        timestamp, job_id, message = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = message.strip("\n")
+            return f"[#{job_id}] {text}" if job_id is not None else text
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+        if role == JOB_ID_ROLE:
+            return job_id
+        return None
+
+
+class JobFilterProxyModel(QSortFilterProxyModel):
+    """선택한 작업의 메시지만 보여주는 필터"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.job_id = None
+
+    def set_job_id(self, job_id):
+        # invalidateFilter()는 Qt 6.10부터 사용 중단 예정이므로 변경 구간을 알리는 방식 사용
+        self.beginFilterChange()
+        self.job_id = job_id
+        self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.job_id is None:
+            return True
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return index.data(JOB_ID_ROLE) == self.job_id
+
+
+class LogView(QWidget):
+    """가상화된 목록 뷰 + 작업 필터, 일정 프레임 주기로 모델을 갱신"""
+
+    def __init__(self, model, fps=30, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.proxy = JobFilterProxyModel(self)
+        self.proxy.setSourceModel(model)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("로그 필터:"))
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItem("전체 작업", None)
+        self.filter_combo.currentIndexChanged.connect(self.on_filter_changed)
+        filter_layout.addWidget(self.filter_combo)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.list_view.setWordWrap(False)
+        layout.addWidget(self.list_view)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(1, int(1000 / fps)))
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+    def flush(self):
+        """대기 중인 메시지를 반영하고 맨 아래를 보고 있었다면 계속 따라감"""
+        scrollbar = self.list_view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        if not self.model.flush():
+            return
+        self.sync_filter_items()
+        if at_bottom:
+            self.list_view.scrollToBottom()
+
+    def sync_filter_items(self):
+        """필터 목록을 버퍼에 메시지가 남은 작업으로 맞춤 (지금 선택한 작업은 유지)"""
+        job_ids = self.model.job_ids
+        live = set(job_ids)
+        selected = self.filter_combo.currentData()
+        listed = set()
+        for index in range(self.filter_combo.count() - 1, 0, -1):
+            job_id = self.filter_combo.itemData(index)
+            if job_id in live or job_id == selected:
+                listed.add(job_id)
+            else:
+                self.filter_combo.removeItem(index)
+        for job_id in job_ids:
+            if job_id not in listed:
+                self.filter_combo.addItem(f"작업 #{job_id}", job_id)
+
+    def on_filter_changed(self, _index):
+        self.proxy.set_job_id(self.filter_combo.currentData())
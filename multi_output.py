@@ -0,0 +1,124 @@
+"""
+한 번 받은 영상에서 여러 출력 파일을 만드는 모듈
+원본 파일을 한 번만 읽는 ffmpeg 실행 하나로 컨테이너 변환, 오디오 추출, 저해상도 사본을
+동시에 만듭니다.
+"""
+import os
+
+from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+from yt_dlp.utils import prepend_extension
+
+# 출력 이름 -> 확장자, 포함할 스트림, 인코딩 설정
+# height가 있으면 해당 높이로 줄인 H.264 사본, audio_codec이 없으면 가능할 때 스트림 복사
+OUTPUT_PROFILES = {
+    "mp4": {"ext": "mp4", "video": True, "audio": True},
+    "mkv": {"ext": "mkv", "video": True, "audio": True},
+    "m4a": {"ext": "m4a", "video": False, "audio": True},
+    "mp3": {"ext": "mp3", "video": False, "audio": True, "audio_codec": "libmp3lame"},
+    "720p": {"ext": "mp4", "video": True, "audio": True, "height": 720},
+    "480p": {"ext": "mp4", "video": True, "audio": True, "height": 480},
+    "360p": {"ext": "mp4", "video": True, "audio": True, "height": 360},
+}
+
+
+def parse_output_profiles(text):
+    """'m4a, 480p' 형식의 문자열을 출력 이름 목록으로 변환 (알 수 없는 이름이면 ValueError)"""
+    names = []
+    for name in str(text or "").split(','):
+        name = name.strip().lower()
+        if not name or name in names:
+            continue
+        if name not in OUTPUT_PROFILES:
+            available = ", ".join(OUTPUT_PROFILES)
+            raise ValueError(f"알 수 없는 출력 형식입니다: {name} (사용 가능: {available})")
+        names.append(name)
+    return names
+
+
+def output_path_for(source_path, name):
+    """출력 이름에 해당하는 파일 경로 (저해상도 사본은 '제목.480p.mp4')"""
+    profile = OUTPUT_PROFILES[name]
+    base = os.path.splitext(source_path)[0]
+    if profile.get("height"):
+        return f"{base}.{name}.{profile['ext']}"
+    return f"{base}.{profile['ext']}"
+
+
+def output_args(name, info):
+    """출력 하나에 대한 ffmpeg 옵션 (원본 스트림 정보로 복사/인코딩 결정)"""
+    profile = OUTPUT_PROFILES[name]
+    args = []
+    if profile["video"]:
+        args += ["-map", "0:v:0"]
+    if profile["audio"]:
+        args += ["-map", "0:a:0?"]
+    if not profile["video"]:
+        args += ["-vn"]
+
+    height = profile.get("height")
+    if height:
+        args += [
+            "-vf", f"scale=-2:'min({height},ih)'",
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "23",
+        ]
+    elif profile["video"]:
+        args += ["-c:v", "copy"]
+
+    audio_codec = profile.get("audio_codec")
+    source_acodec = str(info.get("acodec") or "")
+    if audio_codec:
+        args += ["-c:a", audio_codec, "-q:a", "2"]
+    elif profile["ext"] in ("mp4", "m4a") and not source_acodec.startswith("mp4a"):
+        # mp4 계열에 넣을 수 없는 오디오(opus 등)는 AAC로 변환
+        args += ["-c:a", "aac", "-b:a", "192k"]
+    else:
+        args += ["-c:a", "copy"]
+    return args
+
+
+class MultiOutputPP(FFmpegPostProcessor):
+    """다운로드(및 병합)가 끝난 파일에서 요청한 출력을 한 번의 ffmpeg 실행으로 생성"""
+
+    def __init__(self, downloader=None, profiles=()):
+        super().__init__(downloader)
+        self.profiles = list(profiles)
+
+    @classmethod
+    def pp_key(cls):
+        return "MultiOutput"
+
+    def run(self, info):
+        source = info["filepath"]
+        has_video = info.get("vcodec") not in (None, "none")
+        outputs = []
+        for name in self.profiles:
+            profile = OUTPUT_PROFILES[name]
+            path = output_path_for(source, name)
+            if path == source:
+                # 원본이 이미 요청한 형식이면 그대로 사용
+                outputs.append((name, path, None))
+                continue
+            if profile["video"] and not has_video:
+                self.report_warning(f"오디오만 받은 파일이라 {name} 출력을 건너뜁니다.")
+                continue
+            outputs.append((name, path, output_args(name, info)))
+
+        pending = [(name, path, args) for name, path, args in outputs if args is not None]
+        if pending:
+            self.to_screen(f"원본을 한 번 읽어 {len(pending)}개 출력 생성: {', '.join(name for name, _, _ in pending)}")
+            temp_paths = [prepend_extension(path, "temp") for _, path, _ in pending]
+            try:
+                self.real_run_ffmpeg(
+                    [(source, [])],
+                    [(temp, args) for temp, (_, _, args) in zip(temp_paths, pending)],
+                )
+            except Exception:
+                for temp in temp_paths:
+                    if os.path.exists(temp):
+                        os.remove(temp)
+                raise
+            for temp, (_, path, _) in zip(temp_paths, pending):
+                os.replace(temp, path)
+
+        info["multi_output_files"] = {name: path for name, path, _ in outputs}
+        return [], info
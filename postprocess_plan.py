@@ -0,0 +1,180 @@
+"""
+후처리 단계 통합 모듈
+스트림 병합, 자막 넣기, 메타데이터, 표지 이미지를 각각 파일 전체를 다시 쓰는 대신
+스트림 복사 ffmpeg 실행 한 번으로 처리하고 결과를 원자적으로 교체합니다.
+"""
+import mimetypes
+import os
+
+import yt_dlp
+from yt_dlp.postprocessor import FFmpegMergerPP
+from yt_dlp.postprocessor.ffmpeg import FFmpegPostProcessor
+from yt_dlp.utils import prepend_extension
+
+STEP_MERGE = "merge"
+STEP_SUBTITLES = "subtitles"
+STEP_METADATA = "metadata"
+STEP_THUMBNAIL = "thumbnail"
+
+MP4_EXTS = frozenset(("mp4", "m4a", "mov", "m4v"))
+
+# ffmpeg 메타데이터 키 -> yt-dlp 정보 필드 (앞에서부터 처음 값이 있는 필드 사용)
+METADATA_FIELDS = (
+    ("title", ("title", "track")),
+    ("artist", ("artist", "creator", "uploader", "channel")),
+    ("date", ("upload_date", "release_date")),
+    ("description", ("description",)),
+    ("comment", ("webpage_url",)),
+)
+
+
+class PostProcessPlan:
+    """한 번의 ffmpeg 실행에 들어갈 입력/옵션과 끝난 뒤 지울 파일 목록"""
+
+    def __init__(self, ext):
+        self.ext = ext
+        self.inputs = []
+        self.output_args = ["-c", "copy"]
+        self.cleanup = []
+        self.steps = []
+
+    def add_input(self, path):
+        self.inputs.append(path)
+        return len(self.inputs) - 1
+
+    def input_opts(self):
+        return [(path, []) for path in self.inputs]
+
+
+def build_plan(info, sources, steps, aac_fixup=None):
+    """병합할 원본 파일과 요청한 단계로 실행 계획 생성
+    aac_fixup(fmt)가 True인 오디오에는 yt-dlp 병합과 같이 aac_adtstoasc를 적용합니다."""
+    ext = (info.get("ext") or os.path.splitext(info["filepath"])[1].lstrip(".")).lower()
+    plan = PostProcessPlan(ext)
+    formats = info.get("requested_formats") or [info]
+    video_count = 0
+    audio_count = 0
+    for index, source in enumerate(sources):
+        plan.add_input(source)
+        fmt = formats[index] if index < len(formats) else {}
+        has_video = fmt.get("vcodec") not in (None, "none")
+        has_audio = fmt.get("acodec") not in (None, "none")
+        # 정보가 없는 입력은 비디오/오디오 모두 있을 수 있다고 보고 선택적으로 지정
+        if has_video or not has_audio:
+            plan.output_args += ["-map", f"{index}:v:0?"]
+            video_count += 1 if has_video else 0
+        if has_audio or not has_video:
+            plan.output_args += ["-map", f"{index}:a:0?"]
+            if has_audio and aac_fixup is not None and aac_fixup(fmt):
+                plan.output_args += [f"-bsf:a:{audio_count}", "aac_adtstoasc"]
+            audio_count += 1 if has_audio else 0
+    if len(sources) > 1:
+        plan.steps.append(STEP_MERGE)
+
+    if STEP_SUBTITLES in steps and video_count:
+        subtitle_index = 0
+        for lang, subtitle in (info.get("requested_subtitles") or {}).items():
+            path = subtitle.get("filepath")
+            if not path or not os.path.exists(path):
+                continue
+            input_index = plan.add_input(path)
+            plan.output_args += [
+                "-map", f"{input_index}:0",
+                f"-metadata:s:s:{subtitle_index}", f"language={lang}",
+            ]
+            subtitle_index += 1
+            plan.cleanup.append(path)
+        if subtitle_index:
+            plan.output_args += ["-c:s", "mov_text" if plan.ext in MP4_EXTS else "copy"]
+            plan.steps.append(STEP_SUBTITLES)
+
+    if STEP_METADATA in steps:
+        for key, fields in METADATA_FIELDS:
+            value = next((info[field] for field in fields if info.get(field)), None)
+            if value is None:
+                continue
+            if key == "date" and len(str(value)) == 8:
+                value = f"{value[:4]}-{value[4:6]}-{value[6:]}"
+            plan.output_args += ["-metadata", f"{key}={value}"]
+        plan.steps.append(STEP_METADATA)
+
+    thumbnails = [t for t in info.get("thumbnails") or () if t.get("filepath")]
+    if STEP_THUMBNAIL in steps and thumbnails and os.path.exists(thumbnails[-1]["filepath"]):
+        path = thumbnails[-1]["filepath"]
+        if plan.ext in MP4_EXTS:
+            input_index = plan.add_input(path)
+            # 표지 이미지는 작으므로 mp4가 받는 JPEG로 다시 인코딩
+            plan.output_args += [
+                "-map", f"{input_index}:0",
+                f"-c:v:{video_count}", "mjpeg",
+                f"-disposition:v:{video_count}", "attached_pic",
+            ]
+        elif plan.ext == "mkv":
+            mimetype = mimetypes.guess_type(path)[0] or "image/jpeg"
+            plan.output_args += ["-attach", path, "-metadata:s:t:0", f"mimetype={mimetype}"]
+        else:
+            path = None
+        if path:
+            plan.cleanup.append(path)
+            plan.steps.append(STEP_THUMBNAIL)
+    return plan
+
+
+class FusedPostProcessor(FFmpegPostProcessor):
+    """병합/자막/메타데이터/표지를 한 번에 처리하는 후처리기"""
+
+    def __init__(self, downloader=None, steps=()):
+        super().__init__(downloader)
+        self.steps = frozenset(steps)
+
+    @classmethod
+    def pp_key(cls):
+        return "FusedPostProcess"
+
+    def run(self, info):
+        target = info["filepath"]
+        sources = info.pop("__files_to_merge", None) or [target]
+        plan = build_plan(info, sources, self.steps, self._needs_aac_fixup)
+        if not plan.steps:
+            return [], info
+
+        temp_path = prepend_extension(target, "temp")
+        self.to_screen(f"후처리 한 번에 실행 ({', '.join(plan.steps)}): {target}")
+        try:
+            self.real_run_ffmpeg(plan.input_opts(), [(temp_path, plan.output_args)])
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        os.replace(temp_path, target)
+        info["fused_postprocess_steps"] = plan.steps
+        leftovers = [path for path in sources if path != target] + plan.cleanup
+        return leftovers, info
+
+    def _needs_aac_fixup(self, fmt):
+        return (
+            str(fmt.get("protocol") or "").startswith("m3u8")
+            and bool(fmt.get("filepath"))
+            and self.get_audio_codec(fmt["filepath"]) == "aac"
+        )
+
+
+class FusedYoutubeDL(yt_dlp.YoutubeDL):
+    """yt-dlp의 기본 병합 후처리를 통합 후처리기로 바꿔 실행하는 YoutubeDL"""
+
+    def __init__(self, params=None, steps=(), **kwargs):
+        super().__init__(params, **kwargs)
+        self.fused_steps = frozenset(steps)
+
+    def post_process(self, filename, info, files_to_move=None):
+        fused = FusedPostProcessor(self, self.fused_steps)
+        postprocessors = list(info.get("__postprocessors") or ())
+        for index, pp in enumerate(postprocessors):
+            if isinstance(pp, FFmpegMergerPP):
+                # 병합 위치에서 실행해 이후 보정(fixup) 단계는 그대로 최종 파일에 적용
+                postprocessors[index] = fused
+                break
+        else:
+            postprocessors.insert(0, fused)
+        info["__postprocessors"] = postprocessors
+        return super().post_process(filename, info, files_to_move)
@@ -0,0 +1,210 @@
+"""
+영상 정보 미리 가져오기 모듈
+URL을 붙여넣거나 대기열에 넣는 순간 백그라운드에서 추출해 두고, 다운로드를 시작하면
+같은 추출 결과로 바로 전송을 시작합니다.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from utils import parse_video_url
+
+# 추출 결과의 스트림 주소가 만료되기 전까지만 재사용
+INFO_TTL = 10 * 60
+
+
+def info_cache_key(url, ydl_opts):
+    """추출 결과가 같은 조건 (영상 키, 추출에 영향을 주는 옵션), 지원하지 않는 URL이면 None
+    YouTube 스트림 주소는 요청한 IP에 묶이므로 프록시가 다르면 별도로 취급합니다."""
+    try:
+        video_key = parse_video_url(url)[2]
+    except ValueError:
+        return None
+    return (
+        video_key,
+        ydl_opts.get('proxy'),
+        repr(ydl_opts.get('extractor_args')),
+        bool(ydl_opts.get('cookiefile') or ydl_opts.get('cookiesfrombrowser')),
+        ydl_opts.get('noplaylist'),
+        ydl_opts.get('playlist_items'),
+    )
+
+
+class InfoCache:
+    """최근 추출 결과 (오래된 것부터 버림)"""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ttl=INFO_TTL, max_entries=32, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """프로세스 전체에서 공유하는 추출 결과"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    def get(self, key):
+        """유효한 결과의 복사본, 없으면 None (yt-dlp가 처리하면서 수정하므로 복사해서 반환)"""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, info = entry
+            if self.clock() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(info)
+
+    def put(self, key, info):
+        if key is None or not info:
+            return
+        info = copy.deepcopy(info)
+        with self._lock:
+            self._entries[key] = (self.clock(), info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def entries_for(self, video_key):
+        """같은 영상의 유효한 (키, 결과) 목록 (작업 프로세스에 넘김)"""
+        now = self.clock()
+        with self._lock:
+            return [
+                (key, info) for key, (stored_at, info) in self._entries.items()
+                if key[0] == video_key and now - stored_at < self.ttl
+            ]
+
+    def forget(self, key):
+        """다운로드가 실패한 결과 삭제 (다음 시도는 새로 추출)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class MetadataPrefetcher:
+    """낮은 우선순위 미리 가져오기 스레드
+    fetch(url)의 결과를 callback(url, result)으로 넘기고, fetch가 예외를 발생시키면
+    on_error(url, error)로 알립니다. 한 번에 하나만 실행하고, 같은 사이트는 min_interval초
+    간격을 두며, 대기는 max_pending개까지만 두고 오래된 것부터 버립니다.
+    실행 중인 추출은 중간에 멈출 수 없으므로 취소하면 결과만 버립니다."""
+
+    def __init__(self, fetch, max_pending=4, min_interval=2.0, clock=time.monotonic, on_error=None):
+        self.fetch = fetch
+        self.on_error = on_error
+        self.max_pending = max(1, max_pending)
+        self.min_interval = min_interval
+        self.clock = clock
+        self._pending = OrderedDict()
+        self._running_url = None
+        self._running_done = None
+        self._running_cancelled = False
+        self._last_fetch = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def submit(self, url, callback=None):
+        """미리 가져오기 예약, 이미 대기/실행 중이거나 종료했으면 False"""
+        with self._cond:
+            if self._closed or url == self._running_url:
+                return False
+            if url in self._pending:
+                self._pending[url] = callback or self._pending[url]
+                return False
+            self._pending[url] = callback
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="metadata-prefetch", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return True
+
+    def cancel(self, url):
+        """대기 중이면 빼고, 실행 중이면 결과를 버림"""
+        with self._cond:
+            self._pending.pop(url, None)
+            if url == self._running_url:
+                self._running_cancelled = True
+
+    def cancel_all(self):
+        with self._cond:
+            self._pending.clear()
+            if self._running_url is not None:
+                self._running_cancelled = True
+
+    def settle(self, url, timeout=None):
+        """다운로드 시작 전 호출: 대기 중이면 취소하고, 이미 추출 중이면 timeout초까지 대기
+        (같은 영상을 두 번 추출하지 않고 미리 가져온 결과를 이어 씀)
+        추출이 아직 끝나지 않았으면 False를 반환합니다."""
+        with self._cond:
+            self._pending.pop(url, None)
+            done = self._running_done if url == self._running_url else None
+        if done is None:
+            return True
+        return done.wait(timeout)
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+
+    def _site(self, url):
+        try:
+            return parse_video_url(url)[0]
+        except ValueError:
+            return None
+
+    def _next_url(self):
+        """같은 사이트 간격이 지난 가장 최근 요청, 모두 기다려야 하면 (None, 대기 초)"""
+        now = self.clock()
+        wait = None
+        for url in reversed(self._pending):
+            last = self._last_fetch.get(self._site(url))
+            remaining = 0 if last is None else last + self.min_interval - now
+            if remaining <= 0:
+                return url, None
+            wait = remaining if wait is None else min(wait, remaining)
+        return None, wait
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    url, wait = self._next_url()
+                    if url is not None:
+                        break
+                    self._cond.wait(wait)
+                callback = self._pending.pop(url)
+                self._running_url = url
+                self._running_done = threading.Event()
+                self._running_cancelled = False
+                self._last_fetch[self._site(url)] = self.clock()
+            error = None
+            try:
+                result = self.fetch(url)
+            except Exception as e:
+                result, error = None, e
+            with self._cond:
+                cancelled = self._running_cancelled
+                self._running_done.set()
+                self._running_url = None
+                self._running_done = None
+            if error is not None:
+                if self.on_error is not None:
+                    self.on_error(url, error)
+            elif result is not None and callback is not None and not cancelled:
+                callback(url, result)
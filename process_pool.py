@@ -0,0 +1,461 @@
+"""
+작업 프로세스 풀 모듈
+작업 하나를 별도 프로세스에서 실행해 yt-dlp의 CPU 작업(서명 해석, 큰 JSON 파싱 등)이
+GUI와 GIL을 다투지 않게 하고, 추출이 멈추거나 프로세스가 죽어도 앱은 계속 동작하게 합니다.
+작업 프로세스는 진행 상황을 파이프로 보내고, 정해진 수의 작업을 마치면 새 프로세스로 교체됩니다.
+일시 정지/취소 요청은 프로세스마다 둔 공유 메모리 값으로 전달하고, 여러 작업이 함께 써야 하는
+상태(사이트 차단 상태, 디스크 예약 장부, 프록시 측정값, 전송 속도, 브라우저 쿠키, 무결성 캐시)는
+작업 프로세스가 부모에게 요청해 부모의 것을 씁니다.
+"""
+import itertools
+import multiprocessing
+import threading
+import time
+
+from download_queue import CONTROL_CANCEL, CONTROL_PAUSE, INITIAL_STATE
+
+JOBS_PER_WORKER = 20
+SHUTDOWN_TIMEOUT = 5
+CONTROL_POLL_INTERVAL = 0.5
+
+# 공유 메모리에 쓰는 작업 요청 코드
+CONTROL_CODES = {None: 0, CONTROL_PAUSE: 1, CONTROL_CANCEL: 2}
+CONTROL_ACTIONS = {code: action for action, code in CONTROL_CODES.items()}
+
+
+class WorkerError(RuntimeError):
+    """작업 프로세스가 결과를 보내지 못하고 끝남"""
+
+
+class WorkerTimeoutError(WorkerError):
+    """제한 시간 안에 끝나지 않아 작업 프로세스를 종료함"""
+
+
+class WorkerContext:
+    """작업 프로세스 안에서 target이 받는 부모와의 연결
+    yt-dlp가 여러 스레드에서 진행 콜백을 부를 수 있으므로 보내기와 요청은 잠금으로 보호합니다."""
+
+    def __init__(self, conn, control_code):
+        self._conn = conn
+        self._control_code = control_code
+        self._send_lock = threading.Lock()
+        self._call_lock = threading.Lock()
+
+    def report(self, kind, *args):
+        """부모에게 알림 (응답 없음)"""
+        with self._send_lock:
+            self._conn.send((kind,) + args)
+
+    def control(self):
+        """부모가 보낸 일시 정지/취소 요청, 없으면 None"""
+        return CONTROL_ACTIONS.get(self._control_code.value)
+
+    def call(self, name, *args, **kwargs):
+        """부모에게 요청하고 결과를 기다림 (부모 쪽 예외는 WorkerError로 다시 발생)"""
+        with self._call_lock:
+            self.report('call', name, args, kwargs)
+            kind, value = self._conn.recv()
+        if kind == 'call_error':
+            raise WorkerError(value)
+        return value
+
+
+def _worker_main(conn, target, control_code):
+    """작업 프로세스 본체: 작업을 받아 target(payload, worker)을 실행하고 결과를 보냄
+    worker는 WorkerContext입니다."""
+    worker = WorkerContext(conn, control_code)
+    while True:
+        try:
+            payload = conn.recv()
+        except (EOFError, OSError):
+            return
+        if payload is None:
+            return
+        try:
+            result = target(payload, worker)
+        except Exception as e:
+            worker.report('error', f"{type(e).__name__}: {e}")
+        else:
+            worker.report('result', result)
+
+
+class WorkerProcess:
+    """풀의 작업 프로세스 하나"""
+
+    def __init__(self, context, target):
+        self.conn, child_conn = context.Pipe()
+        self.control_code = context.Value('b', 0, lock=False)
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, target, self.control_code), name="download-worker", daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs_done = 0
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def retire(self):
+        """정상 종료 요청 (응답이 없으면 강제 종료)"""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(SHUTDOWN_TIMEOUT)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ProcessWorkerPool:
+    """작업 프로세스 풀
+    run(payload)은 쉬는 프로세스를 쓰거나 새로 띄워 target(payload, worker)을 실행합니다.
+    동시 실행 수는 부르는 쪽(DownloadQueue)이 정하고, 풀은 쉬는 프로세스를 max_workers개까지만 둡니다."""
+
+    def __init__(self, target, max_workers=2, jobs_per_worker=JOBS_PER_WORKER, context=None):
+        self.target = target
+        self.max_workers = max(1, max_workers)
+        self.jobs_per_worker = max(1, jobs_per_worker)
+        # 포크는 Qt/스레드 상태를 그대로 복사하므로 항상 새 인터프리터로 시작
+        self.context = context or multiprocessing.get_context("spawn")
+        self._idle = []
+        self._busy = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def set_max_workers(self, max_workers):
+        with self._lock:
+            self.max_workers = max(1, max_workers)
+            extra = self._idle[self.max_workers:]
+            del self._idle[self.max_workers:]
+        for worker in extra:
+            worker.retire()
+
+    def _acquire(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("종료된 작업 프로세스 풀입니다.")
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    self._busy.add(worker)
+                    return worker
+        worker = WorkerProcess(self.context, self.target)
+        with self._lock:
+            self._busy.add(worker)
+        return worker
+
+    def _release(self, worker):
+        """작업을 마친 프로세스를 쉬게 하거나, 많이 쓴 프로세스는 교체 (메모리 증가 제한)"""
+        worker.jobs_done += 1
+        with self._lock:
+            self._busy.discard(worker)
+            keep = (
+                not self._closed
+                and worker.jobs_done < self.jobs_per_worker
+                and len(self._idle) < self.max_workers
+            )
+            if keep:
+                self._idle.append(worker)
+        if not keep:
+            worker.retire()
+
+    def _discard(self, worker):
+        with self._lock:
+            self._busy.discard(worker)
+        worker.kill()
+
+    def run(self, payload, on_message=None, timeout=None, control=None, on_call=None):
+        """작업 하나를 실행하고 결과 반환
+        작업 중 보낸 메시지는 on_message(kind, *args)로, 요청은 on_call(name, *args)로 처리해
+        결과를 돌려보내고, control()이 반환하는 일시 정지/취소 요청은 CONTROL_POLL_INTERVAL초마다
+        작업 프로세스에 전달합니다.
+        timeout초를 넘기거나 프로세스가 죽으면 그 프로세스를 정리하고 WorkerError를 발생시킵니다."""
+        worker = self._acquire()
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            worker.control_code.value = 0
+            worker.conn.send(payload)
+            while True:
+                if control is not None:
+                    worker.control_code.value = CONTROL_CODES.get(control(), 0)
+                wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if control is not None:
+                    wait = CONTROL_POLL_INTERVAL if wait is None else min(wait, CONTROL_POLL_INTERVAL)
+                if not worker.conn.poll(wait):
+                    if deadline is None or time.monotonic() < deadline:
+                        continue
+                    raise WorkerTimeoutError(f"작업이 {timeout:g}초 안에 끝나지 않아 작업 프로세스를 종료했습니다.")
+                try:
+                    message = worker.conn.recv()
+                except (EOFError, OSError):
+                    worker.process.join(1)
+                    raise WorkerError(
+                        f"작업 프로세스가 비정상 종료되었습니다. (종료 코드 {worker.process.exitcode})"
+                    ) from None
+                kind = message[0]
+                if kind == 'result':
+                    break
+                if kind == 'error':
+                    # 작업 코드의 예외는 프로세스 상태와 무관하므로 프로세스는 계속 사용
+                    self._release(worker)
+                    worker = None
+                    raise WorkerError(message[1])
+                if kind == 'call':
+                    worker.conn.send(self._answer(on_call, *message[1:]))
+                    continue
+                if on_message is not None:
+                    on_message(*message)
+        except BaseException:
+            if worker is not None:
+                self._discard(worker)
+            raise
+        self._release(worker)
+        return message[1]
+
+    @staticmethod
+    def _answer(on_call, name, args, kwargs):
+        if on_call is None:
+            return ('call_error', f"처리할 수 없는 요청입니다: {name}")
+        try:
+            return ('call_result', on_call(name, *args, **kwargs))
+        except Exception as e:
+            return ('call_error', f"{type(e).__name__}: {e}")
+
+    def shutdown(self):
+        """쉬는 프로세스는 정상 종료하고, 실행 중인 프로세스는 강제 종료"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            busy = list(self._busy)
+        for worker in idle:
+            worker.retire()
+        for worker in busy:
+            worker.process.kill()
+
+
+class RemoteJobState:
+    """작업 프로세스 안에서 DownloadJob 대신 쓰는 객체 (상태 변경을 부모에게 보냄)"""
+
+    def __init__(self, job_id, worker, resume_data=None):
+        self.job_id = job_id
+        self.state = INITIAL_STATE
+        self.resume_data = resume_data
+        self._worker = worker
+
+    @property
+    def control(self):
+        """부모가 보낸 일시 정지/취소 요청"""
+        return self._worker.control()
+
+    def update(self, **changes):
+        self.state = self.state._replace(**changes)
+        self._worker.report('state', changes)
+
+    def set_resume_data(self, data):
+        self.resume_data = data
+        self._worker.report('resume_data', data)
+
+
+class RemoteBreakers:
+    """작업 프로세스에서 부모의 차단 상태를 그대로 쓰는 대리 객체
+    시험 작업(HALF_OPEN) 여부처럼 부모 큐가 정한 상태를 읽어야 하므로 기록과 조회 모두 부모에게 요청합니다."""
+
+    def __init__(self, worker):
+        self._worker = worker
+
+    def state(self, key):
+        return self._worker.call('breaker', 'state', key)
+
+    def retry_delay(self, key):
+        return self._worker.call('breaker', 'retry_delay', key)
+
+    def record_success(self, key):
+        self._worker.call('breaker', 'record_success', key)
+
+    def record_failure(self, key):
+        return self._worker.call('breaker', 'record_failure', key)
+
+
+class RemoteProxyPool:
+    """작업 프로세스에서 부모의 ProxyPool.shared(proxies)를 쓰는 대리 객체
+    프록시 측정값과 상태 확인 스레드는 부모 하나에만 둡니다."""
+
+    def __init__(self, worker, proxies):
+        self._worker = worker
+        self._proxies = list(proxies)
+
+    def choose(self, exclude=()):
+        return self._worker.call('proxy', 'choose', self._proxies, exclude=set(exclude))
+
+    def record_success(self, url, latency=None, num_bytes=None, seconds=None):
+        self._worker.call(
+            'proxy', 'record_success', self._proxies, url, latency=latency, num_bytes=num_bytes, seconds=seconds,
+        )
+
+    def record_failure(self, url):
+        self._worker.call('proxy', 'record_failure', self._proxies, url)
+
+
+class RemoteThroughput:
+    """작업 프로세스에서 부모의 ThroughputTracker를 쓰는 대리 객체"""
+
+    def __init__(self, worker):
+        self._worker = worker
+
+    def record(self, host, num_bytes, seconds):
+        self._worker.call('throughput', 'record', host, num_bytes, seconds)
+
+    def rate(self, host):
+        return self._worker.call('throughput', 'rate', host)
+
+
+class RemoteCookieCache:
+    """작업 프로세스에서 부모의 BrowserCookieCache를 쓰는 대리 객체 (브라우저 쿠키는 부모가 한 번만 추출)"""
+
+    def __init__(self, worker):
+        self._worker = worker
+
+    def get(self, browser):
+        return self._worker.call('cookies', 'get', browser)
+
+    def invalidate(self, browser):
+        self._worker.call('cookies', 'invalidate', browser)
+
+
+class RemoteIntegrityCache:
+    """작업 프로세스에서 부모의 IntegrityCache를 쓰는 대리 객체 (캐시 파일은 부모만 씀)"""
+
+    def __init__(self, worker):
+        self._worker = worker
+
+    def lookup(self, path):
+        return self._worker.call('integrity', 'lookup', str(path))
+
+    def store(self, path, key=None, **fields):
+        return self._worker.call('integrity', 'store', str(path), key=key, **fields)
+
+    def forget(self, path):
+        self._worker.call('integrity', 'forget', str(path))
+
+
+class RemoteReservation:
+    """부모 장부에 있는 예약 (쓴 바이트는 일정량 이상 늘었을 때만 부모에게 알림)
+    진행 콜백은 초당 여러 번 불리므로 예약 크기의 1%(최소 1MB)마다, 그리고 예약을 다 썼을 때 보냅니다."""
+    __slots__ = ("reservation_id", "nbytes", "_consumed", "_reported", "_step", "_worker")
+
+    def __init__(self, reservation_id, nbytes, worker):
+        self.reservation_id = reservation_id
+        self.nbytes = nbytes
+        self._consumed = 0
+        self._reported = 0
+        self._step = max(nbytes // 100, 1024 * 1024)
+        self._worker = worker
+
+    @property
+    def consumed(self):
+        return self._consumed
+
+    @consumed.setter
+    def consumed(self, value):
+        self._consumed = value
+        reached_end = value >= self.nbytes and self._reported < self.nbytes
+        if reached_end or abs(value - self._reported) >= self._step:
+            self._reported = value
+            self._worker.report('disk_consumed', self.reservation_id, value)
+
+
+class RemoteDiskLedger:
+    """작업 프로세스에서 부모의 DiskSpaceLedger를 쓰는 대리 객체 (동시 작업끼리 예약이 보이도록)"""
+
+    def __init__(self, worker):
+        self._worker = worker
+
+    def available(self, path):
+        return self._worker.call('disk', 'available', str(path))
+
+    def try_reserve(self, path, nbytes):
+        return self._reservation(self._worker.call('disk', 'try_reserve', str(path), nbytes), nbytes)
+
+    def reserve(self, path, nbytes, timeout=None):
+        return self._reservation(self._worker.call('disk', 'reserve', str(path), nbytes, timeout), nbytes)
+
+    def release(self, reservation):
+        if reservation is not None:
+            self._worker.call('disk', 'release', reservation.reservation_id)
+
+    def _reservation(self, reservation_id, nbytes):
+        return None if reservation_id is None else RemoteReservation(reservation_id, nbytes, self._worker)
+
+
+class ParentServices:
+    """작업 프로세스의 요청을 부모의 공유 객체로 처리 (작업 하나 단위)
+    proxy_pool_func(proxies)는 프록시 목록에 맞는 부모의 프록시 풀을 반환해야 합니다.
+    작업 프로세스가 죽어 해제하지 못한 예약은 close()에서 정리합니다."""
+    METHODS = {
+        'breaker': frozenset(("state", "retry_delay", "record_success", "record_failure")),
+        'disk': frozenset(("available", "try_reserve", "reserve", "release")),
+        'proxy': frozenset(("choose", "record_success", "record_failure")),
+        'throughput': frozenset(("record", "rate")),
+        'cookies': frozenset(("get", "invalidate")),
+        'integrity': frozenset(("lookup", "store", "forget")),
+    }
+
+    def __init__(self, breakers, ledger, proxy_pool_func=None, throughput=None, cookies=None, integrity=None):
+        self.breakers = breakers
+        self.ledger = ledger
+        self.proxy_pool_func = proxy_pool_func
+        self._targets = {'breaker': breakers, 'throughput': throughput, 'cookies': cookies, 'integrity': integrity}
+        self._reservations = {}
+        self._ids = itertools.count(1)
+
+    def call(self, name, method, *args, **kwargs):
+        if method not in self.METHODS.get(name, ()):
+            raise ValueError(f"알 수 없는 요청입니다: {name}.{method}")
+        if name == 'proxy' and self.proxy_pool_func is not None:
+            return getattr(self.proxy_pool_func(args[0]), method)(*args[1:], **kwargs)
+        if name == 'disk':
+            if method == 'available':
+                return self.ledger.available(*args)
+            if method == 'release':
+                self.ledger.release(self._reservations.pop(args[0], None))
+                return None
+            reservation = getattr(self.ledger, method)(*args)
+            if reservation is None:
+                return None
+            reservation_id = next(self._ids)
+            self._reservations[reservation_id] = reservation
+            return reservation_id
+        target = self._targets.get(name)
+        if target is None:
+            raise ValueError(f"처리할 수 없는 요청입니다: {name}.{method}")
+        return getattr(target, method)(*args, **kwargs)
+
+    def consumed(self, reservation_id, value):
+        reservation = self._reservations.get(reservation_id)
+        if reservation is not None:
+            reservation.consumed = value
+
+    def close(self):
+        for reservation in self._reservations.values():
+            self.ledger.release(reservation)
+        self._reservations.clear()
+
+
+class ReportingHistory:
+    """작업 프로세스의 기록 저장소 대신 부모에게 기록을 보냄 (부모의 기록 화면이 바로 갱신됨)"""
+
+    def __init__(self, report):
+        self._report = report
+
+    def record(self, **fields):
+        self._report('history', fields)
@@ -0,0 +1,187 @@
+"""
+프록시 풀 모듈
+여러 프록시의 응답 시간/성공률/전송 속도를 측정해 새 작업을 성능 비율로 배정하고,
+연속으로 실패한 프록시는 잠시 빼 두었다가 상태 확인이 성공하면 다시 사용합니다.
+"""
+import random
+import socket
+import statistics
+import threading
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+DEFAULT_CHECK_URL = "http://www.google.com/generate_204"
+CHECK_INTERVAL = 60
+FAILURES_TO_EJECT = 3
+EJECT_SECONDS = 30
+MAX_EJECT_SECONDS = 600
+EWMA_ALPHA = 0.3
+
+
+def _ewma(previous, value):
+    return value if previous is None else EWMA_ALPHA * value + (1 - EWMA_ALPHA) * previous
+
+
+class ProxyStats:
+    """프록시 하나의 측정값"""
+    __slots__ = (
+        "url", "latency", "throughput", "successes", "failures",
+        "consecutive_failures", "ejected_until", "eject_seconds",
+    )
+
+    def __init__(self, url):
+        self.url = url
+        self.latency = None
+        self.throughput = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.eject_seconds = EJECT_SECONDS
+
+    @property
+    def success_rate(self):
+        # 측정값이 적은 프록시가 한두 번 결과로 극단값을 갖지 않도록 보정
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+    def weight(self, reference_speed=None):
+        """선택 비중: 성공률이 높고 응답이 빠르고 전송이 빠를수록 큼"""
+        speed_factor = 1.0
+        if self.throughput and reference_speed:
+            speed_factor = self.throughput / reference_speed
+        return self.success_rate ** 2 * speed_factor / max(self.latency or 1.0, 0.05)
+
+
+class ProxyPool:
+    """프록시 목록과 측정값, 주기적 상태 확인"""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, proxies=(), check_url=DEFAULT_CHECK_URL, timeout=10,
+                 clock=time.monotonic, rng=random.random):
+        self.check_url = check_url
+        self.timeout = timeout
+        self.clock = clock
+        self.rng = rng
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._checker = None
+        self._stopped = threading.Event()
+        self.set_proxies(proxies)
+
+    @classmethod
+    def shared(cls, proxies):
+        """프로세스 전체에서 공유하는 풀 (처음 만들 때 상태 확인 스레드 시작)"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(proxies)
+                cls._shared_instance.start()
+            else:
+                cls._shared_instance.set_proxies(proxies)
+            return cls._shared_instance
+
+    @property
+    def proxies(self):
+        with self._lock:
+            return list(self._stats)
+
+    def stats(self, url):
+        with self._lock:
+            return self._stats.get(url)
+
+    def set_proxies(self, proxies):
+        """목록 교체 (남아 있는 프록시의 측정값은 유지)"""
+        with self._lock:
+            self._stats = {url: self._stats.get(url) or ProxyStats(url) for url in dict.fromkeys(proxies)}
+
+    def choose(self, exclude=()):
+        """측정 성능에 비례한 무작위 선택
+        exclude(이 작업이 이미 실패한 프록시)를 빼고 고르되, 남는 것이 없으면 무시합니다.
+        모두 빠져 있으면 가장 먼저 돌아올 프록시를 반환합니다. 목록이 비었으면 None."""
+        now = self.clock()
+        with self._lock:
+            stats = list(self._stats.values())
+            if not stats:
+                return None
+            available = [s for s in stats if s.ejected_until <= now]
+            if not available:
+                return min(stats, key=lambda s: s.ejected_until).url
+            candidates = [s for s in available if s.url not in exclude] or available
+            speeds = [s.throughput for s in candidates if s.throughput]
+            reference = statistics.median(speeds) if speeds else None
+            weights = [s.weight(reference) for s in candidates]
+        pick = self.rng() * sum(weights)
+        for candidate, weight in zip(candidates, weights):
+            pick -= weight
+            if pick < 0:
+                return candidate.url
+        return candidates[-1].url
+
+    def record_success(self, url, latency=None, num_bytes=None, seconds=None):
+        """요청 성공 기록 (빠져 있던 프록시는 다시 사용)"""
+        with self._lock:
+            stats = self._stats.get(url)
+            if stats is None:
+                return
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            stats.ejected_until = 0.0
+            stats.eject_seconds = EJECT_SECONDS
+            if latency is not None:
+                stats.latency = _ewma(stats.latency, latency)
+            if num_bytes and seconds:
+                stats.throughput = _ewma(stats.throughput, num_bytes / seconds)
+
+    def record_failure(self, url):
+        """요청 실패 기록, 연속 실패가 쌓이면 일정 시간 선택에서 뺌 (다시 빠질수록 길게)"""
+        with self._lock:
+            stats = self._stats.get(url)
+            if stats is None:
+                return
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            if stats.consecutive_failures >= FAILURES_TO_EJECT and stats.ejected_until <= self.clock():
+                stats.ejected_until = self.clock() + stats.eject_seconds
+                stats.eject_seconds = min(stats.eject_seconds * 2, MAX_EJECT_SECONDS)
+
+    def check(self, url):
+        """상태 확인 요청 하나를 보내고 결과 기록, 응답 시간(초) 또는 실패 시 None"""
+        started = time.monotonic()
+        try:
+            if urlsplit(url).scheme in ("http", "https"):
+                opener = urllib.request.build_opener(urllib.request.ProxyHandler({"http": url, "https": url}))
+                with opener.open(self.check_url, timeout=self.timeout) as response:
+                    response.read(1024)
+            else:
+                # urllib로 보낼 수 없는 SOCKS 프록시는 연결 시간만 확인
+                parts = urlsplit(url)
+                socket.create_connection((parts.hostname, parts.port or 1080), timeout=self.timeout).close()
+        except OSError:
+            self.record_failure(url)
+            return None
+        latency = time.monotonic() - started
+        self.record_success(url, latency=latency)
+        return latency
+
+    def check_all(self):
+        for url in self.proxies:
+            if self._stopped.is_set():
+                return
+            self.check(url)
+
+    def start(self, interval=CHECK_INTERVAL):
+        """백그라운드 상태 확인 시작"""
+        if self._checker is not None:
+            return
+
+        def run():
+            while not self._stopped.is_set():
+                self.check_all()
+                self._stopped.wait(interval)
+
+        self._checker = threading.Thread(target=run, name="proxy-health", daemon=True)
+        self._checker.start()
+
+    def stop(self):
+        self._stopped.set()
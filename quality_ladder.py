@@ -0,0 +1,122 @@
+"""
+전송 속도 기반 화질 자동 조절 모듈
+최근 완료한 작업의 사이트별 전송 속도와 작업의 목표 시간/용량 한도로
+사용자가 정한 최대 해상도 이하에서 한도 안에 들어가는 가장 높은 화질을 고릅니다.
+"""
+import threading
+import time
+from collections import namedtuple
+
+from format_selection import RESOLUTION_CHOICES, preview_choices
+from utils import format_file_size
+
+# choice: 선호 해상도 선택지, selection: select_for_opts 결과, reason: 사용자에게 보여줄 사유
+LadderDecision = namedtuple("LadderDecision", ["choice", "selection", "reason", "limit_bytes"])
+
+
+class ThroughputTracker:
+    """사이트별 최근 전송 속도(바이트/초) 지수 이동 평균"""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, alpha=0.3, max_age=30 * 60):
+        self.alpha = alpha
+        self.max_age = max_age
+        self._rates = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """프로세스 전체에서 공유하는 측정값"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    def record(self, host, num_bytes, seconds):
+        """완료한 전송 하나의 크기와 걸린 시간 기록"""
+        if not host or not num_bytes or not seconds or seconds <= 0:
+            return
+        rate = num_bytes / seconds
+        now = time.monotonic()
+        with self._lock:
+            previous = self._rates.get(host)
+            if previous is not None and now - previous[1] <= self.max_age:
+                rate = self.alpha * rate + (1 - self.alpha) * previous[0]
+            self._rates[host] = (rate, now)
+
+    def rate(self, host):
+        """최근 측정한 전송 속도, 측정값이 없거나 오래되었으면 None"""
+        with self._lock:
+            entry = self._rates.get(host)
+        if entry is None or time.monotonic() - entry[1] > self.max_age:
+            return None
+        return entry[0]
+
+
+def ladder_for(ceiling):
+    """최대 해상도부터 낮은 순서의 선택지 목록"""
+    if ceiling not in RESOLUTION_CHOICES:
+        ceiling = "best"
+    return RESOLUTION_CHOICES[RESOLUTION_CHOICES.index(ceiling):]
+
+
+def choose_rung(choices, ceiling, deadline=None, byte_budget=None, throughput=None):
+    """선택지별 선택 결과(preview_choices)에서 한도에 맞는 가장 높은 화질 선택"""
+    ladder = [choice for choice in ladder_for(ceiling) if choices.get(choice)]
+    # 같은 포맷으로 정해지는 선택지는 실제 해상도에 가까운 아래쪽 이름만 남김
+    ladder = [
+        choice for choice, lower in zip(ladder, ladder[1:] + [None])
+        if lower is None or choices[choice].get('format_id') != choices[lower].get('format_id')
+    ]
+    if not ladder:
+        return LadderDecision(ceiling, None, "선택 가능한 포맷이 없어 기본 설정을 사용합니다.", None)
+
+    limits = []
+    if byte_budget:
+        limits.append(byte_budget)
+    if deadline and throughput:
+        limits.append(throughput * deadline)
+    if not limits:
+        reason = (
+            "측정된 전송 속도가 없어 최대 해상도를 사용합니다."
+            if deadline
+            else "한도가 없어 최대 해상도를 사용합니다."
+        )
+        return LadderDecision(ladder[0], choices[ladder[0]], reason, None)
+
+    limit_bytes = min(limits)
+    budget_note = _describe_limit(limit_bytes, deadline, byte_budget, throughput)
+    for choice in ladder:
+        estimated = choices[choice]['estimated_bytes']
+        if estimated is not None and estimated <= limit_bytes:
+            if choice == ladder[0]:
+                reason = f"최대 해상도가 한도 안에 들어갑니다. ({budget_note})"
+            else:
+                reason = f"예상 크기가 한도 안에 들어가는 가장 높은 화질입니다. ({budget_note})"
+            return LadderDecision(choice, choices[choice], reason, limit_bytes)
+    lowest = ladder[-1]
+    return LadderDecision(
+        lowest,
+        choices[lowest],
+        f"한도 안에 들어가는 화질이 없어 가장 낮은 화질을 사용합니다. ({budget_note})",
+        limit_bytes,
+    )
+
+
+def choose_for_info(info, config, host=None, is_youtube=False, tracker=None):
+    """추출한 영상 정보와 설정의 목표 시간/용량 한도로 화질 선택"""
+    deadline, byte_budget = config.get_quality_target()
+    throughput = (tracker or ThroughputTracker.shared()).rate(host) if deadline else None
+    ceiling = config.get_preferred_quality()
+    choices = preview_choices(info, config, is_youtube, ladder_for(ceiling))
+    return choose_rung(choices, ceiling, deadline, byte_budget, throughput)
+
+
+def _describe_limit(limit_bytes, deadline, byte_budget, throughput):
+    parts = [f"한도 {format_file_size(limit_bytes)}"]
+    if deadline and throughput:
+        parts.append(f"목표 {int(deadline)}초 x {format_file_size(throughput)}/s")
+    if byte_budget:
+        parts.append(f"용량 한도 {format_file_size(byte_budget)}")
+    return ", ".join(parts)
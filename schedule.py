@@ -0,0 +1,146 @@
+"""
+시간대별 다운로드 정책 모듈
+하루를 시간대로 나눠 시간대마다 동시 실행 수와 전체 전송 속도 한도를 둡니다.
+예: '09-18 1 2M; 18-09 8'은 업무 시간에는 한 개씩 2MB/s로, 밤에는 8개까지 제한 없이 받습니다.
+어느 시간대에도 속하지 않는 시각에는 기본 동시 실행 수를 쓰고 속도는 제한하지 않습니다.
+"""
+import re
+from datetime import datetime, timedelta
+
+MINUTES_PER_DAY = 24 * 60
+RATE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+_TIME_PATTERN = re.compile(r"^(\d{1,2})(?::(\d{2}))?$")
+_RATE_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)\s*([KMG]?)(?:I?B)?(?:/S)?$", re.IGNORECASE)
+
+
+def _parse_time(text):
+    """'9', '09:30', '24' -> 자정부터의 분"""
+    match = _TIME_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"시각 형식이 올바르지 않습니다: {text} (예: 09:00)")
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    if hour > 24 or minute > 59 or (hour == 24 and minute):
+        raise ValueError(f"시각 범위가 올바르지 않습니다: {text}")
+    return hour * 60 + minute
+
+
+def parse_rate(text):
+    """'2M', '500K', '1.5MB/s' -> 초당 바이트, '0'이나 '-'이면 None (제한 없음)"""
+    text = str(text or "").strip()
+    if text in ("", "-", "0"):
+        return None
+    match = _RATE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"속도 형식이 올바르지 않습니다: {text} (예: 2M, 500K)")
+    rate = int(float(match.group(1)) * RATE_UNITS[match.group(2).upper()])
+    return rate or None
+
+
+def format_rate(rate):
+    if not rate:
+        return "0"
+    for unit in ("G", "M", "K"):
+        if rate % RATE_UNITS[unit] == 0:
+            return f"{rate // RATE_UNITS[unit]}{unit}"
+    return str(rate)
+
+
+class TimeWindow:
+    """시간대 하나 (end가 start보다 작으면 자정을 넘는 시간대)"""
+    __slots__ = ("start", "end", "max_jobs", "rate_limit")
+
+    def __init__(self, start, end, max_jobs, rate_limit=None):
+        self.start = start
+        self.end = end
+        self.max_jobs = max_jobs
+        self.rate_limit = rate_limit
+
+    def contains(self, minute):
+        if self.start < self.end:
+            return self.start <= minute < self.end
+        return minute >= self.start or minute < self.end
+
+    @property
+    def job_rate_limit(self):
+        """작업 하나의 속도 한도 (시간대 전체 한도를 동시 실행 수로 나눔), 제한 없으면 None"""
+        if not self.rate_limit:
+            return None
+        return max(1, self.rate_limit // max(1, self.max_jobs))
+
+    def __str__(self):
+        def clock(minute):
+            return f"{minute // 60:02d}:{minute % 60:02d}"
+        return f"{clock(self.start)}-{clock(self.end)} {self.max_jobs} {format_rate(self.rate_limit)}"
+
+
+def parse_schedule(text):
+    """'09-18 1 2M; 18-09 8' 형식의 문자열을 시간대 목록으로 변환 (형식이 틀리면 ValueError)
+    항목은 '시작-끝 동시실행수 [속도]'이고, 동시 실행 수 0은 그 시간대에 새 작업을 시작하지 않음을 뜻합니다."""
+    windows = []
+    for entry in re.split(r"[;\n]+", str(text or "")):
+        parts = entry.split()
+        if not parts:
+            continue
+        if len(parts) not in (2, 3) or parts[0].count("-") != 1:
+            raise ValueError(f"시간대 형식이 올바르지 않습니다: {entry.strip()} (예: 09-18 1 2M)")
+        start_text, end_text = parts[0].split("-")
+        start = _parse_time(start_text) % MINUTES_PER_DAY
+        end = _parse_time(end_text) % MINUTES_PER_DAY
+        if start == end:
+            raise ValueError(f"시작과 끝 시각이 같습니다: {entry.strip()}")
+        try:
+            max_jobs = int(parts[1])
+        except ValueError:
+            raise ValueError(f"동시 실행 수가 올바르지 않습니다: {parts[1]}") from None
+        if max_jobs < 0:
+            raise ValueError(f"동시 실행 수가 올바르지 않습니다: {parts[1]}")
+        windows.append(TimeWindow(start, end, max_jobs, parse_rate(parts[2] if len(parts) == 3 else None)))
+    return windows
+
+
+def format_schedule(windows):
+    return "; ".join(str(window) for window in windows)
+
+
+class DownloadSchedule:
+    """현재 시각에 적용할 시간대 (겹치면 먼저 적은 시간대 사용)"""
+
+    def __init__(self, windows, now=datetime.now):
+        self.windows = list(windows)
+        self.now = now
+
+    def current(self):
+        """지금 적용되는 시간대, 없으면 None"""
+        now = self.now()
+        minute = now.hour * 60 + now.minute
+        for window in self.windows:
+            if window.contains(minute):
+                return window
+        return None
+
+    def max_jobs(self, default):
+        window = self.current()
+        return default if window is None else window.max_jobs
+
+    def job_rate_limit(self):
+        window = self.current()
+        return None if window is None else window.job_rate_limit
+
+    def peak_jobs(self, default):
+        """어느 시간대에서든 필요한 최대 작업 스레드 수"""
+        return max([default] + [window.max_jobs for window in self.windows])
+
+    def seconds_until_change(self):
+        """다음 시간대 경계까지 남은 초 (작업 큐가 그때 다시 확인)"""
+        if not self.windows:
+            return None
+        now = self.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = (now - midnight).total_seconds()
+        remaining = []
+        for window in self.windows:
+            for boundary in (window.start, window.end):
+                seconds = boundary * 60 - elapsed
+                remaining.append(seconds if seconds > 0 else seconds + timedelta(days=1).total_seconds())
+        return min(remaining)
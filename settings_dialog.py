@@ -2,18 +2,33 @@
 설정 다이얼로그 모듈
 """
 from PySide6.QtWidgets import (
-    QDialog, QFormLayout, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout, QComboBox, QCheckBox, QSpinBox, QFileDialog, QTabWidget, QWidget, QGroupBox, QLabel
+    QDialog, QFormLayout, QLineEdit, QPushButton, QHBoxLayout, QVBoxLayout, QComboBox, QCheckBox, QSpinBox, QFileDialog, QTabWidget, QWidget, QGroupBox, QLabel, QMessageBox,
+    QScrollArea, QFrame
 )
 
+from multi_output import parse_output_profiles
+from schedule import format_schedule, parse_schedule
+
 class SettingsDialog(QDialog):
     """설정 다이얼로그 클래스"""
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
         self.setWindowTitle("설정")
-        self.setFixedSize(520, 560)
+        # 항목이 늘어도 화면을 넘지 않도록 높이는 고정하지 않고 각 탭을 스크롤
+        self.setMinimumWidth(520)
+        self.resize(560, 640)
         self.setup_ui()
 
+    @staticmethod
+    def scrollable(widget):
+        """탭 내용을 세로 스크롤 영역에 넣어 반환"""
+        area = QScrollArea()
+        area.setWidgetResizable(True)
+        area.setFrameShape(QFrame.Shape.NoFrame)
+        area.setWidget(widget)
+        return area
+
     def setup_ui(self):
         """UI 설정"""
         layout = QVBoxLayout(self)
@@ -33,6 +48,54 @@ class SettingsDialog(QDialog):
         path_layout.addWidget(path_btn)
         form_general.addRow("다운로드 경로:", path_layout)
 
+        # 스테이징 폴더 (빠른 로컬 디스크에서 받은 뒤 다운로드 경로로 이동)
+        self.staging_edit = QLineEdit(str(self.config.get("staging_path", "") or ""))
+        self.staging_edit.setPlaceholderText("비워 두면 다운로드 경로에 바로 저장")
+        staging_btn = QPushButton("찾아보기")
+        staging_btn.clicked.connect(self.browse_staging_path)
+        staging_layout = QHBoxLayout()
+        staging_layout.addWidget(self.staging_edit)
+        staging_layout.addWidget(staging_btn)
+        form_general.addRow("임시 작업 폴더:", staging_layout)
+
+        self.staging_capacity_spin = QSpinBox()
+        self.staging_capacity_spin.setRange(0, 4096)
+        self.staging_capacity_spin.setSpecialValueText("제한 없음")
+        self.staging_capacity_spin.setValue(int(self.config.get("staging_capacity_gb", 20) or 0))
+        form_general.addRow("임시 작업 폴더 한도(GB):", self.staging_capacity_spin)
+
+        # 디스크 공간 사전 확인 (부족하면 화질을 낮추거나 대기)
+        self.disk_preflight_check = QCheckBox()
+        self.disk_preflight_check.setChecked(self.config.is_disk_preflight_enabled())
+        form_general.addRow("다운로드 전 공간 확인:", self.disk_preflight_check)
+
+        self.min_free_spin = QSpinBox()
+        self.min_free_spin.setRange(0, 1024 * 1024)
+        self.min_free_spin.setSingleStep(100)
+        self.min_free_spin.setValue(int(self.config.get("min_free_space_mb", 500) or 0))
+        self.min_free_spin.setEnabled(self.disk_preflight_check.isChecked())
+        self.disk_preflight_check.toggled.connect(self.min_free_spin.setEnabled)
+        form_general.addRow("최소 여유 공간(MB):", self.min_free_spin)
+
+        # 전송 중 해시 계산과 파일 점검
+        self.verify_check = QCheckBox()
+        self.verify_check.setChecked(self.config.should_verify_downloads())
+        form_general.addRow("다운로드 파일 검증:", self.verify_check)
+
+        self.history_check = QCheckBox()
+        self.history_check.setChecked(self.config.should_record_history())
+        form_general.addRow("다운로드 기록 저장:", self.history_check)
+
+        self.prefetch_check = QCheckBox()
+        self.prefetch_check.setChecked(self.config.should_prefetch_metadata())
+        self.prefetch_check.setToolTip("링크를 붙여넣으면 영상 정보를 미리 가져와 다운로드를 바로 시작합니다.")
+        form_general.addRow("영상 정보 미리 가져오기:", self.prefetch_check)
+
+        self.keep_partial_check = QCheckBox()
+        self.keep_partial_check.setChecked(self.config.should_keep_partial_on_cancel())
+        self.keep_partial_check.setToolTip("취소한 다운로드의 임시 파일을 지우지 않아 나중에 같은 링크로 이어 받을 수 있습니다.")
+        form_general.addRow("취소해도 임시 파일 유지:", self.keep_partial_check)
+
         # 비디오 형식
         self.format_combo = QComboBox()
         self.format_combo.addItems(["mp4", "webm", "mkv"])
@@ -51,6 +114,11 @@ class SettingsDialog(QDialog):
         self.pref_quality_combo.setCurrentText(self.config.get("preferred_quality", "1080p"))
         form_general.addRow("선호 해상도:", self.pref_quality_combo)
 
+        # 추가 출력 (한 번 받은 파일에서 함께 생성)
+        self.outputs_edit = QLineEdit(self.config.get("output_profiles", ""))
+        self.outputs_edit.setPlaceholderText("예: m4a, mp3, 480p (비워 두면 사용 안함)")
+        form_general.addRow("추가 출력 형식:", self.outputs_edit)
+
         # 오디오만 다운로드
         self.audio_only_check = QCheckBox()
         self.audio_only_check.setChecked(self.config.is_audio_only())
@@ -73,13 +141,40 @@ class SettingsDialog(QDialog):
         self.delay_spin.setValue(self.config.get_retry_delay())
         form_general.addRow("재시도 지연 시간(초):", self.delay_spin)
 
+        # 동시 다운로드 수
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 16)
+        self.concurrency_spin.setValue(self.config.get_max_concurrent_downloads())
+        form_general.addRow("동시 다운로드 수:", self.concurrency_spin)
+
+        # 시간대별 동시 실행 수/전체 속도 (정하지 않은 시간에는 위 동시 다운로드 수 사용)
+        self.schedule_edit = QLineEdit(self.config.get("download_schedule", ""))
+        self.schedule_edit.setPlaceholderText("예: 09-18 1 2M; 18-09 8 (비워 두면 사용 안함)")
+        self.schedule_edit.setToolTip(
+            "'시작-끝 동시실행수 [전체 속도]'를 ;로 구분합니다. 동시 실행 수 0은 그 시간에 새 작업을 시작하지 않습니다."
+        )
+        form_general.addRow("시간대별 다운로드:", self.schedule_edit)
+
+        # 화질 자동 조절 (목표 시간/용량 안에 들어가는 가장 높은 해상도 선택)
+        self.deadline_spin = QSpinBox()
+        self.deadline_spin.setRange(0, 24 * 60)
+        self.deadline_spin.setSpecialValueText("사용 안함")
+        self.deadline_spin.setValue(int(self.config.get("quality_deadline_seconds", 0) or 0) // 60)
+        form_general.addRow("작업당 목표 시간(분):", self.deadline_spin)
+
+        self.byte_budget_spin = QSpinBox()
+        self.byte_budget_spin.setRange(0, 1024 * 1024)
+        self.byte_budget_spin.setSpecialValueText("사용 안함")
+        self.byte_budget_spin.setValue(int(self.config.get("quality_byte_budget", 0) or 0) // (1024 * 1024))
+        form_general.addRow("작업당 용량 한도(MB):", self.byte_budget_spin)
+
         # ------------------ 프록시 설정 ------------------
         proxy_group = QGroupBox("프록시 설정 (차단된 사이트 우회)")
         form_proxy = QFormLayout(proxy_group)
 
         self.proxy_mode_combo = QComboBox()
-        self.proxy_mode_combo.addItems(["자동 감지", "수동 설정", "사용 안함"])
-        mode_map = {"auto": "자동 감지", "manual": "수동 설정", "none": "사용 안함"}
+        self.proxy_mode_combo.addItems(["자동 감지", "수동 설정", "프록시 풀", "사용 안함"])
+        mode_map = {"auto": "자동 감지", "manual": "수동 설정", "pool": "프록시 풀", "none": "사용 안함"}
         self.proxy_mode_combo.setCurrentText(mode_map.get(self.config.get("proxy_mode", "auto"), "자동 감지"))
         form_proxy.addRow("프록시 모드:", self.proxy_mode_combo)
 
@@ -87,6 +182,11 @@ class SettingsDialog(QDialog):
         self.proxy_url_edit.setPlaceholderText("http://127.0.0.1:1080")
         form_proxy.addRow("프록시 주소:", self.proxy_url_edit)
 
+        # 여러 프록시를 상태 확인 결과에 따라 작업마다 나눠 사용
+        self.proxy_pool_edit = QLineEdit(self.config.get("proxy_pool", ""))
+        self.proxy_pool_edit.setPlaceholderText("http://10.0.0.1:3128, socks5://10.0.0.2:1080")
+        form_proxy.addRow("프록시 목록:", self.proxy_pool_edit)
+
         # 감지된 프록시 표시
         detected = self.config._detect_system_proxy()
         if detected:
@@ -99,7 +199,7 @@ class SettingsDialog(QDialog):
 
         form_general.addRow(proxy_group)
 
-        self.tab_widget.addTab(tab_general, "기본 설정")
+        self.tab_widget.addTab(self.scrollable(tab_general), "기본 설정")
 
         # ------------------ 탭 2: 자막/재생목록 ------------------
         tab_advanced = QWidget()
@@ -114,6 +214,19 @@ class SettingsDialog(QDialog):
         self.subtitle_lang_edit = QLineEdit(self.config.get("subtitle_language", "ko"))
         form_advanced.addRow("자막 언어 코드:", self.subtitle_lang_edit)
 
+        # 영상 파일에 넣을 항목 (병합과 함께 한 번에 처리)
+        self.embed_subtitles_check = QCheckBox()
+        self.embed_subtitles_check.setChecked(self.config.get("embed_subtitles", False))
+        form_advanced.addRow("자막을 영상에 넣기:", self.embed_subtitles_check)
+
+        self.embed_metadata_check = QCheckBox()
+        self.embed_metadata_check.setChecked(self.config.get("embed_metadata", False))
+        form_advanced.addRow("메타데이터 넣기:", self.embed_metadata_check)
+
+        self.embed_thumbnail_check = QCheckBox()
+        self.embed_thumbnail_check.setChecked(self.config.get("embed_thumbnail", False))
+        form_advanced.addRow("표지 이미지 넣기:", self.embed_thumbnail_check)
+
         # 재생목록 다운로드
         self.playlist_check = QCheckBox()
         self.playlist_check.setChecked(self.config.get("playlist_download", False))
@@ -124,8 +237,33 @@ class SettingsDialog(QDialog):
         self.playlist_max_spin.setRange(1, 100)
         self.playlist_max_spin.setValue(self.config.get("max_playlist_items", 10))
         form_advanced.addRow("재생목록 최대 영상 수:", self.playlist_max_spin)
-        
-        self.tab_widget.addTab(tab_advanced, "자막/재생목록")
+
+        # 작업 프로세스 (추출이 멈추거나 죽어도 앱은 계속 동작)
+        worker_group = QGroupBox("작업 프로세스")
+        form_worker = QFormLayout(worker_group)
+        self.worker_check = QCheckBox()
+        self.worker_check.setChecked(self.config.use_worker_processes())
+        self.worker_check.setToolTip("작업마다 별도 프로세스에서 실행해 화면이 느려지거나 멈추지 않게 합니다.")
+        form_worker.addRow("별도 프로세스에서 실행:", self.worker_check)
+
+        self.worker_timeout_spin = QSpinBox()
+        self.worker_timeout_spin.setRange(0, 24 * 60)
+        self.worker_timeout_spin.setSpecialValueText("제한 없음")
+        self.worker_timeout_spin.setValue(int(self.config.get("worker_job_timeout_minutes", 0) or 0))
+        form_worker.addRow("작업 제한 시간(분):", self.worker_timeout_spin)
+
+        self.worker_recycle_spin = QSpinBox()
+        self.worker_recycle_spin.setRange(1, 1000)
+        self.worker_recycle_spin.setValue(self.config.get_worker_recycle_jobs())
+        form_worker.addRow("프로세스 교체 주기(작업 수):", self.worker_recycle_spin)
+
+        self.worker_timeout_spin.setEnabled(self.worker_check.isChecked())
+        self.worker_recycle_spin.setEnabled(self.worker_check.isChecked())
+        self.worker_check.toggled.connect(self.worker_timeout_spin.setEnabled)
+        self.worker_check.toggled.connect(self.worker_recycle_spin.setEnabled)
+        form_advanced.addRow(worker_group)
+
+        self.tab_widget.addTab(self.scrollable(tab_advanced), "자막/재생목록")
 
         # ------------------ 탭 3: 보안 및 쿠키 ------------------
         tab_security = QWidget()
@@ -192,7 +330,7 @@ class SettingsDialog(QDialog):
         form_po.addRow("YouTube 요청 프로필:", self.player_client_combo)
         
         vbox_security.addWidget(po_token_group)
-        self.tab_widget.addTab(tab_security, "보안 및 쿠키")
+        self.tab_widget.addTab(self.scrollable(tab_security), "보안 및 쿠키")
         
         layout.addWidget(self.tab_widget)
 
@@ -212,6 +350,7 @@ class SettingsDialog(QDialog):
 
         # 위젯 활성화/비활성화 연결
         self.subtitle_check.toggled.connect(self.subtitle_lang_edit.setEnabled)
+        self.subtitle_check.toggled.connect(self.embed_subtitles_check.setEnabled)
         self.playlist_check.toggled.connect(self.playlist_max_spin.setEnabled)
         self.cookies_check.toggled.connect(self.on_cookies_toggled)
         self.cookies_source_combo.currentIndexChanged.connect(self.on_cookies_source_changed)
@@ -220,6 +359,7 @@ class SettingsDialog(QDialog):
 
         # 초기 상태에 맞게 위젯 활성화/비활성화 설정
         self.subtitle_lang_edit.setEnabled(self.subtitle_check.isChecked())
+        self.embed_subtitles_check.setEnabled(self.subtitle_check.isChecked())
         self.playlist_max_spin.setEnabled(self.playlist_check.isChecked())
         self.on_cookies_toggled(self.cookies_check.isChecked())
         self.on_po_token_toggled(self.po_token_check.isChecked())
@@ -251,6 +391,7 @@ class SettingsDialog(QDialog):
 
     def on_proxy_mode_changed(self, *args):
         self.proxy_url_edit.setEnabled(self.proxy_mode_combo.currentText() == "수동 설정")
+        self.proxy_pool_edit.setEnabled(self.proxy_mode_combo.currentText() == "프록시 풀")
 
     def browse_path(self):
         """다운로드 경로 선택"""
@@ -258,6 +399,12 @@ class SettingsDialog(QDialog):
         if folder:
             self.path_edit.setText(folder)
 
+    def browse_staging_path(self):
+        """스테이징 폴더 선택"""
+        folder = QFileDialog.getExistingDirectory(self, "임시 작업 폴더 선택")
+        if folder:
+            self.staging_edit.setText(folder)
+
     def browse_cookies_file(self):
         """쿠키 파일 선택"""
         file_path, _ = QFileDialog.getOpenFileName(self, "쿠키 파일 선택", "", "텍스트 파일 (*.txt);;모든 파일 (*)")
@@ -267,15 +414,37 @@ class SettingsDialog(QDialog):
     def save_settings(self):
         """설정 저장"""
         cookies_source_val = "browser" if self.cookies_source_combo.currentText() == "웹 브라우저 연동" else "file"
-        
-        self.config.config.update({
+        try:
+            output_profiles = ", ".join(parse_output_profiles(self.outputs_edit.text()))
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return
+        try:
+            download_schedule = format_schedule(parse_schedule(self.schedule_edit.text()))
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return
+
+        self.config.update({
             "download_path": self.path_edit.text(),
+            "staging_path": self.staging_edit.text().strip(),
+            "staging_capacity_gb": self.staging_capacity_spin.value(),
+            "disk_preflight": self.disk_preflight_check.isChecked(),
+            "min_free_space_mb": self.min_free_spin.value(),
+            "verify_downloads": self.verify_check.isChecked(),
+            "record_history": self.history_check.isChecked(),
+            "prefetch_metadata": self.prefetch_check.isChecked(),
+            "keep_partial_on_cancel": self.keep_partial_check.isChecked(),
             "video_format": self.format_combo.currentText(),
             "quality": self.quality_combo.currentText(),
             "preferred_quality": self.pref_quality_combo.currentText(),
+            "output_profiles": output_profiles,
             "download_audio_only": self.audio_only_check.isChecked(),
             "subtitle_download": self.subtitle_check.isChecked(),
             "subtitle_language": self.subtitle_lang_edit.text(),
+            "embed_subtitles": self.embed_subtitles_check.isChecked(),
+            "embed_metadata": self.embed_metadata_check.isChecked(),
+            "embed_thumbnail": self.embed_thumbnail_check.isChecked(),
             "playlist_download": self.playlist_check.isChecked(),
             "max_playlist_items": self.playlist_max_spin.value(),
             "use_cookies": self.cookies_check.isChecked(),
@@ -289,8 +458,15 @@ class SettingsDialog(QDialog):
             "auto_open_folder": self.auto_open_check.isChecked(),
             "max_retries": self.retry_spin.value(),
             "retry_delay": self.delay_spin.value(),
-            "proxy_mode": {"자동 감지": "auto", "수동 설정": "manual", "사용 안함": "none"}.get(self.proxy_mode_combo.currentText(), "auto"),
-            "proxy_url": self.proxy_url_edit.text().strip()
+            "max_concurrent_downloads": self.concurrency_spin.value(),
+            "download_schedule": download_schedule,
+            "worker_processes": self.worker_check.isChecked(),
+            "worker_job_timeout_minutes": self.worker_timeout_spin.value(),
+            "worker_recycle_jobs": self.worker_recycle_spin.value(),
+            "quality_deadline_seconds": self.deadline_spin.value() * 60,
+            "quality_byte_budget": self.byte_budget_spin.value() * 1024 * 1024,
+            "proxy_mode": {"자동 감지": "auto", "수동 설정": "manual", "프록시 풀": "pool", "사용 안함": "none"}.get(self.proxy_mode_combo.currentText(), "auto"),
+            "proxy_url": self.proxy_url_edit.text().strip(),
+            "proxy_pool": self.proxy_pool_edit.text().strip()
         })
-        self.config.save_config()
         self.accept()
@@ -0,0 +1,173 @@
+"""
+로컬 임시 작업 폴더(스테이징)와 백그라운드 이동 모듈
+다운로드/후처리는 빠른 로컬 디스크에서 하고, 끝난 파일만 라이브러리 폴더(NAS 등)로 옮깁니다.
+"""
+import errno
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _zero_copy(src_fd, dst_fd, size):
+    """커널 안에서 복사 (copy_file_range -> sendfile 순으로 시도), 실패하면 False"""
+    for copy in (getattr(os, "copy_file_range", None), getattr(os, "sendfile", None)):
+        if copy is None:
+            continue
+        copied = 0
+        try:
+            while copied < size:
+                if copy is os.sendfile:
+                    sent = os.sendfile(dst_fd, src_fd, copied, min(COPY_CHUNK_SIZE, size - copied))
+                else:
+                    sent = os.copy_file_range(src_fd, dst_fd, min(COPY_CHUNK_SIZE, size - copied))
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError:
+            if copied:
+                raise
+            continue
+        if copied == size:
+            return True
+        if copied:
+            raise OSError(f"파일 복사가 중간에 끝났습니다: {copied}/{size}")
+    return False
+
+
+def copy_file(src, dst):
+    """src를 dst로 복사 (가능하면 사용자 공간을 거치지 않는 복사 사용)"""
+    size = os.path.getsize(src)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if not _zero_copy(fsrc.fileno(), fdst.fileno(), size):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+        fdst.flush()
+        os.fsync(fdst.fileno())
+    shutil.copystat(src, dst)
+
+
+def move_file(src, dst):
+    """같은 파일 시스템이면 이름만 바꾸고, 아니면 임시 이름으로 복사한 뒤 원자적으로 교체"""
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(src, dst)
+        return dst
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    fd, temp_path = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".moving", dir=dst.parent)
+    os.close(fd)
+    try:
+        copy_file(src, temp_path)
+        os.replace(temp_path, dst)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    os.remove(src)
+    return dst
+
+
+def _tree_size(path):
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class StagingMover:
+    """스테이징 폴더의 완료된 작업 폴더를 라이브러리로 옮기는 백그라운드 작업자
+    옮기지 못한 용량이 capacity를 넘으면 wait_for_space()가 새 다운로드를 멈춰 둡니다."""
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, capacity_bytes, workers=2):
+        self.capacity_bytes = capacity_bytes
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="staging-mover")
+        self._cond = threading.Condition()
+        self._pending_bytes = 0
+        self._pending_jobs = 0
+
+    @classmethod
+    def shared(cls, capacity_bytes):
+        """프로세스 전체에서 하나의 이동 작업자와 용량 한도를 공유"""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(capacity_bytes)
+            else:
+                cls._shared_instance.set_capacity(capacity_bytes)
+            return cls._shared_instance
+
+    @classmethod
+    def join_shared(cls, timeout=None):
+        """공유 작업자가 있으면 남은 이동이 끝날 때까지 대기"""
+        mover = cls._shared_instance
+        return mover.join(timeout) if mover is not None else True
+
+    @property
+    def pending_bytes(self):
+        with self._cond:
+            return self._pending_bytes
+
+    def set_capacity(self, capacity_bytes):
+        with self._cond:
+            self.capacity_bytes = capacity_bytes
+            self._cond.notify_all()
+
+    def wait_for_space(self, timeout=None):
+        """옮기지 못한 용량이 한도 아래로 내려갈 때까지 대기, 시간 초과면 False"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self.capacity_bytes or self._pending_bytes < self.capacity_bytes,
+                timeout,
+            )
+
+    def submit(self, job_dir, library_dir, on_done=None):
+        """작업 폴더 안의 파일을 모두 라이브러리 폴더로 옮기도록 예약
+        on_done(moved_paths, error)는 이동 스레드에서 호출됩니다."""
+        size = _tree_size(job_dir)
+        with self._cond:
+            self._pending_bytes += size
+            self._pending_jobs += 1
+        return self._executor.submit(self._move_tree, Path(job_dir), Path(library_dir), size, on_done)
+
+    def join(self, timeout=None):
+        """예약된 이동이 모두 끝날 때까지 대기"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending_jobs == 0, timeout)
+
+    def _move_tree(self, job_dir, library_dir, size, on_done):
+        moved = []
+        error = None
+        try:
+            try:
+                for root, _dirs, files in os.walk(job_dir):
+                    for name in files:
+                        src = Path(root) / name
+                        moved.append(move_file(src, library_dir / src.relative_to(job_dir)))
+                shutil.rmtree(job_dir, ignore_errors=True)
+            except OSError as e:
+                # 옮기지 못한 파일은 스테이징 폴더에 남겨 수동으로 복구할 수 있게 함
+                error = e
+            if on_done is not None:
+                on_done(moved, error)
+        finally:
+            with self._cond:
+                self._pending_bytes -= size
+                self._pending_jobs -= 1
+                self._cond.notify_all()
+        return moved
@@ -0,0 +1,93 @@
+import io
+import json
+import threading
+import time
+import unittest
+
+from bulk_inspect import inspect_many, write_jsonl
+
+
+class BulkInspectTests(unittest.TestCase):
+    def test_records_include_metadata_and_invalid_lines(self):
+        def inspect(url):
+            if url.endswith("bbbbbbbbbbb"):
+                raise RuntimeError("ERROR: Private video")
+            return {
+                "title": "제목",
+                "duration": 60,
+                "availability": "public",
+                "available_heights": [360, 720],
+                "selected_format_id": "136",
+                "estimated_bytes": 1234,
+            }
+
+        lines = [
+            "https://youtu.be/aaaaaaaaaaa",
+            "https://youtu.be/bbbbbbbbbbb",
+            "https://example.com/x",
+        ]
+        output = io.StringIO()
+
+        count = write_jsonl(inspect_many(lines, inspect, workers=2), output)
+
+        records = {
+            record["url"]: record
+            for record in map(json.loads, output.getvalue().splitlines())
+        }
+        self.assertEqual(count, 3)
+        ok = records["https://www.youtube.com/watch?v=aaaaaaaaaaa"]
+        self.assertEqual(ok["available_heights"], [360, 720])
+        self.assertEqual(ok["estimated_bytes"], 1234)
+        failed = records["https://www.youtube.com/watch?v=bbbbbbbbbbb"]
+        self.assertEqual(failed["availability"], "private")
+        self.assertEqual(records["https://example.com/x"]["availability"], "invalid")
+
+    def test_per_host_limit_is_honored(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def inspect(_url):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {}
+
+        lines = [f"https://youtu.be/{index:011d}" for index in range(12)]
+
+        records = list(inspect_many(lines, inspect, workers=8, per_host_limit=2))
+
+        self.assertEqual(len(records), 12)
+        self.assertLessEqual(peak, 2)
+
+    def test_limited_host_does_not_hold_pool_threads(self):
+        other_site_done = threading.Event()
+        released = []
+
+        def inspect(url):
+            if "pornhub" in url:
+                other_site_done.set()
+            else:
+                # 다른 사이트가 끝나야 풀려나는 느린 사이트
+                released.append(other_site_done.wait(5))
+            return {"title": url}
+
+        lines = [
+            "https://youtu.be/aaaaaaaaaaa",
+            "https://youtu.be/bbbbbbbbbbb",
+            "https://www.pornhub.com/view_video.php?viewkey=ph5f1234567890",
+        ]
+        started = time.monotonic()
+        records = list(inspect_many(lines, inspect, workers=2, per_host_limit=1))
+
+        self.assertLess(time.monotonic() - started, 4)
+        self.assertEqual(released, [True, True])
+        self.assertEqual(len(records), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
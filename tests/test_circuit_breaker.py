@@ -0,0 +1,101 @@
+import threading
+import unittest
+from types import SimpleNamespace
+
+from circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreakerRegistry
+from download_queue import DownloadQueue
+from jobs import JobSpec
+from youtube_downloader import YouTubeDownloader
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breakers = CircuitBreakerRegistry(threshold=2, cooldown=60, max_cooldown=200, clock=self.clock)
+
+    def test_trips_then_lets_single_probe_through_after_cooldown(self):
+        key = ("YouTube", "")
+        self.assertFalse(self.breakers.record_failure(key))
+        self.assertTrue(self.breakers.record_failure(key))
+        self.assertFalse(self.breakers.acquire(key, "job-1"))
+        self.assertEqual(self.breakers.retry_delay(key), 60)
+        self.assertTrue(self.breakers.acquire(("Pornhub", ""), "other"))
+
+        self.clock.now = 60
+        self.assertTrue(self.breakers.acquire(key, "probe"))
+        self.assertEqual(self.breakers.state(key), STATE_HALF_OPEN)
+        self.assertFalse(self.breakers.acquire(key, "job-2"))
+
+        # 시험 작업이 다시 막히면 대기 시간이 두 배
+        self.assertTrue(self.breakers.record_failure(key))
+        self.assertEqual(self.breakers.retry_delay(key), 120)
+
+        self.clock.now = 180
+        self.assertTrue(self.breakers.acquire(key, "probe-2"))
+        self.breakers.record_success(key)
+        self.assertEqual(self.breakers.state(key), STATE_CLOSED)
+        self.assertTrue(self.breakers.acquire(key, "job-3"))
+
+    def test_probe_that_ends_without_result_is_released(self):
+        key = ("YouTube", "")
+        self.breakers.record_failure(key)
+        self.breakers.record_failure(key)
+        self.clock.now = 60
+        self.assertTrue(self.breakers.acquire(key, "probe"))
+        self.breakers.release(key, "probe")
+        self.assertEqual(self.breakers.state(key), STATE_OPEN)
+        self.assertTrue(self.breakers.acquire(key, "next"))
+
+    def test_forbidden_errors_do_not_trip_the_site(self):
+        downloader = SimpleNamespace(breakers=self.breakers, circuit_key=("YouTube", ""))
+        for _ in range(3):
+            self.assertFalse(YouTubeDownloader._record_host_error(downloader, "forbidden"))
+        self.assertEqual(self.breakers.state(downloader.circuit_key), STATE_CLOSED)
+        YouTubeDownloader._record_host_error(downloader, "bot_check")
+        self.assertTrue(YouTubeDownloader._record_host_error(downloader, "throttled"))
+
+    def test_queue_holds_blocked_site_and_keeps_other_sites_flowing(self):
+        blocked = ("YouTube", "")
+        self.breakers.record_failure(blocked)
+        self.breakers.record_failure(blocked)
+        started = []
+        lock = threading.Lock()
+
+        def run_job(job):
+            with lock:
+                started.append(job.url)
+            if job.breaker_key == blocked:
+                self.breakers.record_success(blocked)
+            return True
+
+        queue = DownloadQueue(
+            run_job,
+            max_workers=2,
+            breakers=self.breakers,
+            breaker_func=lambda spec: ("YouTube" if "youtu" in spec.url else "Pornhub", ""),
+        )
+        held = [queue.submit(JobSpec(url=f"https://youtu.be/held{index}")) for index in range(3)]
+        other = queue.submit(JobSpec(url="https://www.pornhub.com/view_video.php?viewkey=abc"))
+        other.wait(5)
+        self.assertEqual(started, [other.url])
+        self.assertFalse(any(job.is_done() for job in held))
+
+        # 대기 시간이 지나면 시험 작업 하나가 먼저 실행되고, 성공하면 나머지도 실행
+        self.clock.now = 60
+        queue._on_breaker_changed(blocked, STATE_OPEN)
+        self.assertTrue(queue.join(timeout=5))
+        queue.shutdown()
+        self.assertEqual(started[1], held[0].url)
+        self.assertEqual(sorted(started[1:]), sorted(job.url for job in held))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import http.cookiejar
+import os
+import stat
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import yt_dlp
+
+from cookie_cache import BrowserCookieCache, apply_cookie_cache
+
+
+def make_cookie(domain, name, value="v"):
+    return http.cookiejar.Cookie(
+        0, name, value, None, False, domain, True, domain.startswith("."), "/", False,
+        True, int(time.time()) + 3600, False, None, None, {},
+    )
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.calls = 0
+        self.db_mtime = 100.0
+        self.value = "first"
+
+    def extract(self, browser):
+        self.calls += 1
+        time.sleep(0.05)
+        jar = http.cookiejar.CookieJar()
+        jar.set_cookie(make_cookie(".youtube.com", "SID", self.value))
+        jar.set_cookie(make_cookie(".example.com", "tracking"))
+        return jar
+
+
+class CookieCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.browser = FakeBrowser()
+        self.now = 1000.0
+        self.cache = self.make_cache()
+
+    def make_cache(self):
+        return BrowserCookieCache(
+            Path(self.temp_dir.name) / "cookies",
+            ttl=60,
+            extract=self.browser.extract,
+            db_mtime=lambda browser: self.browser.db_mtime,
+            clock=lambda: self.now,
+        )
+
+    def test_concurrent_jobs_share_one_filtered_extraction(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get("chrome"))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.browser.calls, 1)
+        self.assertEqual(len(set(results)), 1)
+        self.assertIn("SID\tfirst", results[0])
+        self.assertNotIn("example.com", results[0])
+
+        path = self.cache.cookie_file("chrome")
+        if os.name == "posix":
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o600)
+
+        # 쿠키 파일 대신 YoutubeDL마다 새 스트림을 넘기고 원래 옵션은 그대로 둠
+        opts = {"cookiesfrombrowser": ("chrome",), "quiet": True}
+        applied = apply_cookie_cache(opts, self.cache)
+        self.assertEqual(opts, {"cookiesfrombrowser": ("chrome",), "quiet": True})
+        with yt_dlp.YoutubeDL(applied) as ydl:
+            self.assertEqual([c.value for c in ydl.cookiejar], ["first"])
+        self.assertEqual(self.browser.calls, 1)
+
+    def test_refreshes_on_db_change_or_ttl_and_reuses_saved_file(self):
+        self.cache.get("chrome")
+        self.browser.value = "second"
+        self.now += 10
+        self.assertIn("SID\tfirst", self.cache.get("chrome"))
+
+        self.browser.db_mtime += 1
+        self.assertIn("SID\tsecond", self.cache.get("chrome"))
+        self.assertEqual(self.browser.calls, 2)
+
+        self.now += 60
+        self.cache.get("chrome")
+        self.assertEqual(self.browser.calls, 3)
+
+        # 다음 실행: 저장한 파일이 브라우저 DB보다 새로우면 다시 추출하지 않음
+        self.now = time.time()
+        self.browser.db_mtime = self.cache.cookie_file("chrome").stat().st_mtime - 1
+        restarted = self.make_cache()
+        self.assertIn("SID\tsecond", restarted.get("chrome"))
+        self.assertEqual(self.browser.calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+from daemon import DaemonClient, DownloadDaemon, EventBus, RemoteDownloadQueue
+from download_queue import PHASE_CANCELLED, PHASE_FINISHED, PHASE_PAUSED, PHASE_QUEUED, DownloadQueue
+
+
+class DaemonApiTests(unittest.TestCase):
+    def setUp(self):
+        self.gate = threading.Event()
+
+        def run_job(job):
+            self.gate.wait(5)
+            return True
+
+        self.queue = DownloadQueue(run_job, max_workers=1)
+        self.daemon = DownloadDaemon(self.queue, EventBus(), port=0)
+        threading.Thread(target=self.daemon.serve_forever, daemon=True).start()
+        self.client = DaemonClient(self.daemon.address)
+
+    def tearDown(self):
+        self.gate.set()
+        self.daemon.shutdown()
+        self.queue.shutdown()
+
+    def test_submit_list_cancel_and_stream_events(self):
+        first = self.client.submit("https://youtu.be/aaaaaaaaaaa", preferred_quality="720p")
+        second = self.client.submit("https://youtu.be/bbbbbbbbbbb")
+
+        self.assertEqual(self.queue.get_job(first["id"]).spec.preferred_quality, "720p")
+        self.assertEqual([job["id"] for job in self.client.list_jobs()], [first["id"], second["id"]])
+
+        cancelled = self.client.cancel(second["id"])
+        self.assertEqual(cancelled["phase"], PHASE_CANCELLED)
+
+        events = self.client.events(job_id=first["id"])
+        self.gate.set()
+        for event in events:
+            if event["type"] == "state" and event["job"]["phase"] == PHASE_FINISHED:
+                break
+        self.assertEqual(self.client.status(first["id"])["phase"], PHASE_FINISHED)
+
+    def test_pause_resume_and_reprioritize_waiting_job(self):
+        self.client.submit("https://youtu.be/aaaaaaaaaaa")
+        waiting = self.client.submit("https://youtu.be/bbbbbbbbbbb")
+
+        self.assertEqual(self.client.pause(waiting["id"])["phase"], PHASE_PAUSED)
+        with self.assertRaises(RuntimeError):
+            self.client.pause(waiting["id"])
+        self.assertEqual(self.client.set_priority(waiting["id"], 5)["priority"], 5)
+        self.assertEqual(self.client.resume(waiting["id"])["phase"], PHASE_QUEUED)
+
+    def test_invalid_submission_is_rejected(self):
+        with self.assertRaises(RuntimeError):
+            self.client.submit("https://youtu.be/aaaaaaaaaaa", bitrate=1)
+        with self.assertRaises(RuntimeError):
+            self.client.status(999)
+        with self.assertRaises(urllib.error.HTTPError) as caught:
+            urllib.request.urlopen(self.daemon.address + "/events?job=abc", timeout=5)
+        self.assertEqual(caught.exception.code, 400)
+
+    def test_closed_queue_and_dropped_connection_are_reported(self):
+        waiting = self.client.submit("https://youtu.be/aaaaaaaaaaa")
+        remote = RemoteDownloadQueue(self.client)
+        self.queue.shutdown(wait=False)
+        with self.assertRaises(RuntimeError) as caught:
+            self.client.submit("https://youtu.be/bbbbbbbbbbb")
+        self.assertIn("503", str(caught.exception))
+
+        self.daemon.shutdown()
+        remote.client = DaemonClient("http://127.0.0.1:9", timeout=1)
+        self.assertFalse(remote.cancel(remote.get_job(waiting["id"])))
+
+    def test_non_loopback_hosts_and_cross_origin_requests_are_refused(self):
+        with self.assertRaises(ValueError):
+            DownloadDaemon(self.queue, EventBus(), host="0.0.0.0", port=0)
+
+        # 브라우저가 사전 확인 없이 보낼 수 있는 text/plain POST와 다른 Host 헤더는 거절
+        request = urllib.request.Request(
+            self.daemon.address + "/jobs", data=b'{"url": "https://youtu.be/aaaaaaaaaaa"}',
+            headers={"Content-Type": "text/plain"}, method="POST",
+        )
+        with self.assertRaises(urllib.error.HTTPError) as caught:
+            urllib.request.urlopen(request, timeout=5)
+        self.assertEqual(caught.exception.code, 415)
+        request = urllib.request.Request(self.daemon.address + "/jobs", headers={"Host": "evil.example:8765"})
+        with self.assertRaises(urllib.error.HTTPError) as caught:
+            urllib.request.urlopen(request, timeout=5)
+        self.assertEqual(caught.exception.code, 403)
+        self.assertEqual(self.client.list_jobs(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
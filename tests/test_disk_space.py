@@ -0,0 +1,54 @@
+import tempfile
+import threading
+import unittest
+from collections import namedtuple
+
+from disk_space import DiskSpaceLedger, required_bytes
+
+Usage = namedtuple("Usage", ["total", "used", "free"])
+
+
+class DiskSpaceTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.free = 1000
+        self.ledger = DiskSpaceLedger(min_free_bytes=100, disk_usage=lambda path: Usage(0, 0, self.free))
+
+    def test_required_bytes_adds_headroom_for_merge_and_outputs(self):
+        selection = {'estimated_bytes': 300, 'needs_merge': True, 'needs_remux': False}
+        self.assertEqual(required_bytes(selection), 600)
+        self.assertEqual(required_bytes(selection, output_profiles=["m4a"]), 900)
+        self.assertEqual(required_bytes({'estimated_bytes': 300}), 300)
+        self.assertIsNone(required_bytes({'estimated_bytes': None}))
+
+    def test_reservations_do_not_overcommit_concurrent_jobs(self):
+        first = self.ledger.try_reserve(self.temp_dir.name, 600)
+        self.assertIsNotNone(first)
+        self.assertIsNone(self.ledger.try_reserve(self.temp_dir.name, 600))
+
+        # 이미 쓴 바이트는 실제 남은 공간에서 빠지므로 예약에서도 빠짐
+        first.consumed = 400
+        self.free = 600
+        self.assertEqual(self.ledger.available(self.temp_dir.name), 300)
+
+        # 다른 예약이 없으면 기다리지 않고 실패
+        self.ledger.release(first)
+        self.assertIsNone(self.ledger.reserve(self.temp_dir.name, 900))
+
+    def test_reserve_waits_until_other_job_releases(self):
+        first = self.ledger.try_reserve(self.temp_dir.name, 800)
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(self.ledger.reserve(self.temp_dir.name, 500, timeout=5)))
+        waiter.start()
+        waiter.join(0.1)
+        self.assertTrue(waiter.is_alive())
+
+        self.ledger.release(first)
+        waiter.join(5)
+        self.assertIsNotNone(result[0])
+        self.assertEqual(result[0].nbytes, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import threading
+import time
+import unittest
+
+from download_queue import (
+    CONTROL_PAUSE, PHASE_CANCELLED, PHASE_DOWNLOADING, PHASE_FAILED, PHASE_FINISHED, PHASE_PAUSED, DownloadQueue,
+)
+from job_table import JobTableModel
+from jobs import JobSpec
+
+
+class DownloadQueueTests(unittest.TestCase):
+    def test_concurrency_is_capped_and_results_recorded(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def run_job(job):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return not job.url.endswith("fail")
+
+        queue = DownloadQueue(run_job, max_workers=3)
+        jobs = [queue.submit(JobSpec(url=f"https://youtu.be/{index}")) for index in range(10)]
+        failing = queue.submit(JobSpec(url="https://youtu.be/fail"))
+
+        self.assertTrue(queue.join(timeout=5))
+        queue.shutdown()
+        self.assertLessEqual(peak, 3)
+        self.assertTrue(all(job.state.phase == PHASE_FINISHED for job in jobs))
+        self.assertEqual(failing.state.phase, PHASE_FAILED)
+
+    def test_higher_priority_jobs_run_first(self):
+        started = []
+        gate = threading.Event()
+
+        def run_job(job):
+            started.append(job.url)
+            gate.wait(5)
+            return True
+
+        queue = DownloadQueue(run_job, max_workers=1)
+        queue.submit(JobSpec(url="first"))
+        while not started:
+            time.sleep(0.001)
+        queue.submit(JobSpec(url="low"), priority=0)
+        queue.submit(JobSpec(url="high"), priority=10)
+        gate.set()
+
+        self.assertTrue(queue.join(timeout=5))
+        queue.shutdown()
+        self.assertEqual(started, ["first", "high", "low"])
+
+    def test_duplicate_video_attaches_and_option_variants_are_serialized(self):
+        running = set()
+        overlaps = []
+        lock = threading.Lock()
+
+        def run_job(job):
+            with lock:
+                if job.group in running:
+                    overlaps.append(job.job_id)
+                running.add(job.group)
+            time.sleep(0.02)
+            with lock:
+                running.discard(job.group)
+            return True
+
+        def key_func(spec):
+            return spec.url.rsplit("/", 1)[-1], spec.quality
+
+        queue = DownloadQueue(run_job, max_workers=4, key_func=key_func)
+        first = queue.submit(JobSpec(url="https://youtu.be/abc"))
+        attached = queue.submit(JobSpec(url="https://www.youtube.com/shorts/abc"))
+        variant = queue.submit(JobSpec(url="https://youtu.be/abc", quality="worst"))
+        other = queue.submit(JobSpec(url="https://youtu.be/xyz"))
+
+        self.assertIs(attached, first)
+        self.assertIsNot(variant, first)
+        self.assertTrue(queue.join(timeout=5))
+        self.assertEqual(overlaps, [])
+        self.assertEqual(len(queue.jobs), 3)
+        self.assertTrue(all(job.result for job in (first, variant, other)))
+        self.assertIsNot(queue.submit(JobSpec(url="https://youtu.be/abc")), first)
+        queue.shutdown()
+
+    def test_pause_frees_slot_and_resume_or_cancel_running_jobs(self):
+        started = []
+        release = threading.Event()
+
+        def run_job(job):
+            # 다운로더처럼 진행 중에 요청을 확인하고 멈춤
+            started.append(job.url)
+            while not release.is_set():
+                if job.control == CONTROL_PAUSE:
+                    job.set_resume_data({'discard': []})
+                    job.update(phase=PHASE_PAUSED)
+                    return False
+                if job.control is not None:
+                    return False
+                time.sleep(0.005)
+            return True
+
+        queue = DownloadQueue(run_job, max_workers=1)
+        paused = queue.submit(JobSpec(url="paused"))
+        while not started:
+            time.sleep(0.001)
+        waiting = queue.submit(JobSpec(url="waiting"))
+        self.assertTrue(queue.pause(paused))
+        while len(started) < 2:
+            time.sleep(0.001)
+        # 멈춘 작업은 끝나지 않고 다음 작업이 슬롯을 씀
+        self.assertEqual(paused.state.phase, PHASE_PAUSED)
+        self.assertFalse(paused.is_done())
+        self.assertTrue(queue.cancel(waiting))
+        self.assertFalse(waiting.wait(5))
+        self.assertEqual(waiting.state.phase, PHASE_CANCELLED)
+
+        release.set()
+        self.assertTrue(queue.resume(paused))
+        self.assertTrue(paused.wait(5))
+        queue.shutdown()
+        self.assertEqual(started, ["paused", "waiting", "paused"])
+        self.assertEqual(paused.state.phase, PHASE_FINISHED)
+
+    def test_finished_jobs_beyond_retention_are_forgotten(self):
+        queue = DownloadQueue(lambda job: True, max_workers=1, max_finished_jobs=2)
+        jobs = [queue.submit(JobSpec(url=f"https://youtu.be/{index}")) for index in range(4)]
+        self.assertTrue(queue.join(timeout=5))
+        queue.shutdown()
+        self.assertEqual(queue.jobs, jobs[2:])
+        self.assertIsNone(queue.get_job(jobs[0].job_id))
+        self.assertIs(queue.get_job(jobs[3].job_id), jobs[3])
+
+    def test_set_priority_reorders_waiting_jobs(self):
+        started = []
+        gate = threading.Event()
+
+        def run_job(job):
+            started.append(job.url)
+            gate.wait(5)
+            return True
+
+        queue = DownloadQueue(run_job, max_workers=1)
+        queue.submit(JobSpec(url="first"))
+        while not started:
+            time.sleep(0.001)
+        low = queue.submit(JobSpec(url="low"))
+        held = queue.submit(JobSpec(url="held"), priority=5)
+        queue.submit(JobSpec(url="middle"), priority=1)
+        self.assertTrue(queue.set_priority(low, 10))
+        self.assertTrue(queue.pause(held))
+        self.assertEqual(queue.pending_count(), 2)
+        gate.set()
+        while len(started) < 3:
+            time.sleep(0.001)
+        self.assertTrue(queue.resume(held))
+
+        self.assertTrue(queue.join(timeout=5))
+        queue.shutdown()
+        self.assertEqual(started, ["first", "low", "middle", "held"])
+
+
+class JobTableModelTests(unittest.TestCase):
+    def test_refresh_emits_only_changed_row_ranges(self):
+        queue = DownloadQueue(lambda job: True, max_workers=1)
+        queue._start_threads = lambda: None
+        for index in range(6):
+            queue.submit(JobSpec(url=f"https://youtu.be/{index}"))
+        model = JobTableModel(queue)
+        model.timer.stop()
+        model.refresh()
+        ranges = []
+        model.dataChanged.connect(
+            lambda top, bottom, *_: ranges.append((top.row(), bottom.row()))
+        )
+
+        for row in (1, 2, 4):
+            queue.jobs[row].update(phase=PHASE_DOWNLOADING, downloaded_bytes=50, total_bytes=100)
+        changed = model.refresh()
+
+        self.assertEqual(changed, 3)
+        self.assertEqual(ranges, [(1, 2), (4, 4)])
+        self.assertEqual(model.refresh(), 0)
+        self.assertAlmostEqual(model.overall_percent(), 50.0)
+
+        # 끝난 행은 더 비교하지 않지만 전체 진행률에는 남음
+        queue.jobs[1].update(downloaded_bytes=100)
+        queue.jobs[1].finish(True)
+        self.assertEqual(model.refresh(), 1)
+        self.assertNotIn(1, model._active_rows)
+        self.assertAlmostEqual(model.overall_percent(), 200 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
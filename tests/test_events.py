@@ -0,0 +1,76 @@
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import yt_dlp as youtube_dl
+
+from config import ConfigSnapshot
+from events import JsonEventWriter
+from utils import classify_download_error
+from youtube_downloader import YouTubeDownloader
+
+
+class JsonEventTests(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.writer = JsonEventWriter(self.stream)
+        config = ConfigSnapshot({"show_progress": True}, {})
+        self.downloader = YouTubeDownloader(
+            "https://youtu.be/dQw4w9WgXcQ",
+            config=config,
+            event_callback=self.writer.bind(7),
+        )
+
+    def events(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_progress_is_throttled_and_phases_are_emitted_once(self):
+        progress = {'status': 'downloading', 'downloaded_bytes': 10, 'total_bytes': 100, 'speed': 5.0, 'eta': 18}
+        with patch("youtube_downloader.time.monotonic", side_effect=[100.0, 100.1, 101.0]):
+            for _ in range(3):
+                self.downloader.my_hook(progress)
+        self.downloader.my_hook({'status': 'finished', 'filename': '/tmp/video.mp4'})
+
+        events = self.events()
+        self.assertEqual([event['type'] for event in events], ['phase', 'progress', 'progress', 'phase'])
+        self.assertEqual(events[0]['phase'], 'downloading')
+        self.assertEqual(events[1]['total_bytes'], 100)
+        self.assertEqual(events[-1]['phase'], 'postprocessing')
+        self.assertTrue(all(event['job_id'] == 7 for event in events))
+
+    def test_result_reports_output_path_and_class_of_error(self):
+        self.downloader.output_path = "/nonexistent/video.mp4"
+        self.downloader._emit_result(False)
+
+        result = self.events()[-1]
+        self.assertEqual(result['type'], 'result')
+        self.assertFalse(result['success'])
+        self.assertIsNone(result['size'])
+        self.assertEqual(
+            classify_download_error("ERROR: HTTP Error 429: Too Many Requests"),
+            "throttled",
+        )
+        self.assertEqual(
+            classify_download_error("Sign in to confirm you're not a bot"),
+            "bot_check",
+        )
+        # 대량 확인과 같은 분류를 사용
+        self.assertEqual(classify_download_error("ERROR: Private video. Sign in if you've been granted access"), "private")
+        self.assertEqual(classify_download_error("This video is not available in your country"), "geo_restricted")
+
+    def test_retry_event_only_when_another_attempt_follows(self):
+        self.downloader.max_retries = 2
+        self.downloader.retry_delay = 0
+        error = youtube_dl.utils.DownloadError("ERROR: Video unavailable")
+        with patch.object(self.downloader, "_open_ydl", side_effect=error):
+            self.assertFalse(self.downloader._download_attempts({}))
+
+        events = [event for event in self.events() if event['type'] != 'phase']
+        self.assertEqual([event['type'] for event in events], ['retry', 'error'])
+        self.assertEqual([event['attempt'] for event in events], [1, 2])
+        self.assertEqual(events[-1]['error_class'], "unavailable")
+
+
+if __name__ == "__main__":
+    unittest.main()
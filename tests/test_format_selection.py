@@ -0,0 +1,67 @@
+import unittest
+
+from config import ConfigSnapshot
+from format_selection import preview_choices, select_for_opts
+
+
+def video(format_id, height, tbr, **extra):
+    return {
+        "format_id": format_id, "ext": "mp4", "vcodec": "avc1", "acodec": "none",
+        "height": height, "width": height * 16 // 9, "fps": 30, "tbr": tbr,
+        "url": "https://example.com", "protocol": "https", **extra,
+    }
+
+
+FORMATS = [
+    {
+        "format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2",
+        "abr": 128, "tbr": 128, "url": "https://example.com", "protocol": "https",
+    },
+    video("136", 720, 2000),
+    video("137", 1080, 4000, filesize=50_000_000),
+    video("313", 2160, 16000, ext="webm", vcodec="vp9"),
+]
+
+
+class FormatSelectionTests(unittest.TestCase):
+    def setUp(self):
+        self.config = ConfigSnapshot({
+            "download_path": "/tmp",
+            "download_audio_only": False,
+            "quality": "best",
+            "preferred_quality": "1080p",
+            "video_format": "mp4",
+            "max_retries": 3,
+            "playlist_download": False,
+            "proxy_mode": "none",
+        }, {"download_path": "/tmp"})
+        self.info = {"formats": list(FORMATS), "duration": 100}
+
+    def test_selection_matches_configured_format_string(self):
+        selection = select_for_opts(self.info, self.config.get_ydl_opts())
+
+        self.assertEqual(selection["format_id"], "137+140")
+        self.assertEqual(selection["height"], 1080)
+        self.assertTrue(selection["needs_merge"])
+        self.assertEqual(selection["estimated_bytes"], 50_000_000 + 1_600_000)
+
+    def test_preview_covers_every_resolution_choice(self):
+        choices = preview_choices(self.info, self.config)
+
+        self.assertEqual(choices["best"]["height"], 2160)
+        self.assertEqual(choices["720p"]["format_id"], "136+140")
+        self.assertIsNone(choices["360p"])
+        self.assertEqual([fmt["format_id"] for fmt in self.info["formats"]],
+                         ["140", "136", "137", "313"])
+
+    def test_audio_only_selection(self):
+        opts = self.config.snapshot({"download_audio_only": True}).get_ydl_opts()
+
+        selection = select_for_opts(self.info, opts)
+
+        self.assertEqual(selection["format_id"], "140")
+        self.assertFalse(selection["needs_merge"])
+
+
+if __name__ == "__main__":
+    unittest.main()
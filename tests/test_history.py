@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from history import HistoryStore
+from history_view import HistoryModel
+
+
+class HistoryStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.store = HistoryStore(Path(self.temp_dir.name) / "history.sqlite3", flush_interval=0.05)
+        self.addCleanup(self.store.close)
+        for index in range(25):
+            self.store.record(
+                finished_at=1000 + index,
+                url=f"https://youtu.be/video{index:05d}",
+                video_key=f"youtube:video{index:05d}",
+                site="YouTube" if index % 2 else "Pornhub",
+                title=f"Lecture {index} about caching" if index % 5 == 0 else f"Clip {index}",
+                success=index % 7 != 0,
+                size=1000,
+                elapsed=10,
+            )
+        self.assertTrue(self.store.flush(timeout=5))
+
+    def test_queries_use_keyset_pages_and_title_search(self):
+        first = self.store.search(limit=10)
+        second = self.store.search(after=first[-1], limit=10)
+        self.assertEqual([entry.finished_at for entry in first], list(range(1024, 1014, -1)))
+        self.assertEqual(second[0].finished_at, 1014)
+
+        matches = self.store.search("lect cach")
+        self.assertEqual([entry.finished_at for entry in matches], [1020, 1015, 1010, 1005, 1000])
+        self.assertEqual(len(self.store.search(site="YouTube")), 12)
+        self.assertEqual(self.store.last_success("youtube:video00003").finished_at, 1003)
+        self.assertIsNone(self.store.last_success("youtube:video00007"))
+
+        summary = {row[0]: row for row in self.store.site_summary()}
+        self.assertEqual(summary["YouTube"][1:4], (12, 10, 12000))
+        self.assertEqual(summary["YouTube"][4], 100)
+
+    def test_model_loads_pages_lazily(self):
+        QApplication.instance() or QApplication([])
+        model = HistoryModel(self.store, page_size=10)
+        model.reload()
+        self.assertEqual(model.rowCount(), 10)
+        self.assertTrue(model.canFetchMore())
+        model.fetchMore()
+        model.fetchMore()
+        self.assertEqual(model.rowCount(), 25)
+        self.assertFalse(model.canFetchMore())
+
+        model.set_search_text("lecture")
+        self.assertEqual(model.rowCount(), 5)
+        self.assertEqual(model.index(0, 1).data(), "Lecture 20 about caching")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from integrity import IncrementalHasher, IntegrityCache, check_probe, verify_file
+
+
+class IntegrityTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+
+    def test_incremental_hash_matches_full_hash_across_rename(self):
+        part = self.root / "video.mp4.part"
+        data = os.urandom(3 * 1024 * 1024)
+        hasher = IncrementalHasher(str(part))
+        with open(part, "wb") as f:
+            for offset in range(0, len(data), 1024 * 1024):
+                f.write(data[offset:offset + 1024 * 1024])
+                f.flush()
+                hasher.update_to(f.tell(), force=True)
+        final = self.root / "video.mp4"
+        part.rename(final)
+        hasher.rename(str(final))
+        hasher.update_to(final.stat().st_size, force=True)
+
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(data).hexdigest())
+
+    def test_cached_result_is_reused_until_file_changes(self):
+        path = self.root / "clip.mp4"
+        path.write_bytes(b"first")
+        cache = IntegrityCache(self.root / "cache.json")
+        first = verify_file(path, cache=cache)
+        self.assertEqual(first["sha256"], hashlib.sha256(b"first").hexdigest())
+
+        # 다시 열어도 같은 결과를 파일을 읽지 않고 반환
+        reloaded = IntegrityCache(self.root / "cache.json")
+        self.assertEqual(reloaded.lookup(path)["sha256"], first["sha256"])
+
+        path.write_bytes(b"second!")
+        self.assertIsNone(reloaded.lookup(path))
+        self.assertEqual(verify_file(path, cache=reloaded)["sha256"], hashlib.sha256(b"second!").hexdigest())
+
+    def test_probe_check_flags_truncated_or_empty_containers(self):
+        metadata = {"format": {"format_name": "mov,mp4", "duration": "120.0"},
+                    "streams": [{"codec_type": "video"}, {"codec_type": "audio"}]}
+        self.assertTrue(check_probe(metadata, 121)["ok"])
+        self.assertFalse(check_probe(metadata, 600)["ok"])
+        self.assertFalse(check_probe({}, None)["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
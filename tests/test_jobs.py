@@ -0,0 +1,125 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from config import Config
+from jobs import JobSpec, load_job_file
+from utils import parse_sections
+
+
+class JobSpecTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.home = Path(self.temp_dir.name)
+        patches = (
+            patch("config.Path.home", return_value=self.home),
+            patch("config.platform.system", return_value="Darwin"),
+        )
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.config = Config()
+        self.config.config["proxy_mode"] = "none"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_overrides_are_layered_without_touching_shared_config(self):
+        spec = JobSpec(
+            url="https://youtu.be/dQw4w9WgXcQ",
+            download_path=str(self.home / "job"),
+            preferred_quality="720p",
+            audio_only=False,
+            proxy="127.0.0.1:8080",
+        )
+
+        opts = spec.resolve_config(self.config).get_ydl_opts()
+
+        self.assertIn("[height<=720]", opts["format"])
+        self.assertEqual(opts["outtmpl"], str(self.home / "job" / "%(title)s.%(ext)s"))
+        self.assertEqual(opts["proxy"], "http://127.0.0.1:8080")
+        self.assertEqual(self.config.get_preferred_quality(), "1080p")
+        self.assertFalse((self.home / ".youtube_downloader_config.json").exists())
+
+    def test_same_overrides_share_cached_snapshot_and_options(self):
+        first = JobSpec(url="https://youtu.be/aaaaaaaaaaa", preferred_quality="480p")
+        second = JobSpec(url="https://youtu.be/bbbbbbbbbbb", preferred_quality="480p")
+
+        snapshot = first.resolve_config(self.config)
+        self.assertIs(snapshot, second.resolve_config(self.config))
+
+        opts = snapshot.get_ydl_opts(is_youtube=True)
+        opts["extractor_args"]["youtube"]["player_client"] = ["web"]
+        fresh = snapshot.get_ydl_opts(is_youtube=True)
+        self.assertEqual(
+            fresh["extractor_args"]["youtube"]["player_client"],
+            ["android_vr"],
+        )
+
+    def test_job_file_applies_defaults_and_rejects_unknown_keys(self):
+        job_file = self.home / "jobs.json"
+        job_file.write_text(json.dumps({
+            "defaults": {"video_format": "mkv"},
+            "jobs": [
+                "https://youtu.be/aaaaaaaaaaa",
+                {"url": "https://youtu.be/bbbbbbbbbbb", "audio_only": True},
+            ],
+        }), encoding="utf-8")
+
+        specs = load_job_file(job_file)
+
+        self.assertEqual([spec.video_format for spec in specs], ["mkv", "mkv"])
+        self.assertTrue(specs[1].audio_only)
+
+        job_file.write_text(json.dumps([{"url": "x", "bitrate": 1}]), encoding="utf-8")
+        with self.assertRaises(ValueError):
+            load_job_file(job_file)
+
+    def test_job_fields_are_type_checked_by_key(self):
+        for data, key in (
+            ({"url": "https://youtu.be/aaaaaaaaaaa", "audio_only": "yes"}, "audio_only"),
+            ({"url": "https://youtu.be/aaaaaaaaaaa", "byte_budget": True}, "byte_budget"),
+            ({"url": "https://youtu.be/aaaaaaaaaaa", "download_path": ["a"]}, "download_path"),
+            ({"url": 5}, "url"),
+        ):
+            with self.assertRaisesRegex(ValueError, key):
+                JobSpec.from_dict(data)
+        # JSON 정수는 실수 필드에 쓸 수 있음
+        spec = JobSpec.from_dict({"url": "https://youtu.be/aaaaaaaaaaa", "deadline": 30, "proxy": None})
+        self.assertEqual(spec.deadline, 30)
+
+    def test_sections_map_to_range_limited_download(self):
+        spec = JobSpec(
+            url="https://youtu.be/dQw4w9WgXcQ",
+            sections="1:00-1:30, 2:00:00-inf, ^Intro",
+            precise_cuts=True,
+        )
+
+        opts = spec.resolve_config(self.config).get_ydl_opts()
+        info = {"duration": 10000, "chapters": [{"title": "Intro", "start_time": 0, "end_time": 30}]}
+        ranges = list(opts["download_ranges"](info, Mock()))
+
+        self.assertEqual(
+            [(section["start_time"], section["end_time"]) for section in ranges],
+            [(0, 30), (60, 90), (7200, float("inf"))],
+        )
+        self.assertTrue(opts["force_keyframes_at_cuts"])
+        self.assertIn("%(section_start)d", opts["outtmpl"])
+        self.assertNotIn("download_ranges", self.config.get_ydl_opts())
+        with self.assertRaises(ValueError):
+            JobSpec(url="https://youtu.be/dQw4w9WgXcQ", sections="1:30-1:00")
+
+    def test_sections_reject_malformed_times_and_keep_commas_in_chapters(self):
+        for text in ("1:00-", "1:00", "*Intro"):
+            with self.assertRaises(ValueError):
+                parse_sections(text)
+
+        ranges, chapters = parse_sections(r"1:00-1:30, Part\, one, ^(Intro|Outro,)$, x{1,3}")
+        self.assertEqual(ranges, [(60, 90)])
+        self.assertEqual(chapters, [r"Part\, one", "^(Intro|Outro,)$", "x{1,3}"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from log_view import LogModel, LogView
+
+
+class LogViewTests(unittest.TestCase):
+    def test_status_log_keeps_only_recent_messages(self):
+        log_model = LogModel(max_entries=3)
+
+        for index in range(5):
+            log_model.append(f"메시지 {index}")
+        log_model.flush()
+        log_model.append("메시지 5")
+        log_model.flush()
+
+        self.assertEqual(
+            log_model.messages(),
+            ["메시지 3", "메시지 4", "메시지 5"],
+        )
+        self.assertEqual(log_model.rowCount(), 3)
+
+    def test_job_filter_drops_jobs_whose_lines_rotated_out(self):
+        QApplication.instance() or QApplication([])
+        log_model = LogModel(max_entries=3)
+        view = LogView(log_model, fps=1)
+        view.timer.stop()
+
+        log_model.append("1-a", job_id=1)
+        log_model.append("2-a", job_id=2)
+        log_model.append("1-b", job_id=1)
+        view.flush()
+        self.assertEqual(log_model.job_ids, [1, 2])
+        self.assertEqual(view.filter_combo.count(), 3)
+
+        view.filter_combo.setCurrentIndex(2)
+        for suffix in "abc":
+            log_model.append(f"3-{suffix}", job_id=3)
+        view.flush()
+        # 작업 1은 목록에서 빠지고, 선택 중인 작업 2는 남음
+        self.assertEqual(log_model.job_ids, [3])
+        self.assertEqual(
+            [view.filter_combo.itemData(index) for index in range(view.filter_combo.count())],
+            [None, 2, 3],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
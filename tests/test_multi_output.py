@@ -0,0 +1,49 @@
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from multi_output import MultiOutputPP, parse_output_profiles
+from youtube_downloader import main
+
+
+class MultiOutputTests(unittest.TestCase):
+    def test_profiles_are_validated_and_deduplicated(self):
+        self.assertEqual(parse_output_profiles(" M4A, 480p, m4a "), ["m4a", "480p"])
+        with self.assertRaises(ValueError):
+            parse_output_profiles("m4a, flac")
+
+    def test_all_outputs_come_from_a_single_ffmpeg_run(self):
+        pp = MultiOutputPP(profiles=["mp4", "m4a", "mp3", "480p"])
+        info = {"filepath": "/tmp/clip.mp4", "vcodec": "avc1", "acodec": "opus"}
+
+        with patch.object(MultiOutputPP, "real_run_ffmpeg") as run_ffmpeg, \
+                patch("multi_output.os.replace") as replace:
+            _files, info = pp.run(info)
+
+        run_ffmpeg.assert_called_once()
+        inputs, outputs = run_ffmpeg.call_args.args
+        self.assertEqual(inputs, [("/tmp/clip.mp4", [])])
+        self.assertEqual(
+            [path for path, _args in outputs],
+            ["/tmp/clip.temp.m4a", "/tmp/clip.temp.mp3", "/tmp/clip.480p.temp.mp4"],
+        )
+        m4a_args = outputs[0][1]
+        self.assertIn("-vn", m4a_args)
+        self.assertEqual(m4a_args[m4a_args.index("-c:a") + 1], "aac")
+        self.assertIn("libx264", outputs[2][1])
+        self.assertEqual(replace.call_count, 3)
+        self.assertEqual(info["multi_output_files"]["mp4"], "/tmp/clip.mp4")
+
+    def test_invalid_outputs_option_exits_with_message(self):
+        argv = ["youtube_downloader.py", "--headless-url", "https://youtu.be/aaaaaaaaaaa", "--outputs", "bogus"]
+        output = io.StringIO()
+        with patch.object(sys, "argv", argv), redirect_stdout(output), self.assertRaises(SystemExit) as caught:
+            main()
+        self.assertEqual(caught.exception.code, 2)
+        self.assertIn("bogus", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from yt_dlp.postprocessor import FFmpegMergerPP
+
+from postprocess_plan import FusedPostProcessor, FusedYoutubeDL, build_plan
+
+
+class PostProcessPlanTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        base = Path(self.temp_dir.name)
+        self.files = {}
+        for name in ("clip.f137.mp4", "clip.f140.m4a", "clip.ko.vtt", "clip.webp"):
+            self.files[name] = str(base / name)
+            Path(self.files[name]).write_bytes(b"x")
+        self.info = {
+            "id": "clip",
+            "ext": "mp4",
+            "filepath": str(base / "clip.mp4"),
+            "title": "Clip",
+            "uploader": "Channel",
+            "upload_date": "20240131",
+            "requested_formats": [
+                {"vcodec": "avc1", "acodec": "none", "protocol": "https", "url": "v"},
+                {"vcodec": "none", "acodec": "mp4a.40.2", "protocol": "https", "url": "a"},
+            ],
+            "requested_subtitles": {"ko": {"filepath": self.files["clip.ko.vtt"]}},
+            "thumbnails": [{"url": "t", "filepath": self.files["clip.webp"]}],
+        }
+        self.sources = [self.files["clip.f137.mp4"], self.files["clip.f140.m4a"]]
+
+    def test_all_steps_share_one_stream_copy_command(self):
+        plan = build_plan(self.info, self.sources, {"subtitles", "metadata", "thumbnail"})
+
+        self.assertEqual(plan.steps, ["merge", "subtitles", "metadata", "thumbnail"])
+        self.assertEqual(len(plan.inputs), 4)
+        args = plan.output_args
+        self.assertEqual(args[:2], ["-c", "copy"])
+        self.assertEqual(args[args.index("-c:s") + 1], "mov_text")
+        self.assertIn("date=2024-01-31", args)
+        self.assertEqual(args[args.index("-disposition:v:1") + 1], "attached_pic")
+        self.assertEqual(plan.cleanup, [self.files["clip.ko.vtt"], self.files["clip.webp"]])
+
+    @staticmethod
+    def run_fused_only(pp, info):
+        return pp.run(info)[1] if isinstance(pp, FusedPostProcessor) else info
+
+    def test_merger_is_replaced_and_output_written_once(self):
+        with FusedYoutubeDL({"quiet": True}, steps=("metadata",)) as ydl:
+            info = dict(self.info, __postprocessors=[FFmpegMergerPP(ydl)])
+            info["__files_to_merge"] = list(self.sources)
+            with patch.object(FusedPostProcessor, "real_run_ffmpeg") as run_ffmpeg, \
+                    patch("postprocess_plan.os.replace") as replace, \
+                    patch.object(ydl, "run_pp", side_effect=self.run_fused_only) as run_pp:
+                ydl.post_process(info["filepath"], info)
+
+        ran = [call.args[0] for call in run_pp.call_args_list]
+        self.assertFalse(any(isinstance(pp, FFmpegMergerPP) for pp in ran))
+        run_ffmpeg.assert_called_once()
+        inputs, outputs = run_ffmpeg.call_args.args
+        self.assertEqual([path for path, _ in inputs], self.sources)
+        self.assertTrue(outputs[0][0].endswith("clip.temp.mp4"))
+        replace.assert_called_once_with(outputs[0][0], self.info["filepath"])
+
+
+if __name__ == "__main__":
+    unittest.main()
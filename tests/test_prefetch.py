@@ -0,0 +1,115 @@
+import threading
+import unittest
+
+from circuit_breaker import CircuitBreakerRegistry
+from config import ConfigSnapshot
+from prefetch import InfoCache, MetadataPrefetcher, info_cache_key
+from youtube_downloader import YouTubeDownloader
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class InfoCacheTests(unittest.TestCase):
+    def test_returns_copies_until_expired_and_keys_on_extraction_options(self):
+        clock = FakeClock()
+        cache = InfoCache(ttl=60, clock=clock)
+        key = info_cache_key("https://youtu.be/dQw4w9WgXcQ", {'noplaylist': True})
+        self.assertEqual(key, info_cache_key(URL, {'noplaylist': True}))
+        self.assertNotEqual(key, info_cache_key(URL, {'noplaylist': True, 'proxy': "http://p:1"}))
+        self.assertIsNone(info_cache_key("https://example.com/video", {}))
+
+        cache.put(key, {'title': "t", 'formats': [{'format_id': "18"}]})
+        first = cache.get(key)
+        first['formats'].clear()
+        self.assertEqual(cache.get(key)['formats'], [{'format_id': "18"}])
+
+        clock.now = 60
+        self.assertIsNone(cache.get(key))
+
+
+class PrefetcherTests(unittest.TestCase):
+    def test_bounded_latest_first_with_cancel_and_settle(self):
+        release = threading.Event()
+        started = threading.Event()
+        fetched = []
+        results = []
+
+        def fetch(url):
+            fetched.append(url)
+            started.set()
+            release.wait(5)
+            return {'title': url}
+
+        prefetcher = MetadataPrefetcher(fetch, max_pending=2, min_interval=0)
+        self.addCleanup(prefetcher.shutdown)
+        delivered = threading.Event()
+
+        def callback(url, result):
+            results.append(url)
+            delivered.set()
+
+        prefetcher.submit("https://youtu.be/aaaaaaaaaaa", callback)
+        self.assertTrue(started.wait(5))
+        # 실행 중에 들어온 요청은 최근 것 max_pending개만 남음
+        for name in "bcd":
+            prefetcher.submit(f"https://youtu.be/{name * 11}", callback)
+        self.assertFalse(prefetcher.submit("https://youtu.be/aaaaaaaaaaa", callback))
+        prefetcher.cancel("https://youtu.be/aaaaaaaaaaa")
+        prefetcher.cancel("https://youtu.be/ccccccccccc")
+
+        # 추출이 끝나지 않으면 timeout 뒤 False로 돌아와 호출한 쪽이 직접 추출
+        self.assertFalse(prefetcher.settle("https://youtu.be/aaaaaaaaaaa", 0.01))
+        self.assertTrue(prefetcher.settle("https://youtu.be/bbbbbbbbbbb", 0.01))
+        settled = threading.Thread(target=prefetcher.settle, args=("https://youtu.be/aaaaaaaaaaa", 5))
+        settled.start()
+        release.set()
+        settled.join(5)
+        self.assertFalse(settled.is_alive())
+
+        self.assertTrue(delivered.wait(5))
+        self.assertEqual(fetched[0], "https://youtu.be/aaaaaaaaaaa")
+        self.assertNotIn("https://youtu.be/bbbbbbbbbbb", fetched)
+        self.assertNotIn("https://youtu.be/ccccccccccc", fetched)
+        # 취소한 실행 중 요청은 결과를 알리지 않음
+        self.assertEqual(results, ["https://youtu.be/ddddddddddd"])
+
+    def test_fetch_errors_are_reported_instead_of_dropped(self):
+        errors = []
+        reported = threading.Event()
+
+        def fetch(url):
+            raise RuntimeError("extractor broke")
+
+        def on_error(url, error):
+            errors.append((url, str(error)))
+            reported.set()
+
+        prefetcher = MetadataPrefetcher(fetch, min_interval=0, on_error=on_error)
+        self.addCleanup(prefetcher.shutdown)
+        prefetcher.submit(URL, lambda *_: self.fail("실패한 추출은 결과를 알리지 않아야 함"))
+        self.assertTrue(reported.wait(5))
+        self.assertEqual(errors, [(URL, "extractor broke")])
+
+
+class PrefetchInfoTests(unittest.TestCase):
+    def test_prefetch_respects_site_breaker(self):
+        breakers = CircuitBreakerRegistry(threshold=1)
+        downloader = YouTubeDownloader(URL, config=ConfigSnapshot({}, {}), breakers=breakers)
+        downloader.inspect_formats = lambda: {'title': "t"}
+        self.assertEqual(downloader.prefetch_info(), {'title': "t"})
+
+        # 차단으로 멈춘 사이트에는 미리 가져오기 요청을 보내지 않음
+        breakers.record_failure(downloader.circuit_key)
+        self.assertIsNone(downloader.prefetch_info())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import time
+import unittest
+from collections import namedtuple
+
+from circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, CircuitBreakerRegistry
+from disk_space import DiskSpaceLedger
+from process_pool import (
+    ParentServices, ProcessWorkerPool, RemoteBreakers, RemoteCookieCache, RemoteDiskLedger, RemoteProxyPool,
+    RemoteThroughput, WorkerError, WorkerTimeoutError,
+)
+from proxy_pool import ProxyPool
+from quality_ladder import ThroughputTracker
+
+Usage = namedtuple("Usage", ["total", "used", "free"])
+MB = 1024 * 1024
+
+
+def work(payload, worker):
+    if payload == "crash":
+        os._exit(3)
+    if payload == "hang":
+        time.sleep(60)
+    if payload == "raise":
+        raise ValueError("bad payload")
+    if payload == "wait":
+        while worker.control() is None:
+            time.sleep(0.05)
+        return worker.control()
+    if payload == "probe":
+        # 부모 큐가 시험 작업으로 연 차단기를 작업 프로세스에서 읽고 닫음
+        breakers = RemoteBreakers(worker)
+        seen = breakers.state("site")
+        breakers.record_success("site")
+        return seen
+    if payload == "reserve":
+        ledger = RemoteDiskLedger(worker)
+        reservation = ledger.try_reserve(".", 4 * MB)
+        # 진행 콜백마다 보내지 않고 1MB 이상 늘었을 때만 보냄
+        for consumed in (100, 200, 2 * MB, 2 * MB + 10, 3 * MB):
+            reservation.consumed = consumed
+        return reservation.reservation_id
+    if payload == "services":
+        pool = RemoteProxyPool(worker, ["http://a:1", "http://b:1"])
+        chosen = pool.choose(exclude={"http://a:1"})
+        pool.record_failure(chosen)
+        RemoteThroughput(worker).record("youtube.com", 1000, 2.0)
+        return chosen, RemoteCookieCache(worker).get("chrome")
+    report = worker.report
+    report('status', f"started {payload}")
+    return os.getpid()
+
+
+class ProcessWorkerPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = ProcessWorkerPool(work, max_workers=1, jobs_per_worker=3)
+        self.addCleanup(self.pool.shutdown)
+
+    def test_reports_progress_and_recycles_after_job_limit(self):
+        messages = []
+        first = self.pool.run("a", lambda *message: messages.append(message))
+        self.assertEqual(messages, [('status', "started a")])
+        self.assertNotEqual(first, os.getpid())
+        self.assertEqual(self.pool.run("b"), first)
+        self.assertEqual(self.pool.run("c"), first)
+        # 작업 세 개를 마친 프로세스는 교체됨
+        self.assertNotEqual(self.pool.run("d"), first)
+
+    def test_crash_timeout_and_job_errors_are_contained(self):
+        with self.assertRaises(WorkerError):
+            self.pool.run("crash")
+        with self.assertRaises(WorkerTimeoutError):
+            self.pool.run("hang", timeout=1)
+        pid = self.pool.run("d")
+        with self.assertRaisesRegex(WorkerError, "bad payload"):
+            self.pool.run("raise")
+        # 작업 코드의 예외 뒤에는 같은 프로세스를 계속 사용
+        self.assertEqual(self.pool.run("e"), pid)
+
+    def test_control_requests_reach_running_job(self):
+        requests = iter([None, None, "pause"])
+        self.assertEqual(self.pool.run("wait", control=lambda: next(requests, "pause")), "pause")
+        # 다음 작업은 이전 요청 없이 시작
+        self.assertEqual(self.pool.run("wait", control=lambda: "cancel"), "cancel")
+
+    def test_worker_uses_parent_breakers_and_disk_ledger(self):
+        clock = [0.0]
+        breakers = CircuitBreakerRegistry(threshold=1, cooldown=10, clock=lambda: clock[0])
+        breakers.record_failure("site")
+        clock[0] = 11
+        self.assertTrue(breakers.acquire("site", "probe"))
+        ledger = DiskSpaceLedger(disk_usage=lambda path: Usage(0, 0, 10 * MB))
+        services = ParentServices(breakers, ledger)
+        self.assertEqual(self.pool.run("probe", on_call=services.call), STATE_HALF_OPEN)
+        self.assertEqual(breakers.state("site"), STATE_CLOSED)
+
+        reports = []
+
+        def on_message(kind, *args):
+            reports.append(args[1])
+            services.consumed(*args)
+
+        reservation_id = self.pool.run("reserve", on_message, on_call=services.call)
+        self.assertEqual(reports, [2 * MB, 3 * MB])
+        # 작업 프로세스가 해제하지 않은 예약은 부모 장부에 남아 있다가 close()에서 정리
+        reservation = services._reservations[reservation_id]
+        self.assertEqual(reservation.consumed, 3 * MB)
+        self.assertEqual(ledger.available("."), 9 * MB)
+        services.close()
+        self.assertEqual(ledger.available("."), 10 * MB)
+
+    def test_worker_records_into_parent_proxy_pool_throughput_and_cookies(self):
+        pools = {}
+
+        def proxy_pool(proxies):
+            return pools.setdefault(tuple(proxies), ProxyPool(proxies))
+
+        class Cookies:
+            def get(self, browser):
+                return f"# {browser} cookies"
+
+        tracker = ThroughputTracker()
+        services = ParentServices(
+            CircuitBreakerRegistry(), DiskSpaceLedger(), proxy_pool_func=proxy_pool,
+            throughput=tracker, cookies=Cookies(),
+        )
+        chosen, cookies = self.pool.run("services", on_call=services.call)
+
+        self.assertEqual(chosen, "http://b:1")
+        self.assertEqual(pools[("http://a:1", "http://b:1")].stats(chosen).failures, 1)
+        self.assertEqual(tracker.rate("youtube.com"), 500)
+        self.assertEqual(cookies, "# chrome cookies")
+
+    def test_unhandled_call_raises_in_worker(self):
+        with self.assertRaisesRegex(WorkerError, "probe|breaker"):
+            self.pool.run("probe")
+
+
+if __name__ == "__main__":
+    unittest.main()
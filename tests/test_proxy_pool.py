@@ -0,0 +1,70 @@
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from proxy_pool import FAILURES_TO_EJECT, ProxyPool
+
+
+class StandInProxy(BaseHTTPRequestHandler):
+    """요청 경로(절대 URL)와 관계없이 204로 응답하는 로컬 대역 프록시"""
+
+    def do_GET(self):
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProxyPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), StandInProxy)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.live = f"http://127.0.0.1:{self.server.server_address[1]}"
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.dead = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        self.clock = FakeClock()
+
+    def test_failing_proxy_drops_out_and_recovers(self):
+        pool = ProxyPool([self.live, self.dead], check_url="http://example.invalid/generate_204",
+                         timeout=2, clock=self.clock)
+        for _ in range(FAILURES_TO_EJECT):
+            pool.check_all()
+        self.assertIsNotNone(pool.stats(self.live).latency)
+        self.assertGreater(pool.stats(self.dead).ejected_until, self.clock.now)
+        self.assertEqual({pool.choose() for _ in range(20)}, {self.live})
+
+        # 빠진 시간이 지나면 다시 후보가 되고, 상태 확인이 성공하면 완전히 복귀
+        self.clock.now = pool.stats(self.dead).ejected_until
+        self.server.server_close()
+        pool.set_proxies([self.dead])
+        self.assertEqual(pool.choose(), self.dead)
+        pool.record_success(self.dead, latency=0.1)
+        self.assertEqual(pool.stats(self.dead).ejected_until, 0.0)
+
+    def test_selection_is_weighted_by_observed_performance(self):
+        picks = iter([index / 100 for index in range(100)] + [0.99])
+        pool = ProxyPool(["http://fast:1", "http://slow:1"], clock=self.clock, rng=lambda: next(picks))
+        pool.record_success("http://fast:1", latency=0.1, num_bytes=40_000_000, seconds=10)
+        pool.record_success("http://slow:1", latency=0.4, num_bytes=10_000_000, seconds=10)
+        chosen = [pool.choose() for _ in range(100)]
+        self.assertGreater(chosen.count("http://fast:1"), 90)
+        self.assertIn("http://slow:1", chosen)
+        # 이 작업이 방금 실패한 프록시는 다른 후보가 있으면 고르지 않음
+        self.assertEqual(pool.choose(exclude={"http://fast:1"}), "http://slow:1")
+
+
+if __name__ == "__main__":
+    unittest.main()
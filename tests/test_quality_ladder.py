@@ -0,0 +1,70 @@
+import unittest
+
+from config import ConfigSnapshot
+from quality_ladder import ThroughputTracker, choose_for_info, choose_rung
+
+
+def video(format_id, height, tbr):
+    return {
+        "format_id": format_id, "ext": "mp4", "vcodec": "avc1", "acodec": "none",
+        "height": height, "width": height * 16 // 9, "fps": 30, "tbr": tbr,
+        "url": "https://example.com", "protocol": "https",
+    }
+
+
+FORMATS = [
+    {
+        "format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2",
+        "abr": 128, "tbr": 128, "url": "https://example.com", "protocol": "https",
+    },
+    video("136", 720, 2000),
+    video("137", 1080, 4000),
+    video("313", 2160, 16000),
+]
+
+
+class QualityLadderTests(unittest.TestCase):
+    def setUp(self):
+        self.info = {"formats": list(FORMATS), "duration": 100}
+        self.values = {
+            "download_path": "/tmp",
+            "quality": "best",
+            "preferred_quality": "best",
+            "video_format": "mp4",
+            "proxy_mode": "none",
+        }
+
+    def config(self, **values):
+        return ConfigSnapshot({**self.values, **values}, {"download_path": "/tmp"})
+
+    def test_deadline_uses_measured_throughput_and_respects_ceiling(self):
+        tracker = ThroughputTracker()
+        tracker.record("youtube.com", 1_000_000, 1.0)
+        # 1MB/s x 60초 = 60MB: 2160p(약 201.6MB)는 넘고 1080p(약 51.6MB)는 들어감
+        decision = choose_for_info(
+            self.info, self.config(quality_deadline_seconds=60), "youtube.com", tracker=tracker,
+        )
+        self.assertEqual(decision.choice, "1080p")
+        self.assertEqual(decision.limit_bytes, 60_000_000)
+
+        capped = choose_for_info(
+            self.info,
+            self.config(quality_deadline_seconds=60, preferred_quality="720p"),
+            "youtube.com",
+            tracker=tracker,
+        )
+        self.assertEqual(capped.choice, "720p")
+
+    def test_budget_smaller_than_every_rung_falls_back_to_lowest(self):
+        choices = {
+            "best": {"estimated_bytes": 300},
+            "1080p": {"estimated_bytes": 200},
+            "720p": {"estimated_bytes": 100},
+            "480p": None,
+        }
+        self.assertEqual(choose_rung(choices, "best", byte_budget=50).choice, "720p")
+        self.assertEqual(choose_rung(choices, "best", deadline=10).limit_bytes, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
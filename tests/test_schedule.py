@@ -0,0 +1,57 @@
+import time
+import unittest
+from datetime import datetime
+
+from download_queue import DownloadQueue
+from jobs import JobSpec
+from schedule import DownloadSchedule, format_schedule, parse_schedule
+
+
+class DownloadScheduleTests(unittest.TestCase):
+    def test_parse_windows_and_pick_current_policy(self):
+        windows = parse_schedule("09-18 1 2M; 18:30-09 8")
+        self.assertEqual(format_schedule(windows), "09:00-18:00 1 2M; 18:30-09:00 8 0")
+        with self.assertRaises(ValueError):
+            parse_schedule("09-09 1")
+        with self.assertRaises(ValueError):
+            parse_schedule("09-18 1 fast")
+
+        now = datetime(2026, 1, 5, 17, 59, 30)
+        schedule = DownloadSchedule(windows, now=lambda: now)
+        self.assertEqual(schedule.max_jobs(3), 1)
+        self.assertEqual(schedule.job_rate_limit(), 2 * 1024 ** 2)
+        self.assertEqual(schedule.seconds_until_change(), 30)
+
+        # 정하지 않은 18:00-18:30은 기본값, 자정을 넘는 시간대는 새벽에도 적용
+        now = datetime(2026, 1, 5, 18, 10)
+        self.assertEqual(schedule.max_jobs(3), 3)
+        self.assertIsNone(schedule.job_rate_limit())
+        now = datetime(2026, 1, 6, 2, 0)
+        self.assertEqual(schedule.max_jobs(3), 8)
+        self.assertEqual(schedule.peak_jobs(3), 8)
+
+    def test_queue_holds_jobs_until_window_allows_them(self):
+        now = datetime(2026, 1, 5, 10, 0)
+        schedule = DownloadSchedule(parse_schedule("09-18 0; 18-09 2"), now=lambda: now)
+        started = []
+
+        def run_job(job):
+            started.append(job.url)
+            return True
+
+        queue = DownloadQueue(run_job, max_workers=1, schedule=schedule)
+        jobs = [queue.submit(JobSpec(url=f"https://youtu.be/{index}")) for index in range(3)]
+        self.assertFalse(queue.join(timeout=0.2))
+        self.assertEqual(started, [])
+        self.assertEqual(queue.pending_count(), 3)
+
+        now = datetime(2026, 1, 5, 19, 0)
+        queue.set_schedule(schedule)
+        self.assertTrue(queue.join(timeout=5))
+        queue.shutdown()
+        self.assertTrue(all(job.result for job in jobs))
+        self.assertEqual(len(queue._threads), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from config import Config
+
+
+class SharedConfigTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.home = Path(self.temp_dir.name)
+        self.config_file = self.home / ".youtube_downloader_config.json"
+        patches = (
+            patch("config.Path.home", return_value=self.home),
+            patch("config.platform.system", return_value="Darwin"),
+        )
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_set_is_debounced_until_flush(self):
+        config = Config()
+
+        config.set("max_retries", 5)
+        config.set("retry_delay", 7)
+        self.assertFalse(self.config_file.exists())
+
+        self.assertTrue(config.flush())
+        saved = json.loads(self.config_file.read_text(encoding="utf-8"))
+        self.assertEqual(saved["max_retries"], 5)
+        self.assertEqual(saved["retry_delay"], 7)
+        self.assertEqual(list(self.home.glob("*.tmp")), [])
+
+    def test_snapshot_is_isolated_and_read_only(self):
+        config = Config()
+        snapshot = config.snapshot({"download_path": "/tmp/job"})
+
+        config.set("preferred_quality", "720p")
+
+        self.assertEqual(snapshot.get_preferred_quality(), "1080p")
+        self.assertEqual(snapshot.get_download_path(), Path("/tmp/job"))
+        with self.assertRaises(TypeError):
+            snapshot.set("preferred_quality", "480p")
+        config.flush()
+
+    def test_external_change_is_reloaded_and_notified(self):
+        config = Config()
+        config.save_config()
+        notifications = []
+        config.add_listener(notifications.append)
+
+        data = json.loads(self.config_file.read_text(encoding="utf-8"))
+        data["preferred_quality"] = "480p"
+        self.config_file.write_text(json.dumps(data), encoding="utf-8")
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertTrue(config.reload_if_changed())
+        self.assertEqual(config.get_preferred_quality(), "480p")
+        self.assertEqual(notifications, [None])
+
+    def test_shared_checks_the_file_at_most_once_per_interval(self):
+        with patch.object(Config, "_shared_instance", None), patch("config.time.monotonic", return_value=100.0) as clock:
+            config = Config.shared()
+            with patch.object(config, "_read_mtime", wraps=config._read_mtime) as read_mtime:
+                for _ in range(100):
+                    self.assertIs(Config.shared(), config)
+                self.assertEqual(read_mtime.call_count, 0)
+                # 직접 호출하면 간격과 관계없이 바로 확인
+                config.reload_if_changed()
+                self.assertEqual(read_mtime.call_count, 1)
+
+                clock.return_value = 100.0 + Config.RELOAD_CHECK_SECONDS
+                Config.shared()
+                self.assertEqual(read_mtime.call_count, 2)
+
+    def test_concurrent_saves_keep_changes_from_both_instances(self):
+        # 두 프로세스가 각자 읽은 뒤 서로 다른 키를 바꿔 저장하는 경우
+        first = Config()
+        first.save_config()
+        second = Config()
+        notifications = []
+        second.add_listener(notifications.append)
+
+        first.set("max_retries", 5)
+        second.set("retry_delay", 7)
+        self.assertTrue(first.flush())
+        self.assertTrue(second.flush())
+
+        saved = json.loads(self.config_file.read_text(encoding="utf-8"))
+        self.assertEqual((saved["max_retries"], saved["retry_delay"]), (5, 7))
+        # 저장하면서 다른 인스턴스의 값도 받아 옴
+        self.assertEqual(second.get_max_retries(), 5)
+        self.assertEqual(notifications, [("retry_delay",), None])
+
+    def test_unchanged_values_do_not_schedule_save(self):
+        config = Config()
+        notifications = []
+        config.add_listener(notifications.append)
+
+        config.set("max_retries", config.get_max_retries())
+
+        self.assertEqual(notifications, [])
+        self.assertFalse(config._dirty)
+
+
+if __name__ == "__main__":
+    unittest.main()
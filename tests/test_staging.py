@@ -0,0 +1,60 @@
+import errno
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from staging import StagingMover, move_file
+
+
+class StagingTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+
+    def test_cross_device_move_copies_then_replaces(self):
+        src = self.root / "staged.mp4"
+        src.write_bytes(b"video" * 1000)
+        dst = self.root / "library" / "staged.mp4"
+        real_replace = os.replace
+        calls = []
+
+        def replace(a, b):
+            calls.append((a, b))
+            if len(calls) == 1:
+                raise OSError(errno.EXDEV, "cross-device link")
+            return real_replace(a, b)
+
+        with patch("staging.os.replace", side_effect=replace):
+            move_file(src, dst)
+
+        self.assertEqual(dst.read_bytes(), b"video" * 1000)
+        self.assertFalse(src.exists())
+        self.assertTrue(str(calls[1][0]).endswith(".moving"))
+        self.assertEqual(list(dst.parent.iterdir()), [dst])
+
+    def test_pending_bytes_apply_back_pressure_until_moved(self):
+        mover = StagingMover(capacity_bytes=10, workers=1)
+        job_dir = self.root / "job-1"
+        job_dir.mkdir()
+        (job_dir / "clip.mp4").write_bytes(b"x" * 20)
+        gate = threading.Event()
+        done = []
+
+        with patch("staging.move_file", side_effect=lambda src, dst: gate.wait(5) and move_file(src, dst)):
+            mover.submit(job_dir, self.root / "library", lambda moved, error: done.append((moved, error)))
+            self.assertFalse(mover.wait_for_space(timeout=0.05))
+            gate.set()
+            self.assertTrue(mover.join(timeout=5))
+
+        self.assertTrue(mover.wait_for_space(timeout=0))
+        self.assertEqual(done[0][1], None)
+        self.assertTrue((self.root / "library" / "clip.mp4").exists())
+        self.assertFalse(job_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
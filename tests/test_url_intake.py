@@ -0,0 +1,72 @@
+import unittest
+
+from utils import iter_url_intake, parse_video_url, validate_url
+
+
+class UrlIntakeTests(unittest.TestCase):
+    def test_youtube_variants_share_canonical_video_key(self):
+        variants = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            "https://m.youtube.com/embed/dQw4w9WgXcQ?autoplay=1",
+        ]
+
+        parsed = {parse_video_url(url) for url in variants}
+
+        self.assertEqual(parsed, {(
+            "YouTube",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "youtube:dQw4w9WgXcQ",
+        )})
+
+    def test_intake_deduplicates_and_reports_invalid_lines(self):
+        lines = [
+            "# 주석",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://example.com/video",
+            "https://www.youtube.com/watch?v=short",
+            "https://www.pornhub.com/view_video.php?viewkey=abc123",
+        ]
+
+        results = list(iter_url_intake(lines))
+
+        self.assertEqual([result.line_no for result in results], [2, 4, 5, 6, 7])
+        accepted = [result for result in results if result.error is None]
+        self.assertEqual(
+            [result.video_key for result in accepted],
+            ["youtube:dQw4w9WgXcQ", "pornhub:abc123"],
+        )
+        self.assertIn("2번째 줄", results[1].error)
+        self.assertIn("지원하지 않는 URL", results[2].error)
+        self.assertEqual(results[3].error, "유효하지 않은 영상 ID입니다.")
+
+    def test_pornhub_url_requires_viewkey(self):
+        self.assertEqual(
+            parse_video_url("pornhub.com/view_video.php?viewkey=abc123&t=10")[2],
+            "pornhub:abc123",
+        )
+        for url in ("https://www.pornhub.com/", "https://www.pornhub.com/video/search?search=x"):
+            with self.assertRaises(ValueError):
+                parse_video_url(url)
+
+    def test_seen_keys_carry_across_batches(self):
+        seen = {}
+        list(iter_url_intake(["https://youtu.be/dQw4w9WgXcQ"], seen))
+
+        results = list(iter_url_intake(["https://youtu.be/dQw4w9WgXcQ"], seen))
+
+        self.assertIsNotNone(results[0].error)
+
+    def test_validate_url_behaviour_is_unchanged(self):
+        self.assertEqual(
+            validate_url("youtu.be/dQw4w9WgXcQ"),
+            (True, "https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
+        )
+        self.assertFalse(validate_url("https://vimeo.com/1")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,19 @@ import tempfile
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
-from config import Config
+from config import Config, ConfigSnapshot
+from log_view import LogModel
 from youtube_downloader import YouTubeDownloader, YouTubeDownloaderWindow
 
 
+def make_downloader(url="https://youtu.be/dQw4w9WgXcQ", **settings):
+    """설정 파일 없이 주어진 설정만으로 다운로더 생성"""
+    defaults = {"download_path": tempfile.gettempdir()}
+    return YouTubeDownloader(url, config=ConfigSnapshot(settings, defaults))
+
+
 class ConfigMigrationTests(unittest.TestCase):
     def test_legacy_web_client_is_migrated_to_recommended_client(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -135,11 +142,8 @@ class DownloadPathTests(unittest.TestCase):
             download_path = blocking_file / "Videos"
             messages = []
 
-            downloader = YouTubeDownloader.__new__(YouTubeDownloader)
+            downloader = make_downloader(download_path=str(download_path))
             downloader.status_callback = messages.append
-            downloader.progress_callback = None
-            downloader.config = Mock()
-            downloader.config.get_download_path.return_value = download_path
 
             with patch.object(downloader, "validate_url"), patch.object(
                 downloader,
@@ -155,11 +159,7 @@ class DownloadPathTests(unittest.TestCase):
 
 class ProgressOutputTests(unittest.TestCase):
     def test_download_progress_updates_bar_without_status_message(self):
-        downloader = YouTubeDownloader.__new__(YouTubeDownloader)
-        downloader.config = Mock()
-        downloader.config.should_show_progress.return_value = True
-        downloader.last_percent = 0.0
-        downloader.selected_quality = None
+        downloader = make_downloader(show_progress=True)
         status_messages = []
         progress_updates = []
         downloader.status_callback = status_messages.append
@@ -175,40 +175,23 @@ class ProgressOutputTests(unittest.TestCase):
         self.assertEqual(status_messages, [])
 
     def test_status_messages_are_always_appended(self):
-        class FakeCursor:
-            class MoveOperation:
-                End = object()
-
-        class FakeStatusText:
-            def __init__(self):
-                self.messages = []
-
-            def append(self, message):
-                self.messages.append(message)
-
-            def textCursor(self):
-                return FakeCursor()
-
-            def moveCursor(self, _operation):
-                pass
-
-        status_text = FakeStatusText()
-        window = SimpleNamespace(status_text=status_text)
+        log_model = LogModel()
+        window = SimpleNamespace(log_model=log_model)
 
         YouTubeDownloaderWindow.set_status(window, "첫 번째 메시지")
-        YouTubeDownloaderWindow.set_status(window, "두 번째 메시지")
+        YouTubeDownloaderWindow.set_status(window, "두 번째 메시지", job_id=1)
+        log_model.flush()
 
         self.assertEqual(
-            status_text.messages,
+            log_model.messages(),
             ["첫 번째 메시지", "두 번째 메시지"],
         )
 
 
 class YouTubeFallbackTests(unittest.TestCase):
     def setUp(self):
-        self.downloader = YouTubeDownloader.__new__(YouTubeDownloader)
+        self.downloader = make_downloader(max_retries=3)
         self.downloader.is_youtube = True
-        self.downloader.max_retries = 3
 
     def test_format_unavailable_retries_with_recommended_client(self):
         opts = {"extractor_args": {"youtube": {"player_client": ["web"]}}}
@@ -6,7 +6,9 @@ import platform
 import re
 import shutil
 import subprocess
+from collections import namedtuple
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 import yt_dlp
 
 def check_ffmpeg_installed(debug=False):
@@ -126,25 +128,92 @@ def format_file_size(size_bytes):
 
     return f"{size_bytes:.1f}{size_names[i]}"
 
-def supported_domains():
-    """지원하는 사이트 목록 반환"""
-    return [
+# 오류 종류 -> 오류 메시지에 포함되는 문구 (위에서부터 먼저 일치하는 종류 사용)
+# 다운로드 재시도/이벤트, 차단 감지, 대량 확인이 모두 이 분류를 사용합니다.
+DOWNLOAD_ERROR_CLASSES = (
+    ("bot_check", ("not a bot",)),
+    ("throttled", ("http error 429", "too many requests")),
+    ("format_unavailable", (
+        "requested format is not available",
+        "only images are available",
+        "no video formats found",
+        "no formats found",
+    )),
+    ("private", ("private",)),
+    ("geo_restricted", ("geo-restricted", "geo restricted", "in your country", "from your location")),
+    ("unavailable", ("video unavailable", "this video is unavailable", "has been removed", "is not available")),
+    ("auth_required", ("sign in", "age restricted", "age-restricted", "age-gate")),
+    ("cookies", ("cookie",)),
+    ("copyright", ("copyright",)),
+    ("forbidden", ("http error 403", "http error 401")),
+    ("disk_full", ("no space left on device",)),
+    ("network", ("timed out", "connection", "network", "unable to download")),
+)
+
+
+def classify_download_error(error_msg):
+    """다운로드/추출 오류 메시지를 기계가 읽을 수 있는 오류 종류로 분류, 알 수 없으면 'unknown'"""
+    error_msg = str(error_msg).lower()
+    for error_class, markers in DOWNLOAD_ERROR_CLASSES:
+        if any(marker in error_msg for marker in markers):
+            return error_class
+    return "unknown"
+
+
+SUPPORTED_SITES = tuple(
+    {**site, "pattern": re.compile(r'^(https?://)?(www\.)?' + site["domain"] + r'/')}
+    for site in (
         {"name": "YouTube", "domain": r'(youtube\.com|youtu\.be)', "normalize": True},
         {"name": "Pornhub", "domain": r'pornhub\.com', "normalize": False},
-    ]
+    )
+)
+
+_SITES_BY_NAME = {site["name"]: site for site in SUPPORTED_SITES}
+
+# 정확한 호스트 이름 -> 사이트 (일괄 입력 시 정규식 없이 조회)
+_SITES_BY_HOST = {
+    "youtube.com": _SITES_BY_NAME["YouTube"],
+    "www.youtube.com": _SITES_BY_NAME["YouTube"],
+    "m.youtube.com": _SITES_BY_NAME["YouTube"],
+    "youtu.be": _SITES_BY_NAME["YouTube"],
+    "www.youtu.be": _SITES_BY_NAME["YouTube"],
+    "pornhub.com": _SITES_BY_NAME["Pornhub"],
+    "www.pornhub.com": _SITES_BY_NAME["Pornhub"],
+}
+
+_YOUTUBE_ID_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(?:v=|/)([0-9A-Za-z_-]{11}).*',
+    r'shorts/([0-9A-Za-z_-]{11})',
+    r'embed/([0-9A-Za-z_-]{11})',
+    r'v/([0-9A-Za-z_-]{11})'
+))
+_YOUTUBE_ID_RE = re.compile(r'[0-9A-Za-z_-]{11}')
+_YOUTUBE_PATH_PREFIXES = frozenset(("shorts", "embed", "v", "live"))
+_SCHEME_RE = re.compile(r'^https?://')
+
+
+def estimate_format_bytes(fmt, duration=None):
+    """포맷의 예상 크기(바이트) 반환: filesize > filesize_approx > tbr x 재생 시간"""
+    size = fmt.get('filesize') or fmt.get('filesize_approx')
+    if size:
+        return int(size)
+    tbr = fmt.get('tbr')
+    duration = duration or fmt.get('duration')
+    if tbr and duration:
+        return int(tbr * 1000 / 8 * duration)
+    return None
+
+
+def supported_domains():
+    """지원하는 사이트 목록 반환"""
+    return SUPPORTED_SITES
 
 
 def normalize_youtube_url(url):
     """YouTube URL을 표준 형식으로 정규화"""
     video_id = None
-    patterns = [
-        r'(?:v=|/)([0-9A-Za-z_-]{11}).*',
-        r'shorts/([0-9A-Za-z_-]{11})',
-        r'embed/([0-9A-Za-z_-]{11})',
-        r'v/([0-9A-Za-z_-]{11})'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in _YOUTUBE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             video_id = match.group(1)
             break
@@ -160,11 +229,11 @@ def validate_url(url):
 
     url = url.strip()
 
-    if not re.match(r'^https?://', url):
+    if not _SCHEME_RE.match(url):
         url = 'https://' + url
 
-    for site in supported_domains():
-        if re.match(r'^(https?://)?(www\.)?' + site["domain"] + r'/', url):
+    for site in SUPPORTED_SITES:
+        if site["pattern"].match(url):
             if site["normalize"]:
                 normalized = normalize_youtube_url(url)
                 if normalized:
@@ -172,9 +241,143 @@ def validate_url(url):
                 return False, "유효하지 않은 영상 ID입니다."
             return True, url
 
-    domains = ", ".join(s["name"] for s in supported_domains())
+    domains = ", ".join(s["name"] for s in SUPPORTED_SITES)
     return False, f"지원하지 않는 URL입니다. (현재 지원: {domains})"
 
+
+UrlIntakeResult = namedtuple(
+    "UrlIntakeResult",
+    ["line_no", "raw", "url", "site", "video_key", "error"],
+)
+
+
+def parse_video_url(url):
+    """URL을 한 번만 파싱해 (사이트 이름, 표준 URL, 영상 키) 반환
+    영상 키는 같은 영상의 다른 URL 형태(youtu.be, shorts/, embed/ 등)에서 동일합니다.
+    지원하지 않거나 잘못된 URL이면 ValueError(사유)를 발생시킵니다."""
+    url = url.strip()
+    if not url:
+        raise ValueError("URL이 입력되지 않았습니다.")
+    if not _SCHEME_RE.match(url):
+        url = 'https://' + url
+    parts = urlsplit(url)
+    site = _SITES_BY_HOST.get((parts.hostname or "").lower())
+    if site is None:
+        domains = ", ".join(s["name"] for s in SUPPORTED_SITES)
+        raise ValueError(f"지원하지 않는 URL입니다. (현재 지원: {domains})")
+
+    if not site["normalize"]:
+        # 영상 페이지는 viewkey로만 구분되므로 없으면 (홈, 검색, 채널 등) 영상 URL이 아님
+        viewkey = parse_qs(parts.query).get("viewkey", [None])[0]
+        if not viewkey:
+            raise ValueError("영상 URL이 아닙니다. (viewkey가 없습니다)")
+        return (
+            site["name"],
+            f"https://www.pornhub.com/view_video.php?viewkey={viewkey}",
+            f"{site['name'].lower()}:{viewkey}",
+        )
+
+    segments = [segment for segment in parts.path.split('/') if segment]
+    video_id = None
+    if parts.hostname.lower().endswith("youtu.be"):
+        video_id = segments[0] if segments else None
+    elif segments[:1] == ["watch"]:
+        video_id = parse_qs(parts.query).get("v", [None])[0]
+    elif len(segments) >= 2 and segments[0] in _YOUTUBE_PATH_PREFIXES:
+        video_id = segments[1]
+    if not video_id or not _YOUTUBE_ID_RE.fullmatch(video_id):
+        raise ValueError("유효하지 않은 영상 ID입니다.")
+    return (
+        site["name"],
+        f"https://www.youtube.com/watch?v={video_id}",
+        f"youtube:{video_id}",
+    )
+
+
+def iter_url_intake(lines, seen=None):
+    """여러 줄의 URL을 검증/정규화하며 결과를 하나씩 반환 (대량 입력용)
+    빈 줄과 '#' 주석은 건너뜁니다. 이미 나온 영상은 중복 사유와 함께 반환되며,
+    seen(영상 키 -> 줄 번호)을 넘기면 여러 번의 호출에 걸쳐 중복을 제거합니다."""
+    seen = {} if seen is None else seen
+    for line_no, raw in enumerate(lines, 1):
+        text = raw.strip()
+        if not text or text.startswith('#'):
+            continue
+        try:
+            site, url, video_key = parse_video_url(text)
+        except ValueError as e:
+            yield UrlIntakeResult(line_no, text, None, None, None, str(e))
+            continue
+        if video_key in seen:
+            yield UrlIntakeResult(
+                line_no, text, url, site, video_key,
+                f"중복된 영상입니다. ({seen[video_key]}번째 줄과 동일)",
+            )
+            continue
+        seen[video_key] = line_no
+        yield UrlIntakeResult(line_no, text, url, site, video_key, None)
+
+
+_SECTION_RANGE_RE = re.compile(r'^\*?(?P<start>[\d:.]+)\s*-\s*(?P<end>[\d:.]+|inf)$')
+# 시간 구간을 적으려다 틀린 것으로 보이는 항목 (챕터 정규식으로 넘기지 않음)
+_SECTION_TIME_LIKE_RE = re.compile(r'^[\d:.\s-]*(?:inf)?$')
+
+
+def _split_sections(text):
+    """쉼표로 항목을 나누되, 역슬래시로 이스케이프한 쉼표와 괄호({1,3}, (a,b), [,]) 안의 쉼표는 유지"""
+    items = []
+    current = []
+    depth = 0
+    escaped = False
+    for char in str(text or ""):
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in '([{':
+            depth += 1
+        elif char in ')]}':
+            depth = max(0, depth - 1)
+        elif char == ',' and depth == 0:
+            items.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    items.append("".join(current))
+    return [item.strip() for item in items if item.strip()]
+
+
+def parse_sections(text):
+    """'1:00-1:30, 2:00:00-inf, 인트로' 형식의 구간 문자열을 (시간 구간 목록, 챕터 정규식 목록)으로 변환
+    시간 구간은 (시작 초, 끝 초)이며 끝이 inf면 영상 끝까지입니다. yt-dlp처럼 *를 붙이면 시간 구간으로만 읽습니다.
+    그 밖의 항목은 챕터 제목 정규식이며, 정규식 안의 쉼표는 괄호 안에 있거나 \\,로 적어야 합니다.
+    숫자와 ':'/'-'만으로 된 항목은 시간 구간으로 보고, 형식이 틀리면 챕터로 넘기지 않고 ValueError."""
+    ranges = []
+    chapters = []
+    for item in _split_sections(text):
+        match = _SECTION_RANGE_RE.match(item)
+        if not match:
+            bare = item.removeprefix('*')
+            if item.startswith('*') or (
+                _SECTION_TIME_LIKE_RE.match(bare) and re.search(r'\d', bare) and re.search(r'[:-]', bare)
+            ):
+                raise ValueError(f"구간 시간 형식이 올바르지 않습니다: {item} (예: 1:00-1:30)")
+            try:
+                re.compile(item)
+            except re.error:
+                raise ValueError(f"챕터 이름 형식이 올바르지 않습니다: {item}") from None
+            chapters.append(item)
+            continue
+        start = yt_dlp.utils.parse_duration(match['start'])
+        end = float('inf') if match['end'] == 'inf' else yt_dlp.utils.parse_duration(match['end'])
+        if start is None or end is None:
+            raise ValueError(f"구간 시간 형식이 올바르지 않습니다: {item}")
+        if end <= start:
+            raise ValueError(f"구간의 끝이 시작보다 앞섭니다: {item}")
+        ranges.append((start, end))
+    return ranges, chapters
+
+
 def check_video_availability(url):
     """YouTube 영상의 실제 존재 여부 확인 (선택적 기능)"""
     try:
@@ -2,10 +2,17 @@
 import sys
 import os
 import argparse
+import errno
+import glob
+import multiprocessing
 import re
+import shutil
+import tempfile
 import threading
 import time
+from contextlib import nullcontext
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from PySide6.QtGui import QIcon
 
@@ -16,15 +23,49 @@ except ImportError:
     pass
 
 import yt_dlp as youtube_dl
-from PySide6.QtCore import QObject, Signal, Qt
+from PySide6.QtCore import QObject, QTimer, Signal, Qt
 from PySide6.QtWidgets import (
-    QApplication, QDialog, QHBoxLayout, QLabel, QLineEdit, QMainWindow, QMessageBox, QProgressBar, QPushButton, QTextEdit, QVBoxLayout, QWidget, QFrame
+    QApplication, QCheckBox, QDialog, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QMainWindow, QMenu, QMessageBox, QProgressBar, QPushButton, QTabWidget, QTableView, QVBoxLayout, QWidget, QFrame
 )
 
-from config import Config
+from bulk_inspect import inspect_many, write_jsonl
+from circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, THROTTLE_ERROR_CLASSES, CircuitBreakerRegistry, breaker_key
+from config import Config, ConfigSnapshot
+from cookie_cache import BrowserCookieCache, apply_cookie_cache
+from disk_space import DiskSpaceLedger, InsufficientSpaceError, required_bytes
+from daemon import (
+    DEFAULT_HOST, DEFAULT_PORT, FINISHED_JOB_RETENTION, DaemonClient, DownloadDaemon, EventBus, RemoteDownloadQueue,
+)
+from download_queue import (
+    CONTROL_CANCEL, CONTROL_PAUSE, PHASE_DOWNLOADING, PHASE_EXTRACTING, PHASE_FAILED, PHASE_FINISHED,
+    PHASE_PAUSED, PHASE_POSTPROCESSING, PHASE_QUEUED, DownloadQueue, remove_partial_files,
+)
+from events import JsonEventWriter
 from ffmpeg_installer import FFmpegInstaller
+from history import open_shared_store
+from history_view import HistoryPanel
+from integrity import (
+    HASH_ALGORITHM, IncrementalHasher, IntegrityCache, IntegrityCheckPP, file_key, hash_file, verify_file,
+)
+from format_selection import preview_choices, select_for_opts
+from job_table import JobTableModel
+from jobs import JobSpec, add_batch_arguments, add_job_arguments, apply_batch_targets, load_job_file, spec_from_args
+from log_view import LogModel, LogView, create_file_logger
+from multi_output import MultiOutputPP
+from postprocess_plan import FusedYoutubeDL
+from prefetch import InfoCache, MetadataPrefetcher, info_cache_key
+from process_pool import (
+    ParentServices, ProcessWorkerPool, RemoteBreakers, RemoteCookieCache, RemoteDiskLedger, RemoteIntegrityCache,
+    RemoteJobState, RemoteProxyPool, RemoteThroughput, ReportingHistory, WorkerError,
+)
+from proxy_pool import ProxyPool
+from quality_ladder import ThroughputTracker, choose_for_info, ladder_for
+from staging import StagingMover
 from settings_dialog import SettingsDialog
-from utils import check_ffmpeg_installed, open_folder, validate_url
+from utils import (
+    check_ffmpeg_installed, classify_download_error, estimate_format_bytes, format_file_size, iter_url_intake,
+    open_folder, parse_video_url, validate_url,
+)
 
 STYLE = (
     "QMainWindow { background-color: #121212; }"
@@ -46,7 +87,7 @@ STYLE = (
     "QProgressBar { border: 1px solid #444; border-radius: 3px; background-color: #222;"
     " color: #eee; text-align: center; font-size: 11px; height: 18px; }"
     "QProgressBar::chunk { background-color: #3578e5; }"
-    "QTextEdit { background-color: #1e1e1e; color: #eee; border: 1px solid #444; "
+    "QListView { background-color: #1e1e1e; color: #eee; border: 1px solid #444; "
     "border-radius: 4px; padding: 8px; font-family: Consolas, Monaco, monospace; font-size: 12px; }"
     "QTabWidget::pane { border: 1px solid #444; background: #1e1e1e; top: -1px; }"
     "QTabBar::tab { background: #2d2d2d; color: #aaa; border: 1px solid #444; border-bottom: none; "
@@ -76,6 +117,10 @@ STYLE = (
     "QMessageBox QPushButton:hover { background-color: #3a3a3a; }"
     "QMessageBox QPushButton:pressed { background-color: #454545; }"
     "QMessageBox QPushButton:default { border: 2px solid #3578e5; }"
+    "QTableView { background-color: #1e1e1e; color: #eee; border: 1px solid #444; border-radius: 4px; "
+    "gridline-color: #333; selection-background-color: #3578e5; font-size: 12px; }"
+    "QHeaderView::section { background-color: #2d2d2d; color: #aaa; border: none; "
+    "border-right: 1px solid #444; padding: 3px 6px; font-size: 12px; }"
     "QScrollBar:vertical { background: #121212; width: 12px; margin: 0; }"
     "QScrollBar::handle:vertical { background: #2d2d2d; min-height: 20px; border-radius: 6px; border: 2px solid #121212; }"
     "QScrollBar::handle:vertical:hover { background: #3a3a3a; }"
@@ -87,6 +132,32 @@ STYLE = (
 )
 
 
+# 다운로드 차례가 왔을 때 진행 중인 미리 가져오기를 기다리는 최대 시간 (초), 넘으면 직접 추출
+PREFETCH_SETTLE_SECONDS = 3
+
+
+# 오류 종류 -> 사용자에게 보여 줄 설명 (format_unavailable/forbidden은 호환 모드 재시도 여부에 따라 따로 처리)
+ERROR_CLASS_MESSAGES = {
+    "bot_check": "사이트가 봇 확인을 요구합니다. 설정에서 쿠키 연동 또는 쿠키 파일을 사용해 보세요.",
+    "throttled": "요청이 너무 많아 사이트가 다운로드를 제한하고 있습니다.",
+    "private": "비공개 영상입니다. 접근 권한이 필요합니다.",
+    "geo_restricted": "지역 제한으로 인해 다운로드할 수 없습니다.",
+    "unavailable": "영상을 찾을 수 없거나 비공개/삭제된 상태입니다.",
+    "auth_required": "연령 제한 콘텐츠입니다. 설정에서 쿠키 연동 또는 쿠키 파일을 사용해 보세요.",
+    "cookies": "쿠키 설정에 오류가 있습니다. 설정의 '보안 및 쿠키' 탭에서 브라우저 연동 또는 쿠키 파일 경로가 올바른지 확인해주세요.",
+    "copyright": "저작권 문제로 다운로드할 수 없습니다.",
+    "disk_full": "디스크 공간이 부족합니다.",
+    "network": "네트워크 연결에 문제가 있습니다.",
+}
+
+
+class JobInterrupted(youtube_dl.utils.DownloadCancelled):
+    """일시 정지/취소 요청으로 다운로드를 멈춤 (진행 콜백에서 발생시키면 yt-dlp가 그대로 전달)"""
+
+    def __init__(self, action):
+        super().__init__(f"작업 {action} 요청")
+        self.action = action
+
 
 class YouTubeDownloader:
     """비디오 다운로더 로직 클래스 (YouTube, Pornhub 등 yt-dlp 지원 사이트)"""
@@ -100,9 +171,26 @@ class YouTubeDownloader:
         "no formats found",
     )
 
-    def __init__(self, url, status_callback=None, progress_callback=None):
+    EVENT_PROGRESS_INTERVAL = 0.5
+
+    _ffmpeg_lock = threading.Lock()
+
+    def __init__(self, url, status_callback=None, progress_callback=None, config=None, job=None,
+                 event_callback=None, history_store=None, breakers=None, disk_ledger=None,
+                 proxy_pool_func=None, throughput=None, cookie_cache=None, integrity_cache=None):
         self.url = url
-        self.config = Config()
+        self.job = job
+        self.event_callback = event_callback
+        self.history_store = history_store
+        self.breakers = breakers
+        # 작업 간에 공유하는 객체 (지정하지 않으면 이 프로세스의 공유 인스턴스)
+        self.disk_ledger = disk_ledger
+        self.proxy_pool_func = proxy_pool_func or ProxyPool.shared
+        self.throughput = throughput
+        self.cookie_cache = cookie_cache
+        self.integrity_cache = integrity_cache
+        # 작업 도중 설정 변경의 영향을 받지 않도록 시작 시점의 스냅샷 사용
+        self.config = config if config is not None else Config.shared().snapshot()
         self.last_percent = 0.0
         self.status_callback = status_callback
         self.progress_callback = progress_callback
@@ -110,6 +198,32 @@ class YouTubeDownloader:
         self.retry_delay = self.config.get_retry_delay()
         self.is_youtube = False
         self.selected_quality = None
+        self.title = None
+        self.last_error = None
+        self.paused = False
+        self.schedule = None
+        # 결과 파일과 무결성 검사
+        self.output_path = None
+        self.output_size = None
+        self.integrity = None
+        self._stream_hashers = None
+        self._stream_hashes = None
+        self._integrity_probe = None
+        # 이벤트와 전송 통계
+        self._event_phase = None
+        self._last_progress_event = float('-inf')
+        self._started_at = None
+        self._transfer_bytes = 0
+        self._transfer_seconds = 0.0
+        self._finished_bytes = 0
+        # 시도마다 다시 정해지는 연결/디스크 상태
+        self.proxy_pool = None
+        self.proxy = None
+        self._host_responded = False
+        self._disk_reservation = None
+        self._partial_files = None
+        self._rate_limit = None
+        self._ydl_params = ()
 
     def validate_url(self):
         """URL 유효성 검증"""
@@ -125,24 +239,75 @@ class YouTubeDownloader:
         if ffmpeg_path and Path(ffmpeg_path).is_file():
             return ffmpeg_path
 
-        ffmpeg_path = check_ffmpeg_installed(debug=False)
-        if ffmpeg_path:
-            self.config.set("ffmpeg_path", ffmpeg_path)
-        return ffmpeg_path
+        # 동시에 실행되는 작업들이 탐색을 한 번만 수행하도록 직렬화
+        with self._ffmpeg_lock:
+            shared_config = Config.shared()
+            ffmpeg_path = shared_config.get("ffmpeg_path")
+            if ffmpeg_path and Path(ffmpeg_path).is_file():
+                return ffmpeg_path
+
+            ffmpeg_path = check_ffmpeg_installed(debug=False)
+            if ffmpeg_path:
+                shared_config.set("ffmpeg_path", ffmpeg_path)
+            return ffmpeg_path
 
     def download_video(self):
         """비디오 다운로드"""
+        self._started_at = time.monotonic()
+        success = self._download_video()
+        if self.paused:
+            # 일시 정지는 결과가 아니므로 결과 이벤트/기록을 남기지 않음
+            return False
+        self._emit_result(success)
+        self._record_history(success)
+        return success
+
+    def _output_file_size(self):
+        """최종 파일 크기 (스테이징에서 옮기는 중이면 옮기기 전에 잰 크기)"""
+        if self.output_size is None and self.output_path:
+            try:
+                self.output_size = os.path.getsize(self.output_path)
+            except OSError:
+                pass
+        return self.output_size
+
+    def _record_history(self, success):
+        """다운로드 기록 저장 (실제 쓰기는 기록 스레드가 모아서 처리)"""
+        if self.history_store is None or not self.config.should_record_history():
+            return
+        try:
+            site, _url, video_key = parse_video_url(self.url)
+        except ValueError:
+            site = video_key = None
+        self.history_store.record(
+            url=self.url,
+            video_key=video_key,
+            site=site,
+            title=self.title,
+            success=success,
+            output_path=self.output_path,
+            size=self._output_file_size(),
+            quality=self.selected_quality,
+            elapsed=time.monotonic() - self._started_at,
+            avg_speed=self._transfer_bytes / self._transfer_seconds if self._transfer_seconds else None,
+            sha256=(self.integrity or {}).get(HASH_ALGORITHM),
+            error=None if success else self.last_error,
+        )
+
+    def _download_video(self):
         try:
             self.validate_url()
         except ValueError as e:
             if self.status_callback:
                 self.status_callback(f"오류: {e}")
+            self._emit('error', error_class="invalid_url", message=str(e))
             return False
 
         ffmpeg_path = self.get_ffmpeg_path()
         if not ffmpeg_path:
             if self.status_callback:
                 self.status_callback("\nFFmpeg가 설치되어 있지 않습니다. 'FFmpeg 설치' 버튼을 눌러 설치해주세요.")
+            self._emit('error', error_class="ffmpeg_missing", message="FFmpeg not found")
             return False
 
         download_path = self.config.get_download_path()
@@ -151,22 +316,206 @@ class YouTubeDownloader:
         except OSError as e:
             if self.status_callback:
                 self.status_callback(f"다운로드 경로 생성에 실패했습니다: {e}")
+            self._emit('error', error_class="download_path", message=str(e))
             return False
 
         ydl_opts = self.config.get_ydl_opts(is_youtube=self.is_youtube)
         ydl_opts.update({
             'progress_hooks': [self.my_hook],
+            'postprocessor_hooks': [self.postprocessor_hook],
             'ffmpeg_location': ffmpeg_path,
         })
+        pool_proxies = self.config.get_proxy_pool()
+        if pool_proxies:
+            self.proxy_pool = self.proxy_pool_func(pool_proxies)
+            self._assign_proxy(ydl_opts)
+        self.schedule = self.config.get_download_schedule()
+        if self.schedule is not None:
+            self._ydl_params = []
+            self._rate_limit = self.schedule.job_rate_limit()
+            if self._rate_limit:
+                ydl_opts['ratelimit'] = self._rate_limit
+                if self.status_callback:
+                    self.status_callback(f"시간대 정책에 따라 속도를 {format_file_size(self._rate_limit)}/s로 제한합니다.")
+
+        if self.config.should_verify_downloads():
+            self._stream_hashers = {}
+            self._stream_hashes = {}
+        self._partial_files = set()
 
+        staging_dir = None
+        if self.config.get_staging_path():
+            staging_dir = self._enter_staging(ydl_opts)
+            if staging_dir is None:
+                return False
+        try:
+            success = self._download_attempts(ydl_opts)
+        except JobInterrupted as e:
+            self._stop_for_control(e.action, staging_dir)
+            return False
+        staged_output = self.output_path
+        if success and self.config.should_verify_downloads():
+            self._compute_integrity()
+        if staging_dir is not None:
+            self._leave_staging(staging_dir, download_path, success)
+        if self.integrity is not None:
+            cache = self.integrity_cache or IntegrityCache.shared()
+            if staged_output != self.output_path:
+                cache.forget(staged_output)
+            # 스테이징에서 옮겨도 크기와 수정 시각은 유지되므로 최종 경로로 저장
+            cache.store(self.output_path, key=self.integrity['key'], **{
+                HASH_ALGORITHM: self.integrity[HASH_ALGORITHM],
+                'probe': self.integrity['probe'],
+            })
+        return success
+
+    def _compute_integrity(self):
+        """최종 파일 해시와 점검 결과 정리
+        후처리로 다시 쓴 파일이 아니면 전송 중 계산한 해시를 그대로 사용합니다."""
+        path = self.output_path
+        try:
+            key = file_key(path)
+        except (OSError, TypeError):
+            return
+        stream_hashes = self._stream_hashes or {}
+        digest, hashed_key = stream_hashes.get(path, (None, None))
+        if hashed_key != key:
+            # 병합/후처리로 새로 만든 파일은 방금 쓴 파일을 한 번 읽어 해시
+            try:
+                digest = hash_file(path)
+            except OSError:
+                return
+        self.integrity = {
+            HASH_ALGORITHM: digest,
+            'key': key,
+            'streams': {os.path.basename(name): value[0] for name, value in stream_hashes.items()},
+            'probe': self._integrity_probe,
+        }
+
+    def _enter_staging(self, ydl_opts):
+        """스테이징 공간을 기다린 뒤 작업 전용 폴더를 만들고 저장 위치를 그 폴더로 변경
+        일시 정지했던 작업은 받던 파일이 남아 있는 폴더를 다시 사용합니다."""
+        resumed_dir = (getattr(self.job, 'resume_data', None) or {}).get('staging_dir')
+        if resumed_dir and Path(resumed_dir).is_dir():
+            ydl_opts['outtmpl'] = str(Path(resumed_dir) / Path(ydl_opts['outtmpl']).name)
+            return Path(resumed_dir)
+        staging_path = self.config.get_staging_path()
+        mover = StagingMover.shared(self.config.get_staging_capacity())
+        if not mover.wait_for_space(timeout=0):
+            if self.status_callback:
+                self.status_callback("스테이징 폴더가 가득 차 라이브러리로 옮기는 중인 파일을 기다립니다...")
+            mover.wait_for_space()
+        try:
+            staging_path.mkdir(parents=True, exist_ok=True)
+            staging_dir = Path(tempfile.mkdtemp(prefix="job-", dir=staging_path))
+        except OSError as e:
+            if self.status_callback:
+                self.status_callback(f"스테이징 폴더를 만들 수 없습니다: {e}")
+            self._emit('error', error_class="staging_path", message=str(e))
+            return None
+        ydl_opts['outtmpl'] = str(staging_dir / Path(ydl_opts['outtmpl']).name)
+        return staging_dir
+
+    def _leave_staging(self, staging_dir, download_path, success):
+        """성공한 작업 폴더는 백그라운드로 라이브러리에 옮기고, 실패한 작업 폴더는 삭제"""
+        if not success:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return
+        staged_output = self.output_path
+        if staged_output and Path(staged_output).is_relative_to(staging_dir):
+            try:
+                self.output_size = os.path.getsize(staged_output)
+            except OSError:
+                pass
+            self.output_path = str(download_path / Path(staged_output).relative_to(staging_dir))
+            if self.job is not None:
+                self.job.update(output_path=self.output_path)
+
+        def on_moved(moved, error):
+            if error is not None:
+                if self.status_callback:
+                    self.status_callback(f"라이브러리 폴더로 옮기지 못했습니다 (파일은 {staging_dir}에 남아 있음): {error}")
+                self._emit('move', success=False, staging_dir=str(staging_dir), message=str(error))
+                return
+            if self.status_callback:
+                self.status_callback(f"라이브러리 폴더로 {len(moved)}개 파일을 옮겼습니다.")
+            self._emit('move', success=True, files=[str(path) for path in moved])
+
+        StagingMover.shared(self.config.get_staging_capacity()).submit(staging_dir, download_path, on_moved)
+        if self.status_callback:
+            self.status_callback("라이브러리 폴더로 옮기는 작업을 예약했습니다.")
+
+    def _partial_paths(self):
+        """이번 작업이 쓰던 임시 파일 (.part, 조각, 병합 전 스트림)"""
+        paths = []
+        for path in self._partial_files or ():
+            paths.append(path)
+            if path.endswith('.part'):
+                paths.append(path + '.ytdl')
+                paths.extend(glob.glob(glob.escape(path) + '-Frag*'))
+        return paths
+
+    def _stop_for_control(self, action, staging_dir):
+        """일시 정지/취소 요청으로 멈춘 다운로드 정리
+        일시 정지는 받던 파일을 그대로 두어 다시 시작하면 이어 받고, 취소는 설정에 따라 삭제합니다."""
+        keep = self.config.should_keep_partial_on_cancel()
+        partials = [str(staging_dir)] if staging_dir is not None else self._partial_paths()
+        if action == CONTROL_PAUSE and self.job is not None:
+            self.paused = True
+            self.job.set_resume_data({
+                'staging_dir': str(staging_dir) if staging_dir is not None else None,
+                'discard': [] if keep else partials,
+            })
+            self.job.update(phase=PHASE_PAUSED, speed=None, eta=None)
+            if self.status_callback:
+                self.status_callback("일시 정지했습니다. 다시 시작하면 받은 부분부터 이어 받습니다.")
+            self._emit('control', action="paused")
+            return
+        if not keep:
+            remove_partial_files(partials)
+        self.last_error = "사용자가 취소함"
+        if self.status_callback:
+            self.status_callback("다운로드를 취소했습니다.")
+        self._emit('control', action="cancelled")
+
+    def _check_control(self):
+        """작업에 일시 정지/취소 요청이 있으면 JobInterrupted 발생"""
+        action = getattr(self.job, 'control', None)
+        if action in (CONTROL_PAUSE, CONTROL_CANCEL):
+            raise JobInterrupted(action)
+
+    def _wait_before_retry(self, delay):
+        """재시도 대기 (기다리는 동안에도 일시 정지/취소 요청 확인)"""
+        deadline = time.monotonic() + delay
+        while (remaining := deadline - time.monotonic()) > 0:
+            self._check_control()
+            time.sleep(min(remaining, 0.5))
+
+    def _download_attempts(self, ydl_opts):
         for attempt in range(self.max_retries):
             try:
+                self._check_control()
                 if self.status_callback:
                     self.status_callback(f"다운로드를 시작합니다... (시도 {attempt + 1}/{self.max_retries})")
+                self._emit_phase(PHASE_EXTRACTING, attempt=attempt + 1)
 
-                with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([self.url])
-
+                with self._open_ydl(ydl_opts) as ydl:
+                    if any(self.config.get_quality_target()) or self.config.is_disk_preflight_enabled():
+                        self._download_with_selection(ydl, ydl_opts)
+                    else:
+                        info = self._cached_info(ydl_opts)
+                        if info is not None:
+                            ydl.process_ie_result(info, download=True)
+                        else:
+                            ydl.download([self.url])
+
+                self._record_host_response()
+                if self.proxy_pool is not None:
+                    self.proxy_pool.record_success(
+                        self.proxy,
+                        num_bytes=self._transfer_bytes,
+                        seconds=self._transfer_seconds,
+                    )
                 if self.status_callback:
                     quality_note = (
                         f" (선택 화질: {self.selected_quality})"
@@ -180,67 +529,323 @@ class YouTubeDownloader:
 
             except youtube_dl.utils.DownloadError as e:
                 error_msg = str(e).lower()
-                user_message = f"\n다운로드 오류 (시도 {attempt + 1}/{self.max_retries}): "
-                format_unavailable = any(
-                    message in error_msg
-                    for message in self.YOUTUBE_CLIENT_FALLBACK_ERRORS[1:]
-                )
+                error_class = classify_download_error(error_msg)
                 should_retry_client = self._should_retry_with_compatible_client(
                     error_msg,
                     ydl_opts,
                     attempt,
                 )
-
-                if format_unavailable:
+                user_message = f"\n다운로드 오류 (시도 {attempt + 1}/{self.max_retries}): "
+                if error_class == "format_unavailable":
                     if should_retry_client:
                         user_message += "현재 요청 방식으로 영상 포맷을 가져오지 못했습니다. YouTube 호환 모드로 전환해 재시도합니다."
                     else:
                         user_message += "요청한 영상 포맷을 사용할 수 없습니다. 재생 클라이언트 또는 화질 설정을 확인해주세요."
-                elif "video unavailable" in error_msg or "this video is unavailable" in error_msg:
-                    user_message += "영상을 찾을 수 없거나 비공개/삭제된 상태입니다."
-                elif "sign in" in error_msg or "age restricted" in error_msg or "age-gate" in error_msg:
-                    user_message += "연령 제한 콘텐츠입니다. 설정에서 쿠키 연동 또는 쿠키 파일을 사용해 보세요."
-                elif "cookie" in error_msg:
-                    user_message += "쿠키 설정에 오류가 있습니다. 설정의 '보안 및 쿠키' 탭에서 브라우저 연동 또는 쿠키 파일 경로가 올바른지 확인해주세요."
-                elif "copyright" in error_msg:
-                    user_message += "저작권 문제로 다운로드할 수 없습니다."
-                elif "private" in error_msg:
-                    user_message += "비공개 영상입니다. 접근 권한이 필요합니다."
-                elif "geo-restricted" in error_msg or "geo restricted" in error_msg:
-                    user_message += "지역 제한으로 인해 다운로드할 수 없습니다."
-                elif "http error 403" in error_msg or "http error 401" in error_msg:
+                elif error_class == "forbidden":
                     if should_retry_client:
                         user_message += "YouTube 파일 접근이 차단되었습니다. YouTube 호환 모드로 전환해 재시도합니다."
                     else:
                         user_message += "접근 권한이 없습니다. 설정에서 쿠키 또는 권장 요청 프로필을 사용해보세요."
                 else:
-                    user_message += "알 수 없는 다운로드 오류가 발생했습니다."
+                    user_message += ERROR_CLASS_MESSAGES.get(error_class, "알 수 없는 다운로드 오류가 발생했습니다.")
 
+                # 미리 가져온 스트림 주소가 만료됐을 수 있으므로 다음 시도는 새로 추출
+                InfoCache.shared().forget(info_cache_key(self.url, ydl_opts))
+                host_blocked = self._record_host_error(error_class)
                 if self.status_callback:
                     self.status_callback(user_message)
+                error_fields = {
+                    'attempt': attempt + 1,
+                    'max_attempts': self.max_retries,
+                    'error_class': error_class,
+                    'message': str(e),
+                }
+                will_retry = attempt < self.max_retries - 1 and not host_blocked
+                if not will_retry:
+                    self._emit('error', **error_fields)
+                if host_blocked:
+                    # 재시도할수록 차단이 길어지므로 멈춘 동안은 더 요청하지 않음
+                    if self.status_callback:
+                        delay = self.breakers.retry_delay(self.circuit_key) or 0
+                        self.status_callback(
+                            f"사이트가 요청을 제한하고 있어 재시도하지 않습니다. "
+                            f"이 사이트의 작업은 약 {max(1, round(delay / 60))}분 동안 대기합니다."
+                        )
+                    return False
 
                 if should_retry_client:
                     Config.set_youtube_player_client(
                         ydl_opts,
                         self.YOUTUBE_FALLBACK_CLIENT,
                     )
-
-                if attempt < self.max_retries - 1:
+                if self.proxy_pool is not None and error_class in THROTTLE_ERROR_CLASSES | {"network"}:
+                    # 막히거나 연결이 안 되는 프록시는 기록하고 다음 시도는 다른 프록시로
+                    self.proxy_pool.record_failure(self.proxy)
+                    self._assign_proxy(ydl_opts)
+                if error_class in ("auth_required", "cookies") and ydl_opts.get('cookiesfrombrowser'):
+                    # 저장해 둔 쿠키가 만료됐을 수 있으므로 다음 시도는 브라우저에서 다시 추출
+                    (self.cookie_cache or BrowserCookieCache.shared()).invalidate(ydl_opts['cookiesfrombrowser'][0])
+
+                if will_retry:
                     if self.status_callback:
                         self.status_callback(f"{self.retry_delay}초 후 재시도합니다...")
-                    time.sleep(self.retry_delay)
+                    self._wait_before_retry(self.retry_delay)
+                    # 대기 중에 일시 정지/취소되지 않고 실제로 다시 시도할 때만 알림
+                    self._emit('retry', **error_fields)
                 else:
                     if self.status_callback:
                         self.status_callback("최대 재시도 횟수를 초과하여 다운로드를 중단합니다.")
                     return False
 
+            except InsufficientSpaceError as e:
+                # 재시도해도 공간이 생기지 않으므로 바로 중단
+                if self.status_callback:
+                    self.status_callback(f"\n{e}")
+                self._emit('error', attempt=attempt + 1, error_class="disk_full", message=str(e))
+                return False
+
+            except JobInterrupted:
+                raise
+
             except Exception as e:
                 if self.status_callback:
                     self.status_callback(f"\n예상치 못한 오류가 발생했습니다: {e}")
+                self._emit('error', attempt=attempt + 1, error_class="unexpected", message=str(e))
                 return False
 
         return False
 
+    @property
+    def circuit_key(self):
+        """차단 상태를 공유하는 (사이트, 프록시), 지원하지 않는 URL이면 None"""
+        try:
+            site = parse_video_url(self.url)[0]
+        except ValueError:
+            return None
+        return breaker_key(site, self.config.get_proxy_key())
+
+    def _assign_proxy(self, ydl_opts):
+        """프록시 풀에서 방금 실패한 프록시를 빼고 골라 옵션에 지정"""
+        tried = {self.proxy} if self.proxy else set()
+        self.proxy = self.proxy_pool.choose(exclude=tried)
+        if self.proxy:
+            ydl_opts['proxy'] = self.proxy
+            if self.status_callback:
+                self.status_callback(f"프록시 배정: {Config.mask_proxy_url(self.proxy)}")
+
+    def _record_host_response(self):
+        """사이트가 정상 응답함 (차단으로 멈췄던 사이트면 다시 엶)"""
+        if self.breakers is not None and not self._host_responded:
+            self._host_responded = True
+            self.breakers.record_success(self.circuit_key)
+
+    def _record_host_error(self, error_class):
+        """다운로드 오류를 차단 상태에 반영하고, 사이트가 멈춘 상태면 True"""
+        if self.breakers is None:
+            return False
+        key = self.circuit_key
+        if error_class in THROTTLE_ERROR_CLASSES:
+            self.breakers.record_failure(key)
+        elif self.breakers.state(key) == STATE_HALF_OPEN:
+            # 시험 작업이 차단 외의 이유로 실패했다면 사이트는 응답하고 있는 것
+            self.breakers.record_success(key)
+        return self.breakers.state(key) == STATE_OPEN
+
+    @property
+    def throughput_host(self):
+        """전송 속도 측정값을 모으는 사이트 이름"""
+        if self.is_youtube:
+            return "youtube.com"
+        return (urlsplit(self.url).hostname or "").lower().removeprefix("www.")
+
+    def _download_with_selection(self, ydl, ydl_opts):
+        """화질 한도와 디스크 공간을 먼저 확인하고 고른 화질로 같은 추출 결과를 다운로드"""
+        info = self._extract_info(ydl, ydl_opts)
+        if not info or not info.get('formats'):
+            # 재생목록 등 포맷 목록이 없는 결과는 기본 선택으로 처리
+            ydl.process_ie_result(info, download=True)
+            return
+
+        choice = None
+        selection = None
+        if any(self.config.get_quality_target()):
+            decision = choose_for_info(info, self.config, self.throughput_host, self.is_youtube, self.throughput)
+            if self.status_callback:
+                self.status_callback(f"화질 자동 조절: {decision.choice} 선택 - {decision.reason}")
+            self._emit(
+                'quality',
+                choice=decision.choice,
+                reason=decision.reason,
+                limit_bytes=decision.limit_bytes,
+                estimated_bytes=(decision.selection or {}).get('estimated_bytes'),
+            )
+            choice, selection = decision.choice, decision.selection
+
+        ledger = self.disk_ledger or DiskSpaceLedger.shared(self.config.get_min_free_space())
+        if self.config.is_disk_preflight_enabled():
+            choice, self._disk_reservation = self._reserve_disk_space(
+                ledger, info, ydl_opts, choice, selection,
+            )
+        try:
+            target_opts = dict(ydl_opts)
+            if choice is not None:
+                target_opts['format'] = self.config.snapshot(
+                    {'preferred_quality': choice}
+                ).get_ydl_opts(self.is_youtube)['format']
+            if target_opts['format'] == ydl_opts['format']:
+                ydl.process_ie_result(info, download=True)
+                return
+            with self._open_ydl(target_opts) as target_ydl:
+                target_ydl.process_ie_result(info, download=True)
+        finally:
+            ledger.release(self._disk_reservation)
+            self._disk_reservation = None
+
+    def _cached_info(self, ydl_opts):
+        """미리 가져온 추출 결과, 없으면 None"""
+        info = InfoCache.shared().get(info_cache_key(self.url, ydl_opts))
+        if info is not None and self.status_callback:
+            self.status_callback("미리 가져온 영상 정보를 사용합니다.")
+        return info
+
+    def _extract_info(self, ydl, ydl_opts):
+        """미리 가져온 결과가 있으면 재사용하고, 없으면 추출해 캐시에 저장"""
+        info = self._cached_info(ydl_opts)
+        if info is None:
+            info = ydl.extract_info(self.url, download=False)
+            InfoCache.shared().put(info_cache_key(self.url, ydl_opts), info)
+        return info
+
+    def prefetch_info(self):
+        """다운로드 전에 영상 정보를 미리 추출해 캐시를 채우고 요약 반환
+        사이트가 차단으로 멈춰 있으면 요청을 보내지 않고 None을 반환합니다."""
+        breakers = self.breakers
+        if breakers is not None and breakers.state(self.circuit_key) != STATE_CLOSED:
+            return None
+        return self.inspect_formats()
+
+    def _reserve_disk_space(self, ledger, info, ydl_opts, choice, selection):
+        """예상 크기와 후처리 여유분만큼 저장 위치의 공간을 예약 (choice, 예약) 반환
+        공간이 부족하면 낮은 화질로 낮추고, 그래도 부족하면 다른 작업이 끝날 때까지 대기합니다."""
+        if selection is None:
+            selection = select_for_opts(info, ydl_opts)
+        steps = self.config.get_postprocess_steps()
+        profiles = self.config.get_output_profiles()
+        needed = required_bytes(selection, steps, profiles)
+        if needed is None:
+            if self.status_callback:
+                self.status_callback("예상 크기를 알 수 없어 디스크 공간 확인을 건너뜁니다.")
+            return choice, None
+
+        target_dir = Path(ydl_opts['outtmpl']).parent
+        self._finished_bytes = 0
+        reservation = ledger.try_reserve(target_dir, needed)
+        if reservation is not None:
+            return choice, reservation
+
+        available = ledger.available(target_dir)
+        current = choice or self.config.get_preferred_quality()
+        lower_choices = ladder_for(current)[1:]
+        previews = preview_choices(info, self.config, self.is_youtube, lower_choices)
+        for lower in lower_choices:
+            lower_needed = required_bytes(previews.get(lower), steps, profiles)
+            if lower_needed is None or lower_needed >= needed:
+                continue
+            reservation = ledger.try_reserve(target_dir, lower_needed)
+            if reservation is not None:
+                if self.status_callback:
+                    self.status_callback(
+                        f"디스크 공간이 부족해 {lower} 화질로 낮춥니다. "
+                        f"(필요 {format_file_size(needed)}, 사용 가능 {format_file_size(max(available, 0))})"
+                    )
+                self._emit('disk', action="downgraded", choice=lower, needed_bytes=lower_needed,
+                           available_bytes=available)
+                return lower, reservation
+
+        if self.status_callback:
+            self.status_callback(
+                f"디스크 공간이 부족해 다른 작업이 끝날 때까지 기다립니다. "
+                f"(필요 {format_file_size(needed)}, 사용 가능 {format_file_size(max(available, 0))})"
+            )
+        self._emit('disk', action="held", needed_bytes=needed, available_bytes=available)
+        reservation = ledger.reserve(target_dir, needed)
+        if reservation is None:
+            available = ledger.available(target_dir)
+            raise InsufficientSpaceError(
+                errno.ENOSPC,
+                f"디스크 공간이 부족합니다. (필요 {format_file_size(needed)}, "
+                f"사용 가능 {format_file_size(max(available, 0))}, 위치 {target_dir})",
+            )
+        return choice, reservation
+
+    def _open_ydl(self, ydl_opts):
+        """다운로드용 YoutubeDL 생성
+        넣을 자막/메타데이터/표지가 있으면 병합과 함께 한 번에 처리하고,
+        추가 출력이 있으면 마지막 후처리로 등록합니다."""
+        ydl_opts = apply_cookie_cache(ydl_opts, self.cookie_cache)
+        steps = self.config.get_postprocess_steps()
+        if steps:
+            ydl = FusedYoutubeDL(ydl_opts, steps=steps)
+        else:
+            ydl = youtube_dl.YoutubeDL(ydl_opts)
+        if self.config.should_verify_downloads():
+            ydl.add_post_processor(IntegrityCheckPP(ydl, self.integrity_cache), when='after_move')
+        profiles = self.config.get_output_profiles()
+        if profiles:
+            ydl.add_post_processor(MultiOutputPP(ydl, profiles), when='after_move')
+        if self.schedule is not None:
+            self._ydl_params.append(ydl.params)
+        return ydl
+
+    def _follow_schedule(self):
+        """받는 도중 시간대가 바뀌면 속도 한도 갱신
+        yt-dlp는 전송 블록마다 params의 ratelimit을 다시 읽으므로 열어 둔 YoutubeDL에 바로 반영됩니다."""
+        rate = self.schedule.job_rate_limit()
+        if rate == self._rate_limit:
+            return
+        self._rate_limit = rate
+        for params in self._ydl_params:
+            params['ratelimit'] = rate
+        if self.status_callback:
+            limit = f"{format_file_size(rate)}/s로 제한합니다" if rate else "제한을 해제합니다"
+            self.status_callback(f"시간대가 바뀌어 속도를 {limit}.")
+
+    def _emit(self, event_type, **fields):
+        if event_type == 'error':
+            self.last_error = fields.get('message')
+        if self.event_callback is not None:
+            self.event_callback(event_type, **fields)
+
+    def _emit_phase(self, phase, **fields):
+        if phase != self._event_phase:
+            self._event_phase = phase
+            self._emit('phase', phase=phase, **fields)
+
+    def _emit_result(self, success):
+        if self.event_callback is None:
+            return
+        output_path = self.output_path
+        size = self._output_file_size()
+        self._emit_phase(PHASE_FINISHED if success else PHASE_FAILED)
+        self._emit(
+            'result',
+            success=success,
+            url=self.url,
+            output_path=output_path,
+            size=size,
+            selected_quality=self.selected_quality,
+            **self._integrity_fields(),
+        )
+
+    def _integrity_fields(self):
+        if self.integrity is None:
+            return {}
+        probe = self.integrity['probe']
+        return {
+            HASH_ALGORITHM: self.integrity[HASH_ALGORITHM],
+            'probe_ok': probe['ok'] if probe else None,
+        }
+
     def _should_retry_with_compatible_client(self, error_msg, ydl_opts, attempt):
         """YouTube 클라이언트 문제일 때 권장 호환 프로필 재시도 여부를 반환합니다."""
         current_client = Config.get_youtube_player_client(ydl_opts)
@@ -256,14 +861,36 @@ class YouTubeDownloader:
 
     def my_hook(self, d):
         """yt-dlp 진행률 콜백"""
+        self._check_control()
+        if self._partial_files is not None:
+            partial = d.get('tmpfilename') if d['status'] == 'downloading' else d.get('filename')
+            if partial:
+                self._partial_files.add(partial)
         info = d.get('info_dict') or {}
+        if info.get('title'):
+            self.title = info['title']
         height = info.get('height')
         if height:
             fps = info.get('fps')
             fps_note = f", {fps:g}fps" if isinstance(fps, (int, float)) else ""
             self.selected_quality = f"{height}p{fps_note}"
 
+        if self.job is not None:
+            self._update_job(d, info)
+        if self.event_callback is not None:
+            self._emit_progress(d)
+
+        if self._stream_hashers is not None:
+            self._hash_progress(d)
+
+        if self._disk_reservation is not None and d['status'] == 'downloading':
+            # 이미 쓴 바이트는 실제 남은 공간에 반영되므로 예약에서 제외
+            self._disk_reservation.consumed = self._finished_bytes + (d.get('downloaded_bytes') or 0)
+
         if d['status'] == 'downloading':
+            self._record_host_response()
+            if self.schedule is not None:
+                self._follow_schedule()
             percent_str = re.sub(r'\x1b\[[0-9;]*m', '', str(d.get('_percent_str', '0%') or '0%'))
             try:
                 percent = float(percent_str.strip('%'))
@@ -276,13 +903,106 @@ class YouTubeDownloader:
                 self.last_percent = percent
 
         elif d['status'] == 'finished':
+            if d.get('filename') and not self.output_path:
+                self.output_path = d['filename']
+            self._finished_bytes += d.get('total_bytes') or d.get('downloaded_bytes') or 0
+            transferred = d.get('total_bytes') or d.get('downloaded_bytes')
+            (self.throughput or ThroughputTracker.shared()).record(self.throughput_host, transferred, d.get('elapsed'))
+            if transferred and d.get('elapsed'):
+                self._transfer_bytes += transferred
+                self._transfer_seconds += d['elapsed']
             if self.status_callback:
                 self.status_callback("다운로드 완료. 후처리 중...")
             if self.progress_callback:
                 self.progress_callback(100)
 
-    def inspect_formats(self, player_client=None):
-        """다운로드 없이 제공 포맷과 현재 설정의 선택 결과를 반환합니다."""
+    def _hash_progress(self, d):
+        """전송 중인 파일에 새로 쓰인 부분을 이어서 해시"""
+        if d['status'] == 'downloading':
+            path = d.get('tmpfilename') or d.get('filename')
+            if not path:
+                return
+            hasher = self._stream_hashers.get(path)
+            if hasher is None:
+                hasher = self._stream_hashers[path] = IncrementalHasher(path)
+            hasher.update_to(d.get('downloaded_bytes'))
+        elif d['status'] == 'finished' and d.get('filename'):
+            filename = d['filename']
+            hasher = (
+                self._stream_hashers.pop(d.get('tmpfilename') or f"{filename}.part", None)
+                or self._stream_hashers.pop(filename, None)
+                or IncrementalHasher(filename)
+            )
+            hasher.rename(filename)
+            try:
+                key = file_key(filename)
+            except OSError:
+                return
+            hasher.update_to(key[0], force=True)
+            self._stream_hashes[filename] = (hasher.hexdigest(), key)
+
+    def _emit_progress(self, d):
+        """진행 이벤트 발행 (EVENT_PROGRESS_INTERVAL 간격으로 제한)"""
+        if d['status'] == 'finished':
+            self._emit_phase(PHASE_POSTPROCESSING, filename=d.get('filename'))
+            return
+        if d['status'] != 'downloading':
+            return
+        self._emit_phase(PHASE_DOWNLOADING)
+        now = time.monotonic()
+        if now - self._last_progress_event < self.EVENT_PROGRESS_INTERVAL:
+            return
+        self._last_progress_event = now
+        self._emit(
+            'progress',
+            downloaded_bytes=d.get('downloaded_bytes'),
+            total_bytes=d.get('total_bytes') or d.get('total_bytes_estimate'),
+            speed=d.get('speed'),
+            eta=d.get('eta'),
+        )
+
+    def _update_job(self, d, info):
+        """작업 큐의 진행 상태 스냅샷 갱신 (화면은 일정 주기로만 읽어감)"""
+        if d['status'] == 'downloading':
+            self.job.update(
+                phase=PHASE_DOWNLOADING,
+                title=info.get('title') or self.job.state.title,
+                downloaded_bytes=d.get('downloaded_bytes') or 0,
+                total_bytes=d.get('total_bytes') or d.get('total_bytes_estimate'),
+                speed=d.get('speed'),
+                eta=d.get('eta'),
+                selected_quality=self.selected_quality,
+            )
+        elif d['status'] == 'finished':
+            self.job.update(
+                phase=PHASE_POSTPROCESSING,
+                selected_quality=self.selected_quality,
+                speed=None,
+                eta=None,
+            )
+
+    def postprocessor_hook(self, d):
+        """yt-dlp 후처리 콜백: 최종 파일 경로 기록"""
+        info = d.get('info_dict') or {}
+        filepath = info.get('filepath')
+        if d.get('status') == 'finished' and filepath:
+            self.output_path = filepath
+            if self.job is not None:
+                self.job.update(output_path=filepath)
+        if d.get('status') == 'finished' and d.get('postprocessor') == IntegrityCheckPP.pp_key():
+            probe = info.get('integrity_probe')
+            self._integrity_probe = probe
+            if probe and not probe['ok'] and self.status_callback:
+                self.status_callback(f"파일 점검에서 문제가 발견되었습니다: {probe['error']}")
+        if d.get('status') == 'finished' and d.get('postprocessor') == MultiOutputPP.pp_key():
+            outputs = info.get('multi_output_files') or {}
+            if self.status_callback:
+                self.status_callback(f"추가 출력 {len(outputs)}개 생성: {', '.join(outputs)}")
+            self._emit('outputs', files=outputs)
+
+    def inspect_formats(self, player_client=None, include_choices=False):
+        """다운로드 없이 제공 포맷과 현재 설정의 선택 결과를 반환합니다.
+        include_choices가 True면 선호 해상도별 선택 결과도 추가 추출 없이 계산합니다."""
         self.validate_url()
         ydl_opts = self.config.get_ydl_opts(is_youtube=self.is_youtube)
         if self.is_youtube and player_client:
@@ -293,8 +1013,12 @@ class YouTubeDownloader:
         if ffmpeg_path:
             ydl_opts['ffmpeg_location'] = ffmpeg_path
 
-        with youtube_dl.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(self.url, download=False)
+        # 미리 가져온 결과가 있으면 YoutubeDL을 만들지 않음
+        info = self._cached_info(ydl_opts)
+        if info is None:
+            with youtube_dl.YoutubeDL(apply_cookie_cache(ydl_opts, self.cookie_cache)) as ydl:
+                info = ydl.extract_info(self.url, download=False)
+            InfoCache.shared().put(info_cache_key(self.url, ydl_opts), info)
 
         formats = info.get('formats') or []
         video_formats = [
@@ -309,8 +1033,16 @@ class YouTubeDownloader:
             ),
             None,
         )
-        return {
+        duration = info.get('duration')
+        selected_formats = info.get('requested_formats') or [info]
+        sizes = [estimate_format_bytes(fmt, duration) for fmt in selected_formats]
+        result = {
             'title': info.get('title') or '',
+            'duration': duration,
+            'availability': info.get('availability') or 'public',
+            'estimated_bytes': (
+                sum(sizes) if sizes and None not in sizes else None
+            ),
             'available_heights': sorted({
                 int(fmt['height']) for fmt in video_formats
             }),
@@ -321,27 +1053,31 @@ class YouTubeDownloader:
                 selected_video.get('format_id') if selected_video else None
             ),
         }
+        if include_choices:
+            result['choices'] = preview_choices(info, self.config, self.is_youtube)
+        return result
 
 
 class SignalProxy(QObject):
     """GUI 업데이트를 위한 시그널 프록시"""
     status_signal = Signal(str)
     progress_signal = Signal(float)
-    download_btn_state = Signal(bool)
     ffmpeg_btn_state = Signal(bool)
     show_message = Signal(str, str, str)
     open_folder = Signal()
+    preview_signal = Signal(str, object)
+    config_changed = Signal(object)
 
 
 class YouTubeDownloaderWindow(QMainWindow):
     """메인 윈도우 클래스"""
 
-    def __init__(self):
+    def __init__(self, download_queue=None):
         super().__init__()
         self.setWindowTitle("비디오 다운로드 도구 (PySide6)")
-        self.setFixedSize(700, 435)
+        self.setFixedSize(760, 745)
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.config = Config()
+        self.config = Config.shared()
         self._drag_pos = None
 
         # 윈도우 아이콘 설정
@@ -402,6 +1138,21 @@ class YouTubeDownloaderWindow(QMainWindow):
         self.layout.addWidget(self.url_label)
         self.layout.addWidget(self.url_edit)
 
+        # 입력한 링크의 미리 가져온 영상 정보 (제목, 길이, 해상도, 예상 크기)
+        self.preview_label = QLabel("")
+        self.preview_label.setFixedHeight(16)
+        self.layout.addWidget(self.preview_label)
+
+        # 구간 다운로드 (비워 두면 전체 영상)
+        sections_layout = QHBoxLayout()
+        self.sections_edit = QLineEdit()
+        self.sections_edit.setPlaceholderText("구간 (선택): 1:00-1:30, 2:00:00-inf 또는 챕터 이름")
+        self.precise_cuts_check = QCheckBox("정밀 자르기")
+        self.precise_cuts_check.setToolTip("구간 경계에서 다시 인코딩해 정확히 자릅니다. 끄면 키프레임 단위로 빠르게 자릅니다.")
+        sections_layout.addWidget(self.sections_edit)
+        sections_layout.addWidget(self.precise_cuts_check)
+        self.layout.addLayout(sections_layout)
+
         btn_layout = QHBoxLayout()
         paste_btn = QPushButton("링크 붙여넣기")
         self.download_btn = QPushButton("다운로드")
@@ -419,17 +1170,63 @@ class YouTubeDownloaderWindow(QMainWindow):
         self.progress.setRange(0, 100)
         self.layout.addWidget(self.progress)
 
-        self.status_text = QTextEdit()
-        self.status_text.setReadOnly(True)
-        self.layout.addWidget(self.status_text)
+        # 데몬에 클라이언트로 붙은 경우 원격 큐를 그대로 사용
+        self.download_queue = download_queue or DownloadQueue(
+            self.run_queued_job,
+            max_workers=self.config.get_max_concurrent_downloads(),
+            key_func=JobSpec.coalesce_key,
+            breakers=CircuitBreakerRegistry.shared(),
+            breaker_func=JobSpec.breaker_key,
+            schedule=self.config.get_download_schedule(),
+        )
+        self.job_model = JobTableModel(self.download_queue, parent=self)
+        self.job_table = QTableView()
+        self.job_table.setModel(self.job_model)
+        self.job_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.job_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.job_table.verticalHeader().setVisible(False)
+        self.job_table.verticalHeader().setDefaultSectionSize(22)
+        self.job_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.job_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.job_table.customContextMenuRequested.connect(self.show_job_menu)
+        # 작업 목록과 다운로드 기록은 탭으로 전환 (기록은 탭을 열 때 첫 페이지만 읽음)
+        self.history_store = open_shared_store()
+        self.job_tabs = QTabWidget()
+        self.job_tabs.setFixedHeight(210)
+        self.job_tabs.addTab(self.job_table, "작업")
+        if self.history_store is not None:
+            self.history_panel = HistoryPanel(self.history_store)
+            self.job_tabs.addTab(self.history_panel, "기록")
+        self.layout.addWidget(self.job_tabs)
+        self.job_model.summary_changed.connect(self.set_progress)
+        self.worker_pool = None
+        self.worker_pool_lock = threading.Lock()
+
+        self.log_file_logger, self.log_file_listener = create_file_logger()
+        self.log_model = LogModel(file_logger=self.log_file_logger)
+        self.status_log = LogView(self.log_model)
+        self.layout.addWidget(self.status_log)
 
         self.signals = SignalProxy()
         self.signals.status_signal.connect(self.set_status)
+        # 설정 알림은 다른 스레드에서 올 수 있으므로 시그널로 GUI 스레드에 넘김
+        self.signals.config_changed.connect(self.on_config_changed)
+        self._config_listener = self.signals.config_changed.emit
+        self.config.add_listener(self._config_listener)
         self.signals.progress_signal.connect(self.set_progress)
-        self.signals.download_btn_state.connect(self.download_btn.setEnabled)
         self.signals.ffmpeg_btn_state.connect(self.ffmpeg_btn.setEnabled)
         self.signals.show_message.connect(self.show_message_dialog)
         self.signals.open_folder.connect(self.on_open_folder)
+        self.signals.preview_signal.connect(self.show_preview)
+
+        # 입력이 멈춘 뒤에만 미리 가져오기 (한 글자씩 입력할 때마다 요청하지 않음)
+        self.prefetcher = MetadataPrefetcher(self.prefetch_metadata, on_error=self.on_prefetch_error)
+        self.preview_url = None
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(500)
+        self.prefetch_timer.timeout.connect(self.on_url_settled)
+        self.url_edit.textChanged.connect(self.prefetch_timer.start)
 
         paste_btn.clicked.connect(self.on_paste_link)
         self.download_btn.clicked.connect(self.on_download)
@@ -439,13 +1236,9 @@ class YouTubeDownloaderWindow(QMainWindow):
 
         self.set_status("URL을 입력하고 다운로드 버튼을 누르세요.")
 
-    def set_status(self, msg):
-        """스레드 안전한 상태 메시지 업데이트"""
-        try:
-            self.status_text.append(msg)
-            self.status_text.moveCursor(self.status_text.textCursor().MoveOperation.End)
-        except RuntimeError as e:
-            print(f"GUI 업데이트 실패: {e}")
+    def set_status(self, msg, job_id=None):
+        """스레드 안전한 상태 메시지 업데이트 (다음 화면 갱신 주기에 일괄 표시)"""
+        self.log_model.append(msg, job_id)
 
     def set_progress(self, percent):
         """스레드 안전한 진행률 업데이트"""
@@ -469,38 +1262,158 @@ class YouTubeDownloaderWindow(QMainWindow):
             self.url_edit.setText(text)
             self.url_edit.setFocus()
 
+    def prefetch_metadata(self, url):
+        """미리 가져오기 스레드에서 실행되는 추출"""
+        # 추출 도중 설정이 바뀌어도 영향을 받지 않도록 스냅샷 사용
+        downloader = YouTubeDownloader(url, config=self.config.snapshot(), breakers=CircuitBreakerRegistry.shared())
+        return downloader.prefetch_info()
+
+    def on_prefetch_error(self, url, error):
+        """미리 가져오기 실패는 로그에 남기고 다운로드할 때 다시 추출"""
+        self.set_status(f"영상 정보를 미리 가져오지 못했습니다 ({url}): {error}")
+        if url == self.preview_url:
+            self.signals.preview_signal.emit(url, None)
+
+    def on_url_settled(self):
+        """입력이 멈추면 올바른 링크의 영상 정보를 미리 가져오기"""
+        url = self.url_edit.text().strip()
+        if url == self.preview_url:
+            return
+        if self.preview_url:
+            self.prefetcher.cancel(self.preview_url)
+        self.preview_url = None
+        self.preview_label.clear()
+        if not url or not self.config.should_prefetch_metadata() or not validate_url(url)[0]:
+            return
+        self.preview_url = url
+        self.preview_label.setText("영상 정보를 가져오는 중...")
+        self.prefetcher.submit(url, lambda fetched_url, result: self.signals.preview_signal.emit(fetched_url, result))
+
+    def show_preview(self, url, result):
+        """미리 가져온 영상 정보 표시 (그 사이 입력이 바뀌었으면 무시)"""
+        if url != self.preview_url:
+            return
+        if result is None:
+            self.preview_label.clear()
+            return
+        parts = [result['title'] or url]
+        if result['duration']:
+            minutes, seconds = divmod(int(result['duration']), 60)
+            hours, minutes = divmod(minutes, 60)
+            parts.append(f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}")
+        if result['available_heights']:
+            parts.append("/".join(f"{height}p" for height in reversed(result['available_heights'][-3:])))
+        if result['estimated_bytes']:
+            parts.append(f"약 {format_file_size(result['estimated_bytes'])}")
+        self.preview_label.setText(" · ".join(parts))
+
     def on_download(self):
         """다운로드 시작"""
         url = self.url_edit.text().strip()
         if not url:
             QMessageBox.warning(self, "입력 오류", "비디오 링크를 입력하세요.")
             return
-        self.set_status("다운로드를 시작합니다...")
-        self.download_btn.setEnabled(False)
-        self.progress.setValue(0)
-        threading.Thread(target=self.download_thread, args=(url,), daemon=True).start()
-
-    def download_thread(self, url):
-        """다운로드 스레드"""
+        sections = self.sections_edit.text().strip()
+        try:
+            spec = JobSpec(
+                url=url,
+                sections=sections or None,
+                precise_cuts=self.precise_cuts_check.isChecked() if sections else None,
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return
         try:
+            job = self.download_queue.submit(spec)
+        except (RuntimeError, OSError, ValueError) as e:
+            # 데몬에 붙은 경우 연결이 끊겼거나 데몬이 거절한 경우
+            QMessageBox.warning(self, "다운로드 오류", f"작업을 대기열에 추가하지 못했습니다: {e}")
+            return
+        # 원격 작업(RemoteJob)에는 명세가 없으므로 데몬 쪽에서만 합쳐짐
+        if getattr(job, "spec", spec) is not spec:
+            self.set_status(f"같은 영상을 받는 작업 #{job.job_id}에 연결했습니다.", job.job_id)
+        else:
+            self.set_status("다운로드 대기열에 추가했습니다.", job.job_id)
+            if self.config.should_prefetch_metadata():
+                # 대기하는 동안 추출해 두면 차례가 왔을 때 바로 전송 시작
+                self.prefetcher.submit(job.url)
+        self.preview_url = None
+        self.url_edit.clear()
+        self.sections_edit.clear()
+
+    def run_queued_job(self, job):
+        """작업 큐 스레드에서 실행되는 다운로드"""
+        def job_status(msg):
+            self.set_status(msg, job.job_id)
+
+        # 이미 추출 중인 미리 가져오기가 곧 끝나면 그 결과를 이어 쓰고, 아니면 기다리지 않고 직접 추출
+        # (실행 중인 추출은 멈출 수 없으므로 작업 슬롯을 오래 잡아 두지 않음)
+        if not self.prefetcher.settle(job.url, timeout=PREFETCH_SETTLE_SECONDS):
+            self.prefetcher.cancel(job.url)
+        config = job.spec.resolve_config()
+        pool = self.get_worker_pool()
+        if pool is not None:
+            success = run_job_in_process(pool, job, config, job_status, history_store=self.history_store)
+        else:
             downloader = YouTubeDownloader(
-                url,
-                status_callback=self.thread_safe_status,
-                progress_callback=self.thread_safe_progress
+                job.url,
+                status_callback=job_status,
+                config=config,
+                job=job,
+                history_store=self.history_store,
+                breakers=CircuitBreakerRegistry.shared(),
             )
             success = downloader.download_video()
-            if success:
-                self.signals.status_signal.emit("다운로드가 완료되었습니다.")
-                if self.config.should_auto_open_folder():
-                    self.signals.open_folder.emit()
-            else:
-                self.signals.status_signal.emit("다운로드에 실패했습니다.")
-        finally:
-            self.signals.download_btn_state.emit(True)
+        if success:
+            job_status("다운로드가 완료되었습니다.")
+            if self.config.should_auto_open_folder():
+                self.signals.open_folder.emit()
+        elif not job.is_paused() and job.control is None:
+            job_status("다운로드에 실패했습니다.")
+        return success
+
+    def show_job_menu(self, pos):
+        """작업 목록 오른쪽 클릭 메뉴: 일시 정지/다시 시작/취소/우선순위"""
+        index = self.job_table.indexAt(pos)
+        if not index.isValid():
+            return
+        job = self.job_model.job_at(index.row())
+        if job.is_done():
+            return
+        queue = self.download_queue
+        paused = job.is_paused()
+        started = job.state.phase not in (PHASE_QUEUED, PHASE_PAUSED)
+        menu = QMenu(self)
+        if paused or job.control == CONTROL_PAUSE:
+            menu.addAction("다시 시작", lambda: queue.resume(job))
+        else:
+            menu.addAction("일시 정지", lambda: queue.pause(job))
+        menu.addAction("취소", lambda: queue.cancel(job))
+        if not started:
+            menu.addSeparator()
+            menu.addAction("우선순위 올리기", lambda: queue.set_priority(job, job.priority + 1))
+            menu.addAction("우선순위 내리기", lambda: queue.set_priority(job, job.priority - 1))
+        menu.exec(self.job_table.viewport().mapToGlobal(pos))
+
+    def get_worker_pool(self):
+        """작업 프로세스 실행을 켰으면 프로세스 풀 (처음 쓸 때 만듦), 아니면 None"""
+        if not self.config.use_worker_processes():
+            return None
+        with self.worker_pool_lock:
+            if self.worker_pool is None:
+                self.worker_pool = open_worker_pool(self.config, self.config.get_max_concurrent_downloads())
+            return self.worker_pool
+
+    def on_config_changed(self, _keys):
+        """설정 변경 시 동시 다운로드 수/시간대 정책 반영 (GUI 스레드)"""
+        self.download_queue.set_max_workers(self.config.get_max_concurrent_downloads())
+        self.download_queue.set_schedule(self.config.get_download_schedule())
+        if self.worker_pool is not None:
+            self.worker_pool.set_max_workers(self.config.get_max_concurrent_downloads())
 
     def thread_safe_status(self, msg):
-        """스레드 안전한 상태 시그널 발생"""
-        self.signals.status_signal.emit(msg)
+        """스레드 안전한 상태 메시지 추가 (시그널 없이 로그 대기열에 적재)"""
+        self.set_status(msg)
 
     def thread_safe_progress(self, percent):
         """스레드 안전한 진행률 시그널 발생"""
@@ -566,6 +1479,17 @@ class YouTubeDownloaderWindow(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.set_status("설정이 저장되었습니다.")
 
+    def closeEvent(self, event):
+        """창을 닫을 때 남은 로그를 파일에 기록"""
+        self.config.remove_listener(self._config_listener)
+        self.prefetcher.shutdown()
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
+        self.log_model.flush()
+        if self.log_file_listener is not None:
+            self.log_file_listener.stop()
+        super().closeEvent(event)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             child = self.childAt(event.position().toPoint())
@@ -585,21 +1509,270 @@ class YouTubeDownloaderWindow(QMainWindow):
         self._drag_pos = None
         super().mouseReleaseEvent(event)
 
-def run_headless_download(url, download_path=None):
+def run_job_in_worker(payload, worker):
+    """작업 프로세스에서 실행되는 다운로드 (ProcessWorkerPool의 target)
+    차단 상태, 디스크 예약, 프록시 측정값, 전송 속도, 쿠키, 무결성 캐시는 다른 작업과 함께
+    써야 하므로 부모 프로세스의 것을 씁니다."""
+    config = ConfigSnapshot(*payload['config'])
+    # 부모 프로세스가 미리 가져온 추출 결과를 이어 씀
+    for key, info in payload['infos']:
+        InfoCache.shared().put(key, info)
+
+    def emit(event_type, **fields):
+        worker.report('event', event_type, fields)
+
+    downloader = YouTubeDownloader(
+        payload['url'],
+        status_callback=lambda message: worker.report('status', message),
+        config=config,
+        job=RemoteJobState(payload['job_id'], worker, payload['resume_data']),
+        event_callback=emit if payload['events'] else None,
+        history_store=ReportingHistory(worker.report) if payload['history'] else None,
+        breakers=RemoteBreakers(worker),
+        disk_ledger=RemoteDiskLedger(worker),
+        proxy_pool_func=lambda proxies: RemoteProxyPool(worker, proxies),
+        throughput=RemoteThroughput(worker),
+        cookie_cache=RemoteCookieCache(worker),
+        integrity_cache=RemoteIntegrityCache(worker),
+    )
+    success = downloader.download_video()
+    # 스테이징 폴더에서 옮기는 작업까지 끝나야 결과를 보냄
+    StagingMover.join_shared()
+    return success
+
+
+def open_worker_pool(config, workers):
+    """설정에서 작업 프로세스 실행을 켰으면 프로세스 풀, 아니면 None"""
+    if not config.use_worker_processes():
+        return None
+    return ProcessWorkerPool(run_job_in_worker, max_workers=workers, jobs_per_worker=config.get_worker_recycle_jobs())
+
+
+def run_job_in_process(pool, job, config, status_callback, event_callback=None, history_store=None):
+    """작업을 작업 프로세스에서 실행하고 진행 상태/기록을 이 프로세스에 반영
+    작업 프로세스의 차단 상태/디스크 예약 요청은 이 프로세스의 공유 객체로 처리합니다."""
+    services = ParentServices(
+        CircuitBreakerRegistry.shared(),
+        DiskSpaceLedger.shared(config.get_min_free_space()),
+        proxy_pool_func=ProxyPool.shared,
+        throughput=ThroughputTracker.shared(),
+        cookies=BrowserCookieCache.shared(),
+        integrity=IntegrityCache.shared(),
+    )
+
+    def on_message(kind, *args):
+        if kind == 'status':
+            status_callback(args[0])
+        elif kind == 'state':
+            job.update(**args[0])
+        elif kind == 'resume_data':
+            job.set_resume_data(args[0])
+        elif kind == 'event' and event_callback is not None:
+            event_callback(args[0], **args[1])
+        elif kind == 'history' and history_store is not None:
+            history_store.record(**args[0])
+        elif kind == 'disk_consumed':
+            services.consumed(*args)
+
+    try:
+        site, _url, video_key = parse_video_url(job.url)
+    except ValueError:
+        site = video_key = None
+    payload = {
+        'url': job.url,
+        'job_id': job.job_id,
+        'config': (dict(config.config), dict(config.default_config), config.revision),
+        'infos': InfoCache.shared().entries_for(video_key) if video_key else [],
+        'events': event_callback is not None,
+        'history': history_store is not None and config.should_record_history(),
+        'resume_data': job.resume_data,
+    }
+    try:
+        return bool(pool.run(
+            payload, on_message, timeout=config.get_worker_job_timeout(), control=lambda: job.control,
+            on_call=services.call,
+        ))
+    except WorkerError as e:
+        status_callback(f"작업 프로세스 오류: {e}")
+        if event_callback is not None:
+            event_callback('error', error_class="worker", message=str(e))
+        if payload['history']:
+            history_store.record(
+                url=job.url, video_key=video_key, site=site, title=job.state.title,
+                success=False, error=str(e),
+            )
+        return False
+    finally:
+        # 작업 프로세스가 죽거나 시간 초과로 끝나 해제하지 못한 예약 정리
+        services.close()
+
+
+def _status_stream(events):
+    """JSON 이벤트가 표준 출력을 쓰면 사람이 읽는 메시지는 표준 오류로 보냄"""
+    if events is not None and events.stream is sys.stdout:
+        return sys.stderr
+    return sys.stdout
+
+
+def run_headless_download(url, download_path=None, spec=None, events=None):
     """GUI 없이 동일한 다운로드 로직을 실행해 자동화 검증을 지원합니다."""
+    status_stream = _status_stream(events)
+
     def print_status(message):
-        print(message, flush=True)
+        print(message, file=status_stream, flush=True)
+
+    spec = spec or JobSpec(url=url, download_path=download_path)
+    downloader = YouTubeDownloader(
+        spec.url,
+        status_callback=print_status,
+        config=spec.resolve_config(),
+        event_callback=events.emit if events is not None else None,
+        history_store=open_shared_store(),
+        breakers=CircuitBreakerRegistry.shared(),
+    )
+    success = downloader.download_video()
+    # 스테이징 폴더를 쓰는 경우 라이브러리로 옮기는 작업이 끝난 뒤 종료
+    StagingMover.join_shared()
+    return 0 if success else 1
+
+
+def run_headless_jobs(specs, workers=4, events=None):
+    """작업 명세 목록을 한 프로세스에서 동시에 실행합니다."""
+    print_lock = threading.Lock()
+    status_stream = _status_stream(events)
+    history_store = open_shared_store()
+    worker_pool = open_worker_pool(Config.shared(), workers)
+
+    def run_job(job):
+        def print_status(message):
+            with print_lock:
+                print(f"[{job.job_id}] {message}", file=status_stream, flush=True)
+
+        config = job.spec.resolve_config()
+        event_callback = events.bind(job.job_id) if events is not None else None
+        if worker_pool is not None:
+            return run_job_in_process(worker_pool, job, config, print_status, event_callback, history_store)
+        downloader = YouTubeDownloader(
+            job.url,
+            status_callback=print_status,
+            config=config,
+            job=job,
+            event_callback=event_callback,
+            history_store=history_store,
+            breakers=CircuitBreakerRegistry.shared(),
+        )
+        return downloader.download_video()
+
+    download_queue = DownloadQueue(
+        run_job,
+        max_workers=workers,
+        key_func=JobSpec.coalesce_key,
+        breakers=CircuitBreakerRegistry.shared(),
+        breaker_func=JobSpec.breaker_key,
+        schedule=Config.shared().get_download_schedule(),
+    )
+    jobs = {}
+    for spec in specs:
+        job = download_queue.submit(spec)
+        if job.job_id in jobs:
+            with print_lock:
+                print(f"[{job.job_id}] 같은 영상/옵션의 작업과 합쳤습니다: {spec.url}", file=status_stream, flush=True)
+        jobs[job.job_id] = job
+    if download_queue.job_limit() == 0:
+        wait = download_queue.schedule.seconds_until_change()
+        print(
+            f"현재 시간대에는 새 작업을 시작하지 않습니다. 약 {max(1, round(wait / 60))}분 뒤 다음 시간대에 시작합니다.",
+            file=status_stream, flush=True,
+        )
+    download_queue.join()
+    download_queue.shutdown()
+    if worker_pool is not None:
+        worker_pool.shutdown()
+    StagingMover.join_shared()
+    jobs = list(jobs.values())
+    failed = sum(1 for job in jobs if not job.result)
+    print(f"작업 {len(jobs)}개 중 {len(jobs) - failed}개 성공, {failed}개 실패", file=status_stream, flush=True)
+    return 0 if not failed else 1
+
+
+def run_headless_url_file(path, args, events=None):
+    """URL 목록 파일(또는 '-'로 표준 입력)을 검증/중복 제거 후 동시에 다운로드합니다."""
+    try:
+        # 표준 입력은 빌려 쓰는 것이므로 with 블록이 끝나도 닫지 않음
+        source = nullcontext(sys.stdin) if path == "-" else open(Path(path).expanduser(), 'r', encoding='utf-8')
+    except OSError as exc:
+        print(f"URL 파일을 읽을 수 없습니다: {exc}", flush=True)
+        return 2
+
+    specs = []
+    with source as lines:
+        for result in iter_url_intake(lines):
+            if result.error:
+                print(f"{result.line_no}번째 줄 건너뜀: {result.error} ({result.raw})", file=sys.stderr, flush=True)
+                continue
+            try:
+                specs.append(spec_from_args(result.url, args))
+            except ValueError as exc:
+                # 모든 URL에 같은 옵션을 쓰므로 첫 오류에서 멈춤
+                print(f"작업 옵션이 올바르지 않습니다: {exc}", flush=True)
+                return 2
+    if not specs:
+        print("다운로드할 URL이 없습니다.", file=_status_stream(events), flush=True)
+        return 1
+    return run_headless_jobs(apply_batch_targets(specs, args), args.workers, events)
+
+
+def run_headless_history(text=None, report=False, limit=50):
+    """GUI 없이 다운로드 기록 검색 결과 또는 사이트별 전송 요약을 출력합니다."""
+    store = open_shared_store()
+    if store is None:
+        print("다운로드 기록을 열 수 없습니다.", flush=True)
+        return 1
+    if report:
+        for site, count, successes, total_bytes, speed in store.site_summary():
+            speed_note = f", 평균 {format_file_size(speed)}/s" if speed else ""
+            print(
+                f"{site or '알 수 없음'}: {successes}/{count}개 성공, {format_file_size(total_bytes)}{speed_note}",
+                flush=True,
+            )
+        return 0
+    for entry in store.search(text, limit=limit):
+        finished = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.finished_at))
+        result = "완료" if entry.success else "실패"
+        print(f"{finished}  {result}  {entry.title or entry.url}  {entry.output_path or entry.error or ''}", flush=True)
+    return 0
+
 
-    downloader = YouTubeDownloader(url, status_callback=print_status)
-    if download_path:
-        downloader.config.config["download_path"] = str(Path(download_path).expanduser())
-    return 0 if downloader.download_video() else 1
+def run_headless_verify(paths):
+    """GUI 없이 파일 해시와 컨테이너 점검 결과를 출력합니다 (바뀌지 않은 파일은 저장된 결과 사용)."""
+    config = Config.shared().snapshot()
+    ydl = youtube_dl.YoutubeDL({'quiet': True, 'ffmpeg_location': config.get("ffmpeg_path") or None})
+    pp = IntegrityCheckPP(ydl)
+    failed = 0
+    for path in paths:
+        try:
+            entry = verify_file(path, pp)
+        except OSError as exc:
+            print(f"오류  {path}: {exc}", flush=True)
+            failed += 1
+            continue
+        probe = entry.get('probe')
+        if probe is not None and not probe['ok']:
+            failed += 1
+            print(f"오류  {path}: {probe['error']} ({HASH_ALGORITHM}={entry[HASH_ALGORITHM]})", flush=True)
+        else:
+            note = "" if probe is not None else " (컨테이너 점검 안 함)"
+            print(f"정상  {path}: {HASH_ALGORITHM}={entry[HASH_ALGORITHM]}{note}", flush=True)
+    return 1 if failed else 0
 
 
 def run_headless_inspect(url, player_client=None):
     """GUI 없이 제공 해상도와 현재 선택 결과를 출력합니다."""
     try:
-        result = YouTubeDownloader(url).inspect_formats(player_client)
+        result = YouTubeDownloader(url).inspect_formats(
+            player_client,
+            include_choices=True,
+        )
     except (ValueError, youtube_dl.utils.DownloadError) as exc:
         print(f"포맷 확인 실패: {exc}", flush=True)
         return 1
@@ -616,6 +1789,110 @@ def run_headless_inspect(url, player_client=None):
         f"(format_id={result['selected_format_id'] or 'unknown'})",
         flush=True,
     )
+    for choice, selection in result['choices'].items():
+        if selection is None:
+            print(f"  {choice}: 선택 가능한 포맷 없음", flush=True)
+            continue
+        size = selection['estimated_bytes']
+        notes = [f"format_id={selection['format_id']}", selection['ext'] or '?']
+        if size:
+            notes.append(f"약 {format_file_size(size)}")
+        if selection['needs_merge']:
+            notes.append("병합 필요")
+        if selection['needs_remux']:
+            notes.append("컨테이너 변환 필요")
+        height = f"{selection['height']}p" if selection['height'] else "오디오"
+        print(f"  {choice}: {height} ({', '.join(notes)})", flush=True)
+    return 0
+
+
+def run_headless_inspect_file(path, args):
+    """URL 목록의 메타데이터를 동시에 확인해 영상마다 JSON 한 줄씩 출력합니다."""
+    def inspect(url):
+        return YouTubeDownloader(url).inspect_formats(args.player_client)
+
+    try:
+        # 표준 입력은 빌려 쓰는 것이므로 with 블록이 끝나도 닫지 않음
+        source = nullcontext(sys.stdin) if path == "-" else open(Path(path).expanduser(), 'r', encoding='utf-8')
+        output = (
+            open(Path(args.inspect_output).expanduser(), 'w', encoding='utf-8')
+            if args.inspect_output
+            else sys.stdout
+        )
+    except OSError as exc:
+        print(f"파일을 열 수 없습니다: {exc}", file=sys.stderr, flush=True)
+        return 2
+
+    with source as lines:
+        records = inspect_many(lines, inspect, args.workers, args.per_host_limit)
+        try:
+            count = write_jsonl(records, output)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    print(f"{count}개 URL 확인 완료", file=sys.stderr, flush=True)
+    return 0
+
+
+def run_daemon(host, port, workers):
+    """작업 제출 데몬 실행 (yt-dlp, 설정, FFmpeg 탐색 결과를 유지한 채 요청 처리)"""
+    event_bus = EventBus()
+    history_store = open_shared_store()
+    worker_pool = open_worker_pool(Config.shared(), workers)
+
+    def run_job(job):
+        def publish_status(message):
+            event_bus.publish({
+                'type': 'status',
+                'time': time.time(),
+                'job_id': job.job_id,
+                'message': message.strip("\n"),
+            })
+
+        def publish_event(event_type, **fields):
+            event_bus.publish({'type': event_type, 'time': time.time(), 'job_id': job.job_id, **fields})
+
+        config = job.spec.resolve_config()
+        if worker_pool is not None:
+            return run_job_in_process(worker_pool, job, config, publish_status, publish_event, history_store)
+        downloader = YouTubeDownloader(
+            job.url,
+            status_callback=publish_status,
+            config=config,
+            job=job,
+            event_callback=publish_event,
+            history_store=history_store,
+            breakers=CircuitBreakerRegistry.shared(),
+        )
+        return downloader.download_video()
+
+    # 첫 작업이 시작 비용을 치르지 않도록 미리 준비
+    YouTubeDownloader("", config=Config.shared().snapshot()).get_ffmpeg_path()
+    # 추출기 모듈을 모두 불러 둠 (첫 호출에서 import가 일어남)
+    youtube_dl.extractor.gen_extractor_classes()
+
+    download_queue = DownloadQueue(
+        run_job,
+        max_workers=workers,
+        key_func=JobSpec.coalesce_key,
+        breakers=CircuitBreakerRegistry.shared(),
+        breaker_func=JobSpec.breaker_key,
+        schedule=Config.shared().get_download_schedule(),
+        max_finished_jobs=FINISHED_JOB_RETENTION,
+    )
+    try:
+        daemon = DownloadDaemon(download_queue, event_bus, host, port)
+    except (OSError, ValueError) as exc:
+        print(f"데몬을 시작할 수 없습니다: {exc}", flush=True)
+        return 2
+    print(f"작업 제출 데몬 실행 중: {daemon.address}", flush=True)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    download_queue.shutdown(wait=False)
+    if worker_pool is not None:
+        worker_pool.shutdown()
     return 0
 
 
@@ -626,17 +1903,70 @@ def main():
     parser.add_argument("--inspect-url")
     parser.add_argument("--player-client")
     parser.add_argument("--download-path")
+    parser.add_argument("--inspect-file")
+    parser.add_argument("--inspect-output")
+    parser.add_argument("--verify", nargs="+")
+    parser.add_argument("--history", nargs="?", const="")
+    parser.add_argument("--history-report", action="store_true")
+    parser.add_argument("--per-host-limit", type=int, default=4)
+    parser.add_argument("--daemon", action="store_true")
+    parser.add_argument("--daemon-host", default=DEFAULT_HOST)
+    parser.add_argument("--daemon-port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--attach-daemon")
+    parser.add_argument("--json-events", action="store_true")
+    parser.add_argument("--json-events-fd", type=int)
+    add_job_arguments(parser)
+    add_batch_arguments(parser)
     args, _ = parser.parse_known_args()
+    events = None
+    if args.json_events_fd is not None:
+        try:
+            events = JsonEventWriter.from_fd(args.json_events_fd)
+        except OSError as exc:
+            print(f"이벤트 출력 파일 디스크립터를 열 수 없습니다: {exc}", file=sys.stderr, flush=True)
+            sys.exit(2)
+    elif args.json_events:
+        events = JsonEventWriter(sys.stdout)
+    if args.daemon:
+        sys.exit(run_daemon(args.daemon_host, args.daemon_port, args.workers))
+    if args.history is not None or args.history_report:
+        sys.exit(run_headless_history(args.history, args.history_report))
+    if args.verify:
+        sys.exit(run_headless_verify(args.verify))
     if args.inspect_url:
         sys.exit(run_headless_inspect(args.inspect_url, args.player_client))
+    if args.inspect_file:
+        sys.exit(run_headless_inspect_file(args.inspect_file, args))
+    if args.job_file:
+        try:
+            specs = load_job_file(args.job_file)
+        except (OSError, ValueError, TypeError) as exc:
+            print(f"작업 파일을 읽을 수 없습니다: {exc}", flush=True)
+            sys.exit(2)
+        sys.exit(run_headless_jobs(apply_batch_targets(specs, args), args.workers, events))
+    if args.url_file:
+        sys.exit(run_headless_url_file(args.url_file, args, events))
     if args.headless_url:
-        sys.exit(run_headless_download(args.headless_url, args.download_path))
+        try:
+            spec = spec_from_args(args.headless_url, args)
+        except ValueError as exc:
+            print(f"작업 옵션이 올바르지 않습니다: {exc}", flush=True)
+            sys.exit(2)
+        sys.exit(run_headless_download(args.headless_url, spec=spec, events=events))
 
     app = QApplication(sys.argv)
     app.setStyleSheet(STYLE)
-    win = YouTubeDownloaderWindow()
+    download_queue = None
+    if args.attach_daemon:
+        try:
+            download_queue = RemoteDownloadQueue(DaemonClient(args.attach_daemon))
+        except (OSError, RuntimeError) as exc:
+            print(f"데몬에 연결할 수 없어 자체 작업 큐를 사용합니다: {exc}", flush=True)
+    win = YouTubeDownloaderWindow(download_queue)
     win.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # 실행 파일로 묶인 경우 작업 프로세스가 main()을 다시 실행하지 않도록 함
+    multiprocessing.freeze_support()
     main()